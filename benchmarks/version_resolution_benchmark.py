@@ -0,0 +1,88 @@
+"""
+Measures update resolution of many artifacts that share version strings, as in a large multi-module project where
+the same versions appear in many catalogs and repositories. Each artifact has its own metadata objects, as fetched
+artifacts do, so resolver builds version index for each of them. Version factory without cache parses every version
+string of each artifact, cached factory parses each string once per run. Each run uses new resolver.
+
+Run from repository root: `PYTHONPATH=src python benchmarks/version_resolution_benchmark.py`.
+"""
+import timeit
+from functools import partial
+
+from yarl import URL
+
+from kataloger.data.artifact.library import Library
+from kataloger.data.artifact_metadata import ArtifactMetadata
+from kataloger.data.metadata_repository_info import MetadataRepositoryInfo
+from kataloger.data.repository import Repository
+from kataloger.update_resolver.universal.universal_update_resolver import UniversalUpdateResolver
+from kataloger.update_resolver.universal.universal_version_factory import UniversalVersionFactory
+
+ARTIFACT_COUNT: int = 500
+REPEATS: int = 3
+
+
+REPOSITORIES: list[Repository] = [
+    Repository(name=name, address=URL(f"https://{name}.repositor.y/")) for name in ("first", "second", "third")
+]
+
+
+def create_versions(stable_count: int, pre_release_count: int) -> list[str]:
+    versions = [f"{index // 100}.{index % 100}.0" for index in range(stable_count)]
+    versions += [f"{stable_count // 100}.{stable_count % 100}.0-alpha{index:02}" for index in range(pre_release_count)]
+    return versions
+
+
+def create_metadata(versions: list[str]) -> list[MetadataRepositoryInfo]:
+    return [
+        MetadataRepositoryInfo(
+            repository,
+            ArtifactMetadata(
+                latest_version=versions[-1],
+                release_version=versions[-1],
+                versions=list(versions),
+                last_updated=0,
+            ),
+        )
+        for repository in REPOSITORIES
+    ]
+
+
+def resolve_all(cache_size: int, artifacts: list[tuple[Library, list[MetadataRepositoryInfo]]]) -> None:
+    resolver = UniversalUpdateResolver(
+        version_factories=[UniversalVersionFactory(cache_size=cache_size)],
+        suggest_unstable_updates=False,
+    )
+    for library, repositories_metadata in artifacts:
+        resolver.resolve(library, repositories_metadata)
+
+
+def main() -> None:
+    for stable_count, pre_release_count in ((50, 0), (200, 20), (1000, 100)):
+        versions = create_versions(stable_count, pre_release_count)
+        artifacts = [
+            (
+                Library(
+                    name=f"library{index}",
+                    coordinates=f"com.library:library{index}",
+                    version=versions[index % stable_count],
+                ),
+                create_metadata(versions),
+            )
+            for index in range(ARTIFACT_COUNT)
+        ]
+        results: dict[str, float] = {}
+        for name, cache_size in (("uncached", 0), ("cached", 4096)):
+            results[name] = min(
+                timeit.repeat(partial(resolve_all, cache_size, artifacts), number=1, repeat=REPEATS),
+            )
+        print(
+            f"{stable_count:>5} stable, {pre_release_count:>3} pre-release versions: "
+            f"uncached {results['uncached'] * 1e3:8.1f} ms, "
+            f"cached {results['cached'] * 1e3:8.1f} ms, "
+            f"speedup x{results['uncached'] / results['cached']:.2f}",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Compares streaming metadata parser with previous parsing path (decoding of the whole response and building full
+`xmltodict` tree). Requires `xmltodict` to be installed: `pip install xmltodict`.
+
+Run from repository root: `PYTHONPATH=src python benchmarks/xml_parse_benchmark.py`.
+"""
+import timeit
+from functools import partial
+from typing import Optional
+
+import xmltodict
+
+from kataloger.data.artifact_metadata import ArtifactMetadata
+from kataloger.helpers.xml_parse_helpers import MavenMetadataParser
+
+CHUNK_SIZE: int = 16 * 1024
+REPEATS: int = 5
+
+
+def create_metadata(version_count: int) -> bytes:
+    versions = "".join(f"<version>{index // 100}.{index % 100}.0</version>" for index in range(version_count))
+    latest = f"{(version_count - 1) // 100}.{(version_count - 1) % 100}.0"
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<metadata>
+  <groupId>org.jetbrains.kotlin</groupId>
+  <artifactId>kotlin-stdlib</artifactId>
+  <versioning>
+    <latest>{latest}</latest>
+    <release>{latest}</release>
+    <versions>{versions}</versions>
+    <lastUpdated>20240101000000</lastUpdated>
+  </versioning>
+</metadata>
+""".encode()
+
+
+def parse_with_xmltodict(response: bytes) -> Optional[ArtifactMetadata]:
+    metadata = xmltodict.parse(response.decode().strip())
+    version_info = metadata["metadata"]["versioning"]
+    versions = version_info["versions"]["version"]
+    if not isinstance(versions, list):
+        versions = [versions]
+
+    return ArtifactMetadata(
+        latest_version=version_info.get("latest", versions[-1]),
+        release_version=version_info.get("release", versions[-1]),
+        versions=versions,
+        last_updated=int(version_info.get("lastUpdated", 0)),
+    )
+
+
+def parse_with_streaming_parser(response: bytes) -> Optional[ArtifactMetadata]:
+    parser = MavenMetadataParser()
+    for start in range(0, len(response), CHUNK_SIZE):
+        parser.feed(response[start:start + CHUNK_SIZE])
+    return parser.close()
+
+
+def main() -> None:
+    for version_count in (10, 100, 1000, 5000):
+        response = create_metadata(version_count)
+        assert parse_with_xmltodict(response) == parse_with_streaming_parser(response)
+
+        number = max(1, 20_000 // version_count)
+        xmltodict_time = min(
+            timeit.repeat(partial(parse_with_xmltodict, response), number=number, repeat=REPEATS),
+        )
+        streaming_time = min(
+            timeit.repeat(partial(parse_with_streaming_parser, response), number=number, repeat=REPEATS),
+        )
+        print(
+            f"{version_count:>5} versions: "
+            f"xmltodict {xmltodict_time / number * 1e6:9.1f} us, "
+            f"streaming {streaming_time / number * 1e6:9.1f} us, "
+            f"speedup x{xmltodict_time / streaming_time:.2f}",
+        )
+
+
+if __name__ == "__main__":
+    main()
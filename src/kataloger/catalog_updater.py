@@ -1,4 +1,6 @@
+from collections.abc import AsyncIterator
 from pathlib import Path
+from types import TracebackType
 from typing import Optional
 
 from kataloger.data.artifact.artifact import Artifact
@@ -8,9 +10,10 @@ from kataloger.data.artifact_update import ArtifactUpdate
 from kataloger.data.metadata_repository_info import MetadataRepositoryInfo
 from kataloger.data.repository import Repository
 from kataloger.exceptions.kataloger_configuration_exception import KatalogerConfigurationError
+from kataloger.fetcher.metadata_fetcher import MetadataFetcher
 from kataloger.helpers.log_helpers import log_warning
 from kataloger.helpers.toml_parse_helpers import load_catalog
-from kataloger.helpers.update_helpers import get_all_artifact_metadata
+from kataloger.helpers.update_helpers import iter_all_artifact_metadata
 from kataloger.update_resolver.base.update_resolution import UpdateResolution
 from kataloger.update_resolver.base.update_resolver import UpdateResolver
 
@@ -22,6 +25,7 @@ class CatalogUpdater:
         plugin_repositories: list[Repository],
         update_resolvers: list[UpdateResolver],
         *,
+        metadata_fetcher: Optional[MetadataFetcher] = None,
         verbose: bool = False,
     ):
         if not (library_repositories or plugin_repositories):
@@ -36,6 +40,35 @@ class CatalogUpdater:
         self.plugin_repositories = plugin_repositories
         self.update_resolvers = update_resolvers
         self.verbose = verbose
+        # Artifacts of the last search which was interrupted by deadline before it became known whether they have
+        # updates.
+        self.unchecked_artifacts: list[Artifact] = []
+        # The same unchecked artifacts of the last catalogs search, split by catalogs they're declared in.
+        self.unchecked_catalog_artifacts: dict[Path, list[Artifact]] = {}
+        # Updater closes only fetcher it created by itself, injected fetcher is managed by the caller.
+        self.__owns_metadata_fetcher = metadata_fetcher is None
+        self.metadata_fetcher = metadata_fetcher if metadata_fetcher is not None else MetadataFetcher()
+        # Updater that isn't used as context manager closes its own fetcher after each search, so connections
+        # aren't leaked by callers that never close the updater.
+        self.__is_open = False
+        self.__active_searches = 0
+
+    async def close(self) -> None:
+        self.__is_open = False
+        if self.__owns_metadata_fetcher:
+            await self.metadata_fetcher.close()
+
+    async def __aenter__(self) -> "CatalogUpdater":
+        self.__is_open = True
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.close()
 
     async def get_catalog_updates(self, catalog_path: Path) -> list[ArtifactUpdate]:
         libraries, plugins = load_catalog(catalog_path, verbose=self.verbose)
@@ -47,52 +80,176 @@ class CatalogUpdater:
         library_updates, plugin_updates = await self.get_updates(libraries, plugins)
         return library_updates + plugin_updates
 
+    async def get_catalogs_updates(self, catalog_paths: list[Path]) -> list[list[ArtifactUpdate]]:
+        """
+        Searches updates for all catalogs at once and returns them in order of catalogs. Artifact declared in several
+        catalogs or under several aliases is fetched only once for each repository. Libraries and plugins are searched
+        together, and each artifact is resolved as soon as all its repositories answered.
+        """
+        catalogs = self.__load_catalogs(catalog_paths)
+        updates: dict[Artifact, ArtifactUpdate] = {
+            artifact: update async for artifact, update in self.__iter_updates(catalogs)
+        }
+        self.unchecked_catalog_artifacts = self.__split_unchecked_artifacts(catalog_paths, catalogs)
+
+        return [
+            [updates[artifact] for artifact in [*libraries, *plugins] if artifact in updates]
+            for libraries, plugins in catalogs
+        ]
+
+    async def iter_catalog_updates(self, catalog_path: Path) -> AsyncIterator[ArtifactUpdate]:
+        """
+        Yields updates of catalog as soon as they're found, so the caller doesn't wait for the slowest artifact.
+        Updates are yielded in order they're found, not in order of declaration.
+        """
+        updates = self.iter_catalogs_updates([catalog_path])
+        try:
+            async for _, update in updates:
+                yield update
+        finally:
+            await updates.aclose()
+
+    async def iter_catalogs_updates(self, catalog_paths: list[Path]) -> AsyncIterator[tuple[Path, ArtifactUpdate]]:
+        """
+        Searches updates for all catalogs at once and yields each update along with path of catalog it belongs to as
+        soon as it's found. Update of artifact declared in several catalogs is yielded for each of them. Search is
+        driven by the caller: while yielded update isn't taken, only limited number of results is fetched ahead.
+        """
+        catalogs = self.__load_catalogs(catalog_paths)
+        artifact_catalogs: dict[Artifact, dict[Path, None]] = {}
+        for catalog_path, (libraries, plugins) in zip(catalog_paths, catalogs):
+            for artifact in [*libraries, *plugins]:
+                artifact_catalogs.setdefault(artifact, {})[catalog_path] = None
+
+        updates = self.__iter_updates(catalogs)
+        try:
+            async for artifact, update in updates:
+                for catalog_path in artifact_catalogs[artifact]:
+                    yield catalog_path, update
+            self.unchecked_catalog_artifacts = self.__split_unchecked_artifacts(catalog_paths, catalogs)
+        finally:
+            await updates.aclose()
+
     async def get_artifact_updates(self, artifacts: list[Artifact]) -> list[ArtifactUpdate]:
         libraries = [artifact for artifact in artifacts if isinstance(artifact, Library)]
         plugins = [artifact for artifact in artifacts if isinstance(artifact, Plugin)]
         library_updates, plugin_updates = await self.get_updates(libraries, plugins)
         return library_updates + plugin_updates
 
+    async def iter_artifact_updates(self, artifacts: list[Artifact]) -> AsyncIterator[ArtifactUpdate]:
+        libraries = [artifact for artifact in artifacts if isinstance(artifact, Library)]
+        plugins = [artifact for artifact in artifacts if isinstance(artifact, Plugin)]
+        updates = self.__iter_updates([(libraries, plugins)])
+        try:
+            async for _, update in updates:
+                yield update
+        finally:
+            await updates.aclose()
+
     async def get_updates(
         self,
         libraries: list[Library],
         plugins: list[Plugin],
     ) -> tuple[list[ArtifactUpdate], list[ArtifactUpdate]]:
-        library_updates = await self.get_library_updates(libraries)
-        plugin_updates = await self.get_plugin_updates(plugins)
-        return library_updates, plugin_updates
+        # Plugins are searched along with libraries, not after them.
+        updates = await self.__find_updates(libraries, plugins)
+        return (
+            [updates[library] for library in dict.fromkeys(libraries) if library in updates],
+            [updates[plugin] for plugin in dict.fromkeys(plugins) if plugin in updates],
+        )
 
     async def get_library_updates(self, libraries: list[Library]) -> list[ArtifactUpdate]:
-        library_updates: list[ArtifactUpdate] = []
-        if not self.library_repositories:
-            if self.verbose:
-                log_warning("No repositories for libraries provided.")
-            return library_updates
-
-        library_update_info = await get_all_artifact_metadata(
-            artifacts=libraries,
-            repositories=self.library_repositories,
-            verbose=self.verbose,
-        )
-        for artifact, repositories_metadata in library_update_info.items():
-            library_updates.append(self.try_find_update(artifact, repositories_metadata))
-        return list(filter(lambda item: item is not None, library_updates))
+        library_updates, _ = await self.get_updates(libraries, plugins=[])
+        return library_updates
 
     async def get_plugin_updates(self, plugins: list[Plugin]) -> list[ArtifactUpdate]:
-        plugin_updates: list[ArtifactUpdate] = []
-        if not self.plugin_repositories:
-            if self.verbose:
-                log_warning("No repositories for plugins provided.")
-            return plugin_updates
+        _, plugin_updates = await self.get_updates(libraries=[], plugins=plugins)
+        return plugin_updates
 
-        plugin_update_info = await get_all_artifact_metadata(
-            artifacts=plugins,
-            repositories=self.plugin_repositories,
-            verbose=self.verbose,
+    async def __find_updates(self, libraries: list[Library], plugins: list[Plugin]) -> dict[Artifact, ArtifactUpdate]:
+        updates = self.__iter_updates([(libraries, plugins)])
+        try:
+            return {artifact: update async for artifact, update in updates}
+        finally:
+            await updates.aclose()
+
+    def __load_catalogs(self, catalog_paths: list[Path]) -> list[tuple[list[Library], list[Plugin]]]:
+        catalogs: list[tuple[list[Library], list[Plugin]]] = []
+        for catalog_path in catalog_paths:
+            libraries, plugins = load_catalog(catalog_path, verbose=self.verbose)
+            if not (libraries or plugins) and self.verbose:
+                log_warning(f'Catalog "{catalog_path.name}" is empty.')
+            catalogs.append((libraries, plugins))
+        return catalogs
+
+    async def __iter_updates(
+        self,
+        catalogs: list[tuple[list[Library], list[Plugin]]],
+    ) -> AsyncIterator[tuple[Artifact, ArtifactUpdate]]:
+        # Unchecked artifacts are reported for the last search only.
+        self.unchecked_artifacts = []
+        self.unchecked_catalog_artifacts = {}
+        searches = self.__get_searches(
+            libraries=[library for libraries, _ in catalogs for library in libraries],
+            plugins=[plugin for _, plugins in catalogs for plugin in plugins],
         )
-        for artifact, repositories_metadata in plugin_update_info.items():
-            plugin_updates.append(self.try_find_update(artifact, repositories_metadata))
-        return list(filter(lambda item: item is not None, plugin_updates))
+        search = iter_all_artifact_metadata(searches, fetcher=self.metadata_fetcher, verbose=self.verbose)
+        self.__active_searches += 1
+        try:
+            async for artifact, repositories_metadata, is_complete in search:
+                update = self.try_find_update(artifact, repositories_metadata) if repositories_metadata else None
+                if not is_complete and update is None:
+                    # Repositories that didn't answer before deadline may have an update, so it's not known whether
+                    # artifact is up to date.
+                    self.unchecked_artifacts.append(artifact)
+                    continue
+                self.__remember_resolution(artifact, update)
+                if update is not None:
+                    yield artifact, update
+        finally:
+            # Closing iterator cancels searches that are still in progress when the caller stopped iteration.
+            await search.aclose()
+            self.__active_searches -= 1
+            if self.__owns_metadata_fetcher and not self.__is_open and self.__active_searches == 0:
+                await self.metadata_fetcher.close()
+
+    def __split_unchecked_artifacts(
+        self,
+        catalog_paths: list[Path],
+        catalogs: list[tuple[list[Library], list[Plugin]]],
+    ) -> dict[Path, list[Artifact]]:
+        unchecked_artifacts = set(self.unchecked_artifacts)
+        catalogs_unchecked_artifacts: dict[Path, list[Artifact]] = {}
+        for catalog_path, (libraries, plugins) in zip(catalog_paths, catalogs):
+            catalog_unchecked_artifacts = [
+                artifact for artifact in dict.fromkeys([*libraries, *plugins]) if artifact in unchecked_artifacts
+            ]
+            if catalog_unchecked_artifacts:
+                catalogs_unchecked_artifacts[catalog_path] = catalog_unchecked_artifacts
+        return catalogs_unchecked_artifacts
+
+    def __get_searches(
+        self,
+        libraries: list[Library],
+        plugins: list[Plugin],
+    ) -> list[tuple[list[Artifact], list[Repository]]]:
+        searches: list[tuple[list[Artifact], list[Repository]]] = []
+        if libraries and self.library_repositories:
+            searches.append((libraries, self.library_repositories))
+        elif libraries and self.verbose:
+            log_warning("No repositories for libraries provided.")
+
+        if plugins and self.plugin_repositories:
+            searches.append((plugins, self.plugin_repositories))
+        elif plugins and self.verbose:
+            log_warning("No repositories for plugins provided.")
+        return searches
+
+    def __remember_resolution(self, artifact: Artifact, update: Optional[ArtifactUpdate]) -> None:
+        metadata_cache = self.metadata_fetcher.metadata_cache
+        if metadata_cache is not None:
+            with self.metadata_fetcher.suppress_cache_errors():
+                metadata_cache.put_resolution(artifact, has_update=update is not None)
 
     def try_find_update(
         self,
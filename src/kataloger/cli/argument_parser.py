@@ -1,4 +1,4 @@
-from argparse import ArgumentParser
+from argparse import ArgumentParser, ArgumentTypeError
 from pathlib import Path
 from typing import Optional
 
@@ -57,6 +57,45 @@ def parse_arguments(*args: str) -> KatalogerArguments:
         dest="fail_on_updates",
         help="Exit with non-zero code when at least one update found.",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        dest="no_cache",
+        help="Ignore metadata cache: fetch all metadata from repositories and don't store it.",
+    )
+    parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        dest="clear_cache",
+        help="Remove all cached metadata before search.",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        dest="stream_updates",
+        help="Print each update as soon as it's found instead of printing all updates in catalogs order.",
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        dest="fail_fast",
+        help="Stop search and exit with non-zero code as soon as the first update found.",
+    )
+    parser.add_argument(
+        "--deadline",
+        type=_parse_positive_integer,
+        dest="deadline_seconds",
+        metavar="seconds",
+        help="Time budget for search. When it runs out, outstanding requests are cancelled and updates are resolved "
+             "with metadata loaded so far, artifacts that can't be checked are reported.",
+    )
+    parser.add_argument(
+        "--first-hit",
+        action="store_true",
+        dest="first_hit",
+        help="Search each artifact in repositories one by one in declaration order and stop at the first repository "
+             "where it's found, instead of searching all repositories.",
+    )
     parser.add_argument(
         "--version",
         action="version",
@@ -73,7 +112,15 @@ def parse_arguments(*args: str) -> KatalogerArguments:
             verbose=arguments.verbose,
             suggest_unstable_updates=arguments.suggest_unstable_updates,
             fail_on_updates=arguments.fail_on_updates,
+            network_configuration=None,
+            cache_configuration=None,
         ),
+        no_cache=arguments.no_cache,
+        clear_cache=arguments.clear_cache,
+        stream_updates=arguments.stream_updates,
+        fail_fast=arguments.fail_fast,
+        deadline_seconds=arguments.deadline_seconds,
+        first_hit=arguments.first_hit,
     )
 
 
@@ -84,6 +131,18 @@ def _get_catalogs(path_strings: list[str]) -> Optional[list[Catalog]]:
     return None
 
 
+def _parse_positive_integer(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number <= 0:
+        message = f'Expected positive integer, got "{value}".'
+        raise ArgumentTypeError(message)
+
+    return number
+
+
 def _get_configuration_path(path_string: Optional[str]) -> Optional[Path]:
     if path_string:
         return str_to_path(path_string=path_string, root_path=Path.cwd())
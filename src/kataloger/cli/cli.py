@@ -1,6 +1,19 @@
+import sqlite3
+from typing import Optional
+
 from kataloger.catalog_updater import CatalogUpdater
 from kataloger.cli.configuration_provider import get_configuration
-from kataloger.cli.update_print_helper import print_catalog_updates
+from kataloger.cli.update_print_helper import (
+    print_artifact_update,
+    print_catalog_updates,
+    print_fetch_statistics,
+    print_unchecked_artifacts,
+)
+from kataloger.data.kataloger_configuration import KatalogerConfiguration
+from kataloger.fetcher.metadata_cache import MetadataCache
+from kataloger.fetcher.metadata_fetcher import MetadataFetcher
+from kataloger.helpers.log_helpers import log_warning
+from kataloger.helpers.path_helpers import get_cache_dir
 from kataloger.update_resolver.universal.universal_update_resolver import UniversalUpdateResolver
 from kataloger.update_resolver.universal.universal_version_factory import UniversalVersionFactory
 
@@ -13,26 +26,128 @@ async def run() -> int:
         suggest_unstable_updates=configuration.suggest_unstable_updates,
     )
 
+    metadata_fetcher = MetadataFetcher(
+        network_configuration=configuration.network_configuration,
+        metadata_cache=create_metadata_cache(configuration),
+    )
     catalog_updater = CatalogUpdater(
         library_repositories=configuration.library_repositories,
         plugin_repositories=configuration.plugin_repositories,
         update_resolvers=[update_resolver],
+        metadata_fetcher=metadata_fetcher,
         verbose=configuration.verbose,
     )
 
-    has_updates = False
-    for catalog in configuration.catalogs:
-        updates = await catalog_updater.get_catalog_updates(catalog.path)
-        if not has_updates and updates:
-            has_updates = True
+    async with metadata_fetcher:
+        if configuration.fail_fast:
+            has_updates = await print_first_update(catalog_updater, configuration)
+        elif configuration.stream_updates:
+            has_updates = await print_updates_as_found(catalog_updater, configuration)
+        else:
+            has_updates = await print_updates_in_catalogs_order(catalog_updater, configuration)
+
+    for repository in metadata_fetcher.circuit_breaker.open_repositories():
+        log_warning(f'Repository "{repository.name}" was skipped after repeated failures, its updates may be missed.')
+
+    if configuration.verbose:
+        print_fetch_statistics(metadata_fetcher.statistics)
+
+    # Artifacts that weren't checked may have updates as well.
+    if configuration.fail_on_updates and (has_updates or catalog_updater.unchecked_artifacts):
+        return 1
+    return 0
+
+
+async def print_updates_in_catalogs_order(
+    catalog_updater: CatalogUpdater,
+    configuration: KatalogerConfiguration,
+) -> bool:
+    # All catalogs are searched at once, so modules declared in several catalogs are fetched only once.
+    catalogs_updates = await catalog_updater.get_catalogs_updates(
+        [catalog.path for catalog in configuration.catalogs],
+    )
 
+    for catalog, updates in zip(configuration.catalogs, catalogs_updates):
         print_catalog_updates(
             updates=updates,
             catalog_name=catalog.name,
             catalog_count=len(configuration.catalogs),
+            unchecked_artifacts=catalog_updater.unchecked_catalog_artifacts.get(catalog.path),
             verbose=configuration.verbose,
         )
 
-    if configuration.fail_on_updates and has_updates:
-        return 1
-    return 0
+    return any(catalogs_updates)
+
+
+async def print_updates_as_found(
+    catalog_updater: CatalogUpdater,
+    configuration: KatalogerConfiguration,
+) -> bool:
+    catalog_names = {catalog.path: catalog.name for catalog in configuration.catalogs}
+    has_updates = False
+    async for catalog_path, update in catalog_updater.iter_catalogs_updates(list(catalog_names)):
+        has_updates = True
+        # Updates of different catalogs are mixed, so each update is marked with its catalog.
+        print_artifact_update(
+            update,
+            catalog_name=catalog_names[catalog_path] if len(catalog_names) > 1 else None,
+            verbose=configuration.verbose,
+        )
+
+    print_unchecked_catalog_artifacts(catalog_updater, configuration)
+    return has_updates
+
+
+async def print_first_update(
+    catalog_updater: CatalogUpdater,
+    configuration: KatalogerConfiguration,
+) -> bool:
+    catalog_names = {catalog.path: catalog.name for catalog in configuration.catalogs}
+    updates = catalog_updater.iter_catalogs_updates(list(catalog_names))
+    try:
+        async for catalog_path, update in updates:
+            print_artifact_update(
+                update,
+                catalog_name=catalog_names[catalog_path] if len(catalog_names) > 1 else None,
+                verbose=configuration.verbose,
+            )
+            if configuration.verbose:
+                print("Search stopped on the first found update.")
+            return True
+    finally:
+        # Closing search cancels all requests that are still in flight.
+        await updates.aclose()
+
+    print_unchecked_catalog_artifacts(catalog_updater, configuration)
+    return False
+
+
+def print_unchecked_catalog_artifacts(catalog_updater: CatalogUpdater, configuration: KatalogerConfiguration) -> None:
+    for catalog in configuration.catalogs:
+        unchecked_artifacts = catalog_updater.unchecked_catalog_artifacts.get(catalog.path)
+        if unchecked_artifacts:
+            print_unchecked_artifacts(
+                unchecked_artifacts,
+                catalog_name=catalog.name if len(configuration.catalogs) > 1 else None,
+            )
+
+
+def create_metadata_cache(configuration: KatalogerConfiguration) -> Optional[MetadataCache]:
+    cache_configuration = configuration.cache_configuration
+    if not (cache_configuration.enabled or configuration.clear_cache):
+        return None
+
+    try:
+        metadata_cache = MetadataCache(get_cache_dir() / "metadata.sqlite3", cache_configuration)
+        if configuration.clear_cache:
+            metadata_cache.clear()
+    except (OSError, sqlite3.Error) as error:
+        # Cache only speeds up the search, so it's not a reason to fail.
+        log_warning(f"Metadata cache is unavailable: {error}")
+        return None
+
+    if not cache_configuration.enabled:
+        metadata_cache.close()
+        return None
+
+    return metadata_cache
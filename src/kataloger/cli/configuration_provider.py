@@ -1,13 +1,16 @@
 import sys
+from dataclasses import replace
 from itertools import chain
 from pathlib import Path
 from typing import Optional, TypeVar
 
 from kataloger.cli.argument_parser import parse_arguments
+from kataloger.data.cache_configuration import CacheConfiguration
 from kataloger.data.catalog import Catalog
 from kataloger.data.configuration_data import ConfigurationData
 from kataloger.data.kataloger_arguments import KatalogerArguments
 from kataloger.data.kataloger_configuration import KatalogerConfiguration
+from kataloger.data.network_configuration import NetworkConfiguration
 from kataloger.data.repository import Repository
 from kataloger.exceptions.kataloger_configuration_exception import KatalogerConfigurationError
 from kataloger.helpers.path_helpers import file_exists, get_package_file
@@ -43,6 +46,22 @@ def get_configuration() -> KatalogerConfiguration:
         conf_library_repositories=conf_cd.library_repositories,
         conf_plugin_repositories=conf_cd.plugin_repositories,
     )
+    cache_configuration: CacheConfiguration = merge(
+        args_cd.cache_configuration,
+        conf_cd.cache_configuration,
+        default=CacheConfiguration(),
+    )
+    if arguments.no_cache:
+        cache_configuration = replace(cache_configuration, enabled=False)
+    network_configuration: NetworkConfiguration = merge(
+        args_cd.network_configuration,
+        conf_cd.network_configuration,
+        default=NetworkConfiguration(),
+    )
+    if arguments.deadline_seconds is not None:
+        network_configuration = replace(network_configuration, deadline_seconds=arguments.deadline_seconds)
+    if arguments.first_hit:
+        network_configuration = replace(network_configuration, first_hit=True)
 
     return KatalogerConfiguration(
         catalogs=catalogs,
@@ -54,7 +73,13 @@ def get_configuration() -> KatalogerConfiguration:
             conf_cd.suggest_unstable_updates,
             default=False,
         ),
-        fail_on_updates=merge(args_cd.fail_on_updates, conf_cd.fail_on_updates, default=False),
+        # Fail-fast mode makes sense only for failing on updates, so it implies it.
+        fail_on_updates=arguments.fail_fast or merge(args_cd.fail_on_updates, conf_cd.fail_on_updates, default=False),
+        network_configuration=network_configuration,
+        cache_configuration=cache_configuration,
+        clear_cache=arguments.clear_cache,
+        stream_updates=arguments.stream_updates,
+        fail_fast=arguments.fail_fast,
     )
 
 
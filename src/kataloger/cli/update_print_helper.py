@@ -1,4 +1,8 @@
+from typing import Optional
+
+from kataloger.data.artifact.artifact import Artifact
 from kataloger.data.artifact_update import ArtifactUpdate
+from kataloger.fetcher.fetch_statistics import FetchStatistics
 
 
 def print_catalog_updates(
@@ -6,20 +10,69 @@ def print_catalog_updates(
     catalog_name: str,
     catalog_count: int,
     *,
+    unchecked_artifacts: Optional[list[Artifact]] = None,
     verbose: bool,
 ) -> None:
     if catalog_count > 1:
         if updates:
             print(f'Updates for "{catalog_name}" catalog:')
-        else:
+        elif not unchecked_artifacts:
             print(f'Catalog "{catalog_name}" is up to date!')
 
     for update in updates:
-        version_part = f"{update.current_version} -> {update.available_version}"
-        if verbose:
-            print(f"[{update.update_repository_name}] {update.name} {version_part}")
-        else:
-            print(f"{update.name} {version_part}")
+        print_artifact_update(update, verbose=verbose)
+
+    if unchecked_artifacts:
+        print_unchecked_artifacts(unchecked_artifacts, catalog_name=catalog_name if catalog_count > 1 else None)
 
     if catalog_count > 1:
         print()
+
+
+def print_artifact_update(
+    update: ArtifactUpdate,
+    catalog_name: Optional[str] = None,
+    *,
+    verbose: bool,
+) -> None:
+    update_line = f"{update.name} {update.current_version} -> {update.available_version}"
+    # Smaller updates are shown only when they differ from the bigger ones.
+    smaller_updates: list[str] = []
+    if update.minor_version not in (None, update.available_version, update.patch_version):
+        smaller_updates.append(f"minor: {update.minor_version}")
+    if update.patch_version not in (None, update.available_version):
+        smaller_updates.append(f"patch: {update.patch_version}")
+    if smaller_updates:
+        update_line = f"{update_line} ({', '.join(smaller_updates)})"
+    if verbose:
+        update_line = f"[{update.update_repository_name}] {update_line}"
+    if catalog_name is not None:
+        update_line = f"{catalog_name}: {update_line}"
+    print(update_line, flush=True)
+
+
+def print_unchecked_artifacts(artifacts: list[Artifact], catalog_name: Optional[str] = None) -> None:
+    names = ", ".join(artifact.name for artifact in dict.fromkeys(artifacts))
+    if catalog_name is None:
+        print(f"Search deadline reached, not checked: {names}.")
+    else:
+        print(f'Search deadline reached, not checked in "{catalog_name}" catalog: {names}.')
+
+
+def print_fetch_statistics(statistics: FetchStatistics) -> None:
+    if statistics.unique_artifacts:
+        deduplication_ratio = statistics.artifacts / statistics.unique_artifacts
+        print(
+            f"Artifacts searched: {statistics.artifacts}, unique: {statistics.unique_artifacts} "
+            f"(deduplication ratio {deduplication_ratio:.2f}).",
+        )
+    print(
+        f"Metadata requests sent: {statistics.requests}, "
+        f"coalesced: {statistics.coalesced_requests}, "
+        f"saved by negative cache: {statistics.negative_cache_hits}, "
+        f"saved by repository affinity: {statistics.affinity_hits}, "
+        f"sent to repositories without artifact: {statistics.affinity_misses}, "
+        f"retried: {statistics.retries}, "
+        f"hedged to mirrors: {statistics.hedged_requests}, "
+        f"skipped for failing repositories: {statistics.skipped_requests}.",
+    )
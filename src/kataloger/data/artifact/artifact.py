@@ -15,3 +15,7 @@ class Artifact(ABC):
     @abstractmethod
     def to_path(self) -> str:
         pass
+
+    def group(self) -> str:
+        # Group is the first part of "group:artifact" coordinates, coordinates without artifact part are group itself.
+        return self.coordinates.split(":", maxsplit=1)[0]
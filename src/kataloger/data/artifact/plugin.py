@@ -7,3 +7,7 @@ class Plugin(Artifact):
 
     def to_path(self) -> str:
         return f"{self.coordinates.replace('.', '/')}/{self.coordinates}.gradle.plugin"
+
+    def group(self) -> str:
+        # Plugin marker artifact is published with plugin id as a group.
+        return self.coordinates
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 
 @dataclass
@@ -7,6 +8,9 @@ class ArtifactUpdate:
     update_repository_name: str
     current_version: str
     available_version: str
+    # The newest update that keeps major version, and that keeps major and minor versions, if there are such updates.
+    minor_version: Optional[str] = None
+    patch_version: Optional[str] = None
 
     def __repr__(self):
         return f"{self.name} {self.current_version} -> {self.available_version}"
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CacheConfiguration:
+    enabled: bool = True
+    ttl_seconds: int = 3600
+    max_size_mb: int = 32
+    negative_ttl_seconds: int = 900
+    affinity_reprobe_seconds: int = 604800
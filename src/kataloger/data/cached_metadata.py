@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from kataloger.data.artifact_metadata import ArtifactMetadata
+
+
+@dataclass(frozen=True)
+class CachedMetadata:
+    metadata: ArtifactMetadata
+    fetched_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def is_fresh(self, ttl_seconds: float, now: float) -> bool:
+        return now - self.fetched_at < ttl_seconds
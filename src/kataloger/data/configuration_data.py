@@ -1,7 +1,9 @@
 from dataclasses import dataclass
 from typing import Optional
 
+from kataloger.data.cache_configuration import CacheConfiguration
 from kataloger.data.catalog import Catalog
+from kataloger.data.network_configuration import NetworkConfiguration
 from kataloger.data.repository import Repository
 
 
@@ -13,3 +15,5 @@ class ConfigurationData:
     verbose: Optional[bool]
     suggest_unstable_updates: Optional[bool]
     fail_on_updates: Optional[bool]
+    network_configuration: Optional[NetworkConfiguration]
+    cache_configuration: Optional[CacheConfiguration]
@@ -0,0 +1,37 @@
+import re
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class ContentFilter:
+    """
+    Restricts groups of artifacts that are searched in a repository.
+
+    Each pattern matches the group itself and all its subgroups, so `androidx` matches `androidx` and
+    `androidx.core`, but not `androidxtra`. Group is accepted when it matches any of included patterns (or there is
+    no included patterns at all) and doesn't match any of excluded patterns.
+    """
+
+    include_groups: tuple[str, ...] = ()
+    exclude_groups: tuple[str, ...] = ()
+    __include_regex: Optional[re.Pattern] = field(init=False, repr=False, compare=False)
+    __exclude_regex: Optional[re.Pattern] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Patterns are compiled once into single regex, so matching cost doesn't grow with the number of patterns.
+        object.__setattr__(self, "_ContentFilter__include_regex", self.__compile(self.include_groups))
+        object.__setattr__(self, "_ContentFilter__exclude_regex", self.__compile(self.exclude_groups))
+
+    def matches(self, group: str) -> bool:
+        if self.__include_regex is not None and not self.__include_regex.match(group):
+            return False
+        return self.__exclude_regex is None or not self.__exclude_regex.match(group)
+
+    @staticmethod
+    def __compile(groups: tuple[str, ...]) -> Optional[re.Pattern]:
+        if not groups:
+            return None
+
+        alternatives = "|".join(re.escape(group) for group in groups)
+        return re.compile(rf"(?:{alternatives})(?:\.|$)")
@@ -9,3 +9,9 @@ from kataloger.data.configuration_data import ConfigurationData
 class KatalogerArguments:
     configuration_path: Optional[Path]
     configuration_data: ConfigurationData
+    no_cache: bool
+    clear_cache: bool
+    stream_updates: bool
+    fail_fast: bool
+    deadline_seconds: Optional[int]
+    first_hit: bool
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 
+from kataloger.data.cache_configuration import CacheConfiguration
 from kataloger.data.catalog import Catalog
+from kataloger.data.network_configuration import NetworkConfiguration
 from kataloger.data.repository import Repository
 
 
@@ -12,3 +14,8 @@ class KatalogerConfiguration:
     verbose: bool
     suggest_unstable_updates: bool
     fail_on_updates: bool
+    network_configuration: NetworkConfiguration
+    cache_configuration: CacheConfiguration
+    clear_cache: bool
+    stream_updates: bool
+    fail_fast: bool
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class NetworkConfiguration:
+    max_requests: int = 64
+    max_repository_requests: int = 16
+    deadline_seconds: Optional[int] = None
+    max_repository_failures: int = 5
+    connect_timeout_seconds: int = 10
+    read_timeout_seconds: int = 30
+    max_retries: int = 2
+    hedge_percentile: int = 90
+    first_hit: bool = False
@@ -3,6 +3,9 @@ from typing import Optional
 
 from yarl import URL
 
+from kataloger.data.artifact.artifact import Artifact
+from kataloger.data.content_filter import ContentFilter
+
 
 @dataclass(frozen=True)
 class Repository:
@@ -10,9 +13,18 @@ class Repository:
     address: URL
     user: Optional[str] = None
     password: Optional[str] = None
+    content_filter: Optional[ContentFilter] = None
+    # Addresses of repositories with the same content, which can answer instead of the main address.
+    mirrors: tuple[URL, ...] = ()
 
     def __repr__(self):
         return self.name
 
     def requires_authorization(self) -> bool:
         return self.user is not None and self.password is not None
+
+    def addresses(self) -> tuple[URL, ...]:
+        return self.address, *self.mirrors
+
+    def may_contain(self, artifact: Artifact) -> bool:
+        return self.content_filter is None or self.content_filter.matches(artifact.group())
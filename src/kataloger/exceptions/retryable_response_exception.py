@@ -0,0 +1,10 @@
+from typing import Optional
+
+from kataloger.exceptions.kataloger_exception import KatalogerError
+
+
+class RetryableResponseError(KatalogerError):
+    def __init__(self, status: int, retry_after: Optional[float] = None):
+        super().__init__(message=f"Repository responded with {status} status.")
+        self.status = status
+        self.retry_after = retry_after
@@ -0,0 +1,97 @@
+import asyncio
+import math
+from typing import Optional
+
+
+class AdaptiveLimiter:
+    """
+    Concurrency limiter which limit is tuned in AIMD (additive increase, multiplicative decrease) manner.
+
+    Each successful request grows the limit by roughly one per full window of requests, while overload signal
+    (throttling response, failed request or noticeable latency growth) cuts the limit by `decrease_factor`.
+    Requests started before the last decrease can't decrease the limit again, so a burst of throttled responses
+    is counted as a single overload signal.
+
+    Latency growth is detected by comparing average latency of recent requests with slowly decaying average latency
+    of all requests. Repository usually answers both with cheap responses (404, 304) and with full metadata
+    downloads, so latency is compared with typical latency of the mix, not with the fastest response ever seen, and
+    only after enough requests were finished since the last decrease.
+    """
+
+    # Weight of each new latency in recent and baseline averages, average of all samples is used until they are
+    # fewer than 1 / weight.
+    RECENT_LATENCY_WEIGHT: float = 0.1
+    BASELINE_LATENCY_WEIGHT: float = 0.01
+    MIN_LATENCY_SAMPLES: int = 10
+
+    def __init__(
+        self,
+        max_limit: int,
+        *,
+        min_limit: int = 1,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 3.0,
+    ):
+        if not 1 <= min_limit <= max_limit:
+            message = f"Incorrect limiter bounds: [{min_limit}, {max_limit}]."
+            raise ValueError(message)
+
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.limit: float = float(max_limit)
+        self.in_flight: int = 0
+        self.__decrease_factor = decrease_factor
+        self.__latency_tolerance = latency_tolerance
+        self.__baseline_latency: float = 0.0
+        self.__baseline_samples: int = 0
+        self.__recent_latency: float = 0.0
+        self.__recent_samples: int = 0
+        self.__last_decrease_time: float = -math.inf
+        self.__condition: Optional[asyncio.Condition] = None
+
+    async def acquire(self) -> None:
+        condition = self.__get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+
+    async def release(self) -> None:
+        condition = self.__get_condition()
+        async with condition:
+            self.in_flight -= 1
+            condition.notify_all()
+
+    def on_success(self, started_at: float, latency: float) -> None:
+        self.__baseline_samples += 1
+        self.__baseline_latency += (latency - self.__baseline_latency) * max(
+            self.BASELINE_LATENCY_WEIGHT,
+            1 / self.__baseline_samples,
+        )
+        self.__recent_samples += 1
+        self.__recent_latency += (latency - self.__recent_latency) * max(
+            self.RECENT_LATENCY_WEIGHT,
+            1 / self.__recent_samples,
+        )
+
+        is_latency_known = self.__recent_samples >= self.MIN_LATENCY_SAMPLES
+        if is_latency_known and self.__recent_latency > self.__baseline_latency * self.__latency_tolerance:
+            self.on_overload(started_at)
+            return
+
+        self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+
+    def on_overload(self, started_at: float) -> None:
+        if started_at <= self.__last_decrease_time:
+            return
+
+        self.limit = max(float(self.min_limit), self.limit * self.__decrease_factor)
+        self.__last_decrease_time = asyncio.get_running_loop().time()
+        # Recent latencies collected under previous limit are no longer representative.
+        self.__recent_latency = 0.0
+        self.__recent_samples = 0
+
+    def __get_condition(self) -> asyncio.Condition:
+        # Condition is created lazily to be bound to the running event loop.
+        if self.__condition is None:
+            self.__condition = asyncio.Condition()
+        return self.__condition
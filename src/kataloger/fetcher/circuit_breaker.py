@@ -0,0 +1,32 @@
+from kataloger.data.repository import Repository
+
+
+class CircuitBreaker:
+    """
+    Tracks consecutive failures of each repository.
+
+    Once repository fails `max_failures` times in a row, its circuit opens and stays open for the rest of the run, so
+    remaining requests to unreachable repository are skipped immediately instead of waiting for timeout one by one.
+    Any successful response resets failure counter of repository while its circuit is closed.
+    """
+
+    def __init__(self, max_failures: int):
+        if max_failures < 1:
+            message = f"Incorrect number of failures to open circuit: {max_failures}."
+            raise ValueError(message)
+
+        self.max_failures = max_failures
+        self.__failures: dict[Repository, int] = {}
+
+    def is_open(self, repository: Repository) -> bool:
+        return self.__failures.get(repository, 0) >= self.max_failures
+
+    def on_success(self, repository: Repository) -> None:
+        if not self.is_open(repository):
+            self.__failures.pop(repository, None)
+
+    def on_failure(self, repository: Repository) -> None:
+        self.__failures[repository] = self.__failures.get(repository, 0) + 1
+
+    def open_repositories(self) -> list[Repository]:
+        return [repository for repository in self.__failures if self.is_open(repository)]
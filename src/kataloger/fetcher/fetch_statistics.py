@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class FetchStatistics:
+    """
+    Counters of metadata requests collected by the fetcher during the run.
+    """
+
+    # Artifacts passed for search and unique modules among them, that were actually fetched.
+    artifacts: int = 0
+    unique_artifacts: int = 0
+    requests: int = 0
+    # Requests that joined identical request already in flight.
+    coalesced_requests: int = 0
+    negative_cache_hits: int = 0
+    # Requests skipped because artifact group is known to be hosted by other repositories.
+    affinity_hits: int = 0
+    # Requests sent to repositories that don't host requested artifact.
+    affinity_misses: int = 0
+    # Repeated attempts of requests that failed with connection error or retryable status.
+    retries: int = 0
+    # Requests skipped because repository failed too many times in a row.
+    skipped_requests: int = 0
+    # Requests sent to repository mirror while request to faster mirror was still in flight.
+    hedged_requests: int = 0
@@ -0,0 +1,52 @@
+from collections import deque
+from statistics import median
+
+from yarl import URL
+
+DEFAULT_HEDGE_DELAY_SECONDS: float = 1.0
+MIN_LATENCY_SAMPLES: int = 5
+MAX_LATENCY_SAMPLES: int = 100
+
+
+class LatencyTracker:
+    """
+    Keeps recent response latencies of each repository address.
+
+    Latencies are used to order mirrors of repository from the fastest to the slowest one and to decide how long to
+    wait for the mirror before sending hedged request to the next one. Addresses without latency samples yet keep
+    their declaration order after known addresses.
+    """
+
+    def __init__(self, percentile: int):
+        if not 0 < percentile < 100:
+            message = f"Incorrect latency percentile: {percentile}."
+            raise ValueError(message)
+
+        self.percentile = percentile
+        self.__latencies: dict[URL, deque[float]] = {}
+
+    def record(self, address: URL, latency: float) -> None:
+        latencies = self.__latencies.get(address)
+        if latencies is None:
+            latencies = deque(maxlen=MAX_LATENCY_SAMPLES)
+            self.__latencies[address] = latencies
+        latencies.append(latency)
+
+    def order(self, addresses: tuple[URL, ...]) -> list[URL]:
+        def typical_latency(address: URL) -> float:
+            latencies = self.__latencies.get(address)
+            return median(latencies) if latencies else float("inf")
+
+        return sorted(addresses, key=typical_latency)
+
+    def hedge_delay(self, address: URL) -> float:
+        """
+        Time after which the address most likely won't answer soon, so request should be hedged to another mirror.
+        """
+        latencies = self.__latencies.get(address)
+        if latencies is None or len(latencies) < MIN_LATENCY_SAMPLES:
+            return DEFAULT_HEDGE_DELAY_SECONDS
+
+        ordered_latencies = sorted(latencies)
+        index = min(len(ordered_latencies) * self.percentile // 100, len(ordered_latencies) - 1)
+        return ordered_latencies[index]
@@ -0,0 +1,292 @@
+import json
+import sqlite3
+import time
+from collections.abc import Iterable
+from dataclasses import asdict
+from pathlib import Path
+from types import TracebackType
+from typing import Optional
+
+from kataloger.data.artifact.artifact import Artifact
+from kataloger.data.artifact_metadata import ArtifactMetadata
+from kataloger.data.cache_configuration import CacheConfiguration
+from kataloger.data.cached_metadata import CachedMetadata
+from kataloger.data.repository import Repository
+
+
+class MetadataCache:
+    """
+    Persistent SQLite storage for parsed artifact metadata.
+
+    Entries are keyed by repository address and artifact path. Each entry keeps the time it was fetched at, so
+    fetcher can decide whether it's still fresh, and the time it was last accessed at, which is used to evict least
+    recently used entries when total cache size exceeds configured limit. Response validators (ETag and
+    Last-Modified) are stored along with metadata to revalidate stale entries.
+
+    Artifacts that are absent in a repository are remembered separately with their own, usually shorter, TTL, so
+    requests that are known to end with 404 can be skipped.
+
+    Cache also learns which repositories host each artifact group. Once a group is found in some repository, other
+    repositories of the same search where it wasn't found are skipped for all artifacts of the group until the next
+    periodic re-probe. Only knowledge from previous runs, loaded when cache is opened, is applied, so results of the
+    run don't depend on the order its requests finished in.
+
+    Artifacts that had updates in the last run are remembered as well, they're most likely still outdated, so they can
+    be searched first.
+
+    Each change is committed at once in a short transaction, so several kataloger instances can share the same cache
+    without holding it locked for the whole run. Access times of read entries are written in a single batch on close.
+    """
+
+    SCHEMA_VERSION: int = 5
+    # Transactions are short, so waiting for the lock longer means that something is wrong with the cache.
+    LOCK_TIMEOUT_SECONDS: float = 2
+
+    def __init__(self, path: Path, configuration: CacheConfiguration):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.configuration = configuration
+        # Several kataloger instances can share the same cache, so wait for the lock instead of failing immediately.
+        self.__connection = sqlite3.connect(path, timeout=self.LOCK_TIMEOUT_SECONDS)
+        # Readers aren't blocked by writer in write-ahead log mode.
+        self.__connection.execute("PRAGMA journal_mode = WAL")
+        self.__accessed_at: dict[tuple[str, str], float] = {}
+        self.__prepare_schema()
+        self.__affinity: dict[str, dict[str, tuple[bool, float]]] = self.__load_affinity()
+
+    def get(self, repository: Repository, artifact: Artifact) -> Optional[CachedMetadata]:
+        key = self.__key(repository, artifact)
+        row = self.__connection.execute(
+            "SELECT metadata, fetched_at, etag, last_modified FROM metadata WHERE repository = ? AND path = ?",
+            key,
+        ).fetchone()
+        if row is None:
+            return None
+
+        self.__accessed_at[key] = time.time()
+        metadata_json, fetched_at, etag, last_modified = row
+        return CachedMetadata(
+            metadata=ArtifactMetadata(**json.loads(metadata_json)),
+            fetched_at=fetched_at,
+            etag=etag,
+            last_modified=last_modified,
+        )
+
+    def put(
+        self,
+        repository: Repository,
+        artifact: Artifact,
+        metadata: ArtifactMetadata,
+        *,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        now = time.time()
+        metadata_json = json.dumps(asdict(metadata))
+        with self.__connection:
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO metadata "
+                "(repository, path, metadata, fetched_at, accessed_at, size, etag, last_modified) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (*self.__key(repository, artifact), metadata_json, now, now, len(metadata_json), etag, last_modified),
+            )
+            self.__connection.execute(
+                "DELETE FROM missing WHERE repository = ? AND path = ?",
+                self.__key(repository, artifact),
+            )
+
+    def is_missing(self, repository: Repository, artifact: Artifact) -> bool:
+        """
+        Checks whether artifact was recently found to be absent in the repository.
+        """
+        row = self.__connection.execute(
+            "SELECT checked_at FROM missing WHERE repository = ? AND path = ?",
+            self.__key(repository, artifact),
+        ).fetchone()
+        if row is None:
+            return False
+
+        (checked_at,) = row
+        return time.time() - checked_at < self.configuration.negative_ttl_seconds
+
+    def put_missing(self, repository: Repository, artifact: Artifact) -> None:
+        key = self.__key(repository, artifact)
+        with self.__connection:
+            self.__connection.execute("DELETE FROM metadata WHERE repository = ? AND path = ?", key)
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO missing (repository, path, checked_at) VALUES (?, ?, ?)",
+                (*key, time.time()),
+            )
+
+    def refresh(self, repository: Repository, artifact: Artifact) -> None:
+        """
+        Marks cached metadata as just fetched, used when repository confirms that metadata is not modified.
+        """
+        now = time.time()
+        with self.__connection:
+            self.__connection.execute(
+                "UPDATE metadata SET fetched_at = ?, accessed_at = ? WHERE repository = ? AND path = ?",
+                (now, now, *self.__key(repository, artifact)),
+            )
+
+    def is_group_hosted_elsewhere(
+        self,
+        repository: Repository,
+        artifact: Artifact,
+        repositories: Iterable[Repository],
+    ) -> bool:
+        """
+        Checks whether artifact group is known to be hosted only in other repositories of the same search, so there is
+        no need to search artifact in the given one until re-probe time comes.
+
+        :param repository: Repository which is about to be requested.
+        :param artifact: Artifact which is searched.
+        :param repositories: All repositories where the artifact is searched in this run.
+        """
+        probes = self.__affinity.get(artifact.group())
+        if not probes:
+            return False
+
+        address = str(repository.address)
+        own_probe = probes.get(address)
+        if own_probe is None:
+            return False
+
+        found, checked_at = own_probe
+        if found or time.time() - checked_at >= self.configuration.affinity_reprobe_seconds:
+            return False
+        other_addresses = {str(other.address) for other in repositories} - {address}
+        return any(probes.get(other_address, (False, 0))[0] for other_address in other_addresses)
+
+    def put_group_probe(self, repository: Repository, artifact: Artifact, *, found: bool) -> None:
+        """
+        Records whether artifact was found in the repository. Group stays hosted by repository once any of its
+        artifacts was found there. Records are applied starting from the next run.
+        """
+        with self.__connection:
+            self.__connection.execute(
+                "INSERT INTO affinity (repository, group_id, found, checked_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (repository, group_id) DO UPDATE SET "
+                "found = max(found, excluded.found), checked_at = excluded.checked_at",
+                (str(repository.address), artifact.group(), int(found), time.time()),
+            )
+
+    def had_update(self, artifact: Artifact) -> bool:
+        """
+        Checks whether update was found for artifact when it was resolved last time, in any repository.
+        """
+        row = self.__connection.execute("SELECT 1 FROM outdated WHERE path = ?", (artifact.to_path(),)).fetchone()
+        return row is not None
+
+    def put_resolution(self, artifact: Artifact, *, has_update: bool) -> None:
+        with self.__connection:
+            if has_update:
+                self.__connection.execute(
+                    "INSERT OR REPLACE INTO outdated (path, resolved_at) VALUES (?, ?)",
+                    (artifact.to_path(), time.time()),
+                )
+            else:
+                self.__connection.execute("DELETE FROM outdated WHERE path = ?", (artifact.to_path(),))
+
+    def is_fresh(self, cached_metadata: CachedMetadata) -> bool:
+        return cached_metadata.is_fresh(self.configuration.ttl_seconds, now=time.time())
+
+    def clear(self) -> None:
+        with self.__connection:
+            self.__connection.execute("DELETE FROM metadata")
+            self.__connection.execute("DELETE FROM missing")
+            self.__connection.execute("DELETE FROM affinity")
+            self.__connection.execute("DELETE FROM outdated")
+        self.__affinity.clear()
+
+    def close(self) -> None:
+        try:
+            with self.__connection:
+                self.__connection.executemany(
+                    "UPDATE metadata SET accessed_at = ? WHERE repository = ? AND path = ?",
+                    ((accessed_at, *key) for key, accessed_at in self.__accessed_at.items()),
+                )
+                self.__evict()
+        finally:
+            self.__accessed_at.clear()
+            self.__connection.close()
+
+    def __enter__(self) -> "MetadataCache":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def __evict(self) -> None:
+        max_size = self.configuration.max_size_mb * 1024 * 1024
+        total_size = 0
+        rows = self.__connection.execute("SELECT repository, path, size FROM metadata ORDER BY accessed_at DESC")
+        evicted_keys: list[tuple[str, str]] = []
+        for repository, path, size in rows:
+            total_size += size
+            if total_size > max_size:
+                evicted_keys.append((repository, path))
+        self.__connection.executemany("DELETE FROM metadata WHERE repository = ? AND path = ?", evicted_keys)
+        self.__connection.execute(
+            "DELETE FROM missing WHERE checked_at <= ?",
+            (time.time() - self.configuration.negative_ttl_seconds,),
+        )
+
+    def __load_affinity(self) -> dict[str, dict[str, tuple[bool, float]]]:
+        affinity: dict[str, dict[str, tuple[bool, float]]] = {}
+        rows = self.__connection.execute("SELECT repository, group_id, found, checked_at FROM affinity")
+        for address, group, found, checked_at in rows:
+            affinity.setdefault(group, {})[address] = (bool(found), checked_at)
+        return affinity
+
+    def __prepare_schema(self) -> None:
+        (version,) = self.__connection.execute("PRAGMA user_version").fetchone()
+        if version != self.SCHEMA_VERSION:
+            # Cache content can always be fetched again, so outdated schema is simply dropped.
+            self.__connection.execute("DROP TABLE IF EXISTS metadata")
+            self.__connection.execute("DROP TABLE IF EXISTS missing")
+            self.__connection.execute("DROP TABLE IF EXISTS affinity")
+            self.__connection.execute("DROP TABLE IF EXISTS outdated")
+        self.__connection.execute(
+            "CREATE TABLE IF NOT EXISTS metadata ("
+            "repository TEXT NOT NULL, "
+            "path TEXT NOT NULL, "
+            "metadata TEXT NOT NULL, "
+            "fetched_at REAL NOT NULL, "
+            "accessed_at REAL NOT NULL, "
+            "size INTEGER NOT NULL, "
+            "etag TEXT, "
+            "last_modified TEXT, "
+            "PRIMARY KEY (repository, path))",
+        )
+        self.__connection.execute(
+            "CREATE TABLE IF NOT EXISTS missing ("
+            "repository TEXT NOT NULL, "
+            "path TEXT NOT NULL, "
+            "checked_at REAL NOT NULL, "
+            "PRIMARY KEY (repository, path))",
+        )
+        self.__connection.execute(
+            "CREATE TABLE IF NOT EXISTS affinity ("
+            "repository TEXT NOT NULL, "
+            "group_id TEXT NOT NULL, "
+            "found INTEGER NOT NULL, "
+            "checked_at REAL NOT NULL, "
+            "PRIMARY KEY (repository, group_id))",
+        )
+        self.__connection.execute(
+            "CREATE TABLE IF NOT EXISTS outdated ("
+            "path TEXT NOT NULL PRIMARY KEY, "
+            "resolved_at REAL NOT NULL)",
+        )
+        self.__connection.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        self.__connection.commit()
+
+    @staticmethod
+    def __key(repository: Repository, artifact: Artifact) -> tuple[str, str]:
+        return str(repository.address), artifact.to_path()
@@ -0,0 +1,382 @@
+import asyncio
+import sqlite3
+from collections import deque
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager, suppress
+from types import TracebackType
+from typing import Optional
+
+from aiohttp import BasicAuth, ClientError, ClientSession, ClientTimeout, TCPConnector, hdrs
+from yarl import URL
+
+from kataloger.data.artifact.artifact import Artifact
+from kataloger.data.artifact_metadata import ArtifactMetadata
+from kataloger.data.cached_metadata import CachedMetadata
+from kataloger.data.metadata_repository_info import MetadataRepositoryInfo
+from kataloger.data.network_configuration import NetworkConfiguration
+from kataloger.data.repository import Repository
+from kataloger.exceptions.retryable_response_exception import RetryableResponseError
+from kataloger.fetcher.circuit_breaker import CircuitBreaker
+from kataloger.fetcher.fetch_statistics import FetchStatistics
+from kataloger.fetcher.latency_tracker import LatencyTracker
+from kataloger.fetcher.metadata_cache import MetadataCache
+from kataloger.fetcher.request_scheduler import RequestScheduler
+from kataloger.helpers.log_helpers import log_warning
+from kataloger.helpers.retry_helpers import get_retry_delay, parse_retry_after
+from kataloger.helpers.xml_parse_helpers import MavenMetadataParser
+
+DNS_CACHE_TTL_SECONDS: int = 300
+KEEPALIVE_TIMEOUT_SECONDS: float = 30
+# Statuses of responses that are likely to succeed when repeated a bit later.
+RETRYABLE_STATUSES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+
+class MetadataFetcher:
+    """
+    Run-scoped entry point for loading artifact metadata from repositories.
+
+    Fetcher keeps single HTTP session alive for the whole run, so connections, TLS sessions and resolved DNS entries
+    are reused between repositories, catalogs, libraries and plugins. Session can be provided from outside, in this
+    case fetcher doesn't close it. All requests pass through the scheduler, that limits the number of requests in
+    flight according to network configuration. When metadata cache is provided, fresh cached metadata is returned
+    without request, and fetched metadata is stored in the cache. Stale cached metadata is revalidated with
+    conditional request, so unchanged metadata is neither downloaded nor parsed again. Artifacts recently found to be
+    absent in a repository aren't requested from it again, as well as artifacts which group is known to be hosted only
+    by other repositories. Concurrent requests of the same metadata are coalesced into a single request, which is
+    cancelled when all its callers are cancelled. Failed requests are retried with exponential backoff, and don't
+    break the search when retries are exhausted: repository that fails too many times in a row is skipped for the
+    rest of the run. Requests to repositories with mirrors are hedged: when the fastest known address doesn't answer
+    in time usual for it, the same request is sent to the next mirror, and the first answer wins. Fetcher takes
+    ownership of provided cache.
+    """
+
+    def __init__(
+        self,
+        session: Optional[ClientSession] = None,
+        *,
+        network_configuration: Optional[NetworkConfiguration] = None,
+        metadata_cache: Optional[MetadataCache] = None,
+    ):
+        if network_configuration is None:
+            network_configuration = NetworkConfiguration()
+
+        self.__session: Optional[ClientSession] = session
+        self.__owns_session: bool = session is None
+        self.network_configuration = network_configuration
+        self.metadata_cache = metadata_cache
+        self.statistics = FetchStatistics()
+        self.__requests_in_flight: dict[tuple[URL, Optional[str]], asyncio.Future[Optional[ArtifactMetadata]]] = {}
+        self.__request_waiters: dict[tuple[URL, Optional[str]], int] = {}
+        self.__timeout = ClientTimeout(
+            total=None,
+            sock_connect=network_configuration.connect_timeout_seconds,
+            sock_read=network_configuration.read_timeout_seconds,
+        )
+        self.circuit_breaker = CircuitBreaker(max_failures=network_configuration.max_repository_failures)
+        self.latency_tracker = LatencyTracker(percentile=network_configuration.hedge_percentile)
+        self.scheduler = RequestScheduler(
+            max_requests=network_configuration.max_requests,
+            max_repository_requests=network_configuration.max_repository_requests,
+        )
+
+    async def get_artifact_metadata(
+        self,
+        repository: Repository,
+        artifact: Artifact,
+        *,
+        verbose: bool,
+        searched_repositories: Sequence[Repository] = (),
+    ) -> Optional[MetadataRepositoryInfo]:
+        """
+        Fetches artifact metadata from the repository, or takes it from the cache when it's still fresh.
+
+        :param repository: Repository to fetch metadata from.
+        :param artifact: Artifact which metadata is fetched.
+        :param verbose: Whether fetch problems should be reported.
+        :param searched_repositories: All repositories where the artifact is searched. Repository isn't requested when
+        artifact group is known to be hosted only by other repositories among them.
+        """
+        cached_metadata: Optional[CachedMetadata] = None
+        metadata_cache = self.metadata_cache
+        if metadata_cache is not None:
+            with self.suppress_cache_errors():
+                cached_metadata = metadata_cache.get(repository, artifact)
+                if cached_metadata is not None and metadata_cache.is_fresh(cached_metadata):
+                    return MetadataRepositoryInfo(repository, cached_metadata.metadata)
+                if cached_metadata is None and metadata_cache.is_missing(repository, artifact):
+                    self.statistics.negative_cache_hits += 1
+                    return None
+                if cached_metadata is None and metadata_cache.is_group_hosted_elsewhere(
+                    repository,
+                    artifact,
+                    searched_repositories,
+                ):
+                    self.statistics.affinity_hits += 1
+                    return None
+
+        if self.circuit_breaker.is_open(repository):
+            self.statistics.skipped_requests += 1
+            return None
+
+        metadata_url = repository.address / artifact.to_path() / "maven-metadata.xml"
+        # Concurrent callers asking for the same metadata share single request instead of opening own connections.
+        request_key = (metadata_url, repository.user)
+        request = self.__requests_in_flight.get(request_key)
+        if request is None:
+            request = asyncio.ensure_future(
+                self.__fetch_metadata(repository, artifact, cached_metadata, verbose=verbose),
+            )
+            self.__requests_in_flight[request_key] = request
+            request.add_done_callback(lambda done_request: self.__forget_request(request_key, done_request))
+        else:
+            self.statistics.coalesced_requests += 1
+
+        # Request is shielded, so cancellation of one caller doesn't cancel the request for the others. Request is
+        # cancelled only when all its callers are cancelled, so nobody waits for it anymore.
+        self.__request_waiters[request_key] = self.__request_waiters.get(request_key, 0) + 1
+        try:
+            metadata = await asyncio.shield(request)
+        except asyncio.CancelledError:
+            if self.__request_waiters[request_key] == 1:
+                # Cancelled request is forgotten at once, so callers that come before it's finished start a new one.
+                self.__forget_request(request_key, request)
+                request.cancel()
+            raise
+        finally:
+            self.__request_waiters[request_key] -= 1
+            if not self.__request_waiters[request_key]:
+                del self.__request_waiters[request_key]
+
+        if metadata is None:
+            return None
+        return MetadataRepositoryInfo(repository, metadata)
+
+    async def __fetch_metadata(
+        self,
+        repository: Repository,
+        artifact: Artifact,
+        cached_metadata: Optional[CachedMetadata],
+        *,
+        verbose: bool,
+    ) -> Optional[ArtifactMetadata]:
+        max_retries = self.network_configuration.max_retries
+        for attempt in range(max_retries + 1):
+            retry_after: Optional[float] = None
+            try:
+                return await self.__request_metadata_from_mirrors(
+                    repository,
+                    artifact,
+                    cached_metadata,
+                    verbose=verbose,
+                )
+            except RetryableResponseError as error:
+                failure: Exception = error
+                retry_after = error.retry_after
+            except (ClientError, asyncio.TimeoutError) as error:
+                failure = error
+
+            if attempt < max_retries and not self.circuit_breaker.is_open(repository):
+                self.statistics.retries += 1
+                # Delay is waited without request slot, retried request takes a slot again as any other request.
+                await asyncio.sleep(get_retry_delay(attempt, retry_after))
+
+        # Unavailable repository shouldn't abort the whole run, other repositories still can be searched.
+        self.circuit_breaker.on_failure(repository)
+        if verbose:
+            log_warning(f"Can't load metadata for {artifact.name} from {repository.name}: {failure!r}.")
+        return None
+
+    async def __request_metadata_from_mirrors(
+        self,
+        repository: Repository,
+        artifact: Artifact,
+        cached_metadata: Optional[CachedMetadata],
+        *,
+        verbose: bool,
+    ) -> Optional[ArtifactMetadata]:
+        addresses = deque(self.latency_tracker.order(repository.addresses()))
+        if len(addresses) == 1:
+            return await self.__request_metadata(addresses[0], repository, artifact, cached_metadata, verbose=verbose)
+
+        pending: set[asyncio.Future[Optional[ArtifactMetadata]]] = set()
+        failure: Optional[BaseException] = None
+        try:
+            while True:
+                hedge_delay: Optional[float] = None
+                if addresses:
+                    address = addresses.popleft()
+                    if pending:
+                        self.statistics.hedged_requests += 1
+                    pending.add(
+                        asyncio.ensure_future(
+                            self.__request_metadata(address, repository, artifact, cached_metadata, verbose=verbose),
+                        ),
+                    )
+                    if addresses:
+                        hedge_delay = self.latency_tracker.hedge_delay(address)
+                elif not pending:
+                    # Every mirror failed, last failure is handled as failure of the whole attempt.
+                    raise failure
+
+                # Next mirror is requested when current one is slower than usual or fails.
+                done, pending = await asyncio.wait(pending, timeout=hedge_delay, return_when=asyncio.FIRST_COMPLETED)
+                for request in done:
+                    if request.exception() is None:
+                        return request.result()
+                    failure = request.exception()
+        finally:
+            # Requests to slower mirrors aren't needed anymore.
+            for request in pending:
+                request.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def __request_metadata(
+        self,
+        address: URL,
+        repository: Repository,
+        artifact: Artifact,
+        cached_metadata: Optional[CachedMetadata],
+        *,
+        verbose: bool,
+    ) -> Optional[ArtifactMetadata]:
+        session = self.__get_session()
+        metadata_url = address / artifact.to_path() / "maven-metadata.xml"
+        async with self.scheduler.schedule(address) as ticket:
+            # Circuit could open while request was waiting for a free slot.
+            if self.circuit_breaker.is_open(repository):
+                self.statistics.skipped_requests += 1
+                return None
+
+            self.statistics.requests += 1
+            loop = asyncio.get_running_loop()
+            started_at = loop.time()
+            async with session.get(
+                metadata_url,
+                auth=self.__get_auth(repository, address),
+                headers=self.__get_conditional_headers(cached_metadata),
+                timeout=self.__timeout,
+            ) as response:
+                ticket.status = response.status
+                self.latency_tracker.record(address, loop.time() - started_at)
+                if response.status in RETRYABLE_STATUSES:
+                    raise RetryableResponseError(
+                        status=response.status,
+                        retry_after=parse_retry_after(response.headers.get(hdrs.RETRY_AFTER)),
+                    )
+                self.circuit_breaker.on_success(repository)
+                if response.status == 304 and cached_metadata is not None:
+                    with self.suppress_cache_errors():
+                        if self.metadata_cache is not None:
+                            self.metadata_cache.refresh(repository, artifact)
+                    return cached_metadata.metadata
+                if response.status == 404:
+                    self.statistics.affinity_misses += 1
+                    with self.suppress_cache_errors():
+                        if self.metadata_cache is not None:
+                            self.metadata_cache.put_missing(repository, artifact)
+                            self.metadata_cache.put_group_probe(repository, artifact, found=False)
+                if response.status != 200:
+                    return None
+
+                parser = MavenMetadataParser()
+                # Metadata is parsed while it's being downloaded, without decoding the whole response first.
+                async for chunk in response.content.iter_any():
+                    parser.feed(chunk)
+                metadata = parser.close()
+                if not metadata:
+                    if verbose:
+                        log_warning(f"Can't parse metadata for {artifact.name} in {repository.name}.")
+                    return None
+                with self.suppress_cache_errors():
+                    if self.metadata_cache is not None:
+                        self.metadata_cache.put_group_probe(repository, artifact, found=True)
+                        self.metadata_cache.put(
+                            repository,
+                            artifact,
+                            metadata,
+                            etag=response.headers.get(hdrs.ETAG),
+                            last_modified=response.headers.get(hdrs.LAST_MODIFIED),
+                        )
+                return metadata
+
+    async def close(self) -> None:
+        for request in list(self.__requests_in_flight.values()):
+            request.cancel()
+        await asyncio.gather(*self.__requests_in_flight.values(), return_exceptions=True)
+
+        if self.__owns_session and self.__session is not None:
+            await self.__session.close()
+        self.__session = None
+
+        if self.metadata_cache is not None:
+            with self.suppress_cache_errors():
+                self.metadata_cache.close()
+            self.metadata_cache = None
+
+    @contextmanager
+    def suppress_cache_errors(self) -> Iterator[None]:
+        """
+        Cache only speeds up the search, so when it fails (for example, it's locked by another kataloger instance for
+        too long), search continues without the cache.
+        """
+        try:
+            yield
+        except sqlite3.Error as error:
+            metadata_cache, self.metadata_cache = self.metadata_cache, None
+            if metadata_cache is None:
+                return
+            log_warning(f"Metadata cache is unavailable, search continues without it: {error!r}.")
+            with suppress(sqlite3.Error):
+                metadata_cache.close()
+
+    async def __aenter__(self) -> "MetadataFetcher":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+    def __forget_request(
+        self,
+        request_key: tuple[URL, Optional[str]],
+        request: asyncio.Future[Optional[ArtifactMetadata]],
+    ) -> None:
+        # Key can already belong to a newer request, if this one was cancelled.
+        if self.__requests_in_flight.get(request_key) is request:
+            del self.__requests_in_flight[request_key]
+
+    def __get_session(self) -> ClientSession:
+        # Session is created lazily, because it has to be created inside running event loop.
+        if self.__session is None:
+            connector = TCPConnector(
+                limit=self.network_configuration.max_requests,
+                limit_per_host=self.network_configuration.max_repository_requests,
+                ttl_dns_cache=DNS_CACHE_TTL_SECONDS,
+                keepalive_timeout=KEEPALIVE_TIMEOUT_SECONDS,
+            )
+            self.__session = ClientSession(connector=connector)
+            self.__owns_session = True
+        return self.__session
+
+    @staticmethod
+    def __get_conditional_headers(cached_metadata: Optional[CachedMetadata]) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if cached_metadata is None:
+            return headers
+
+        if cached_metadata.etag is not None:
+            headers[hdrs.IF_NONE_MATCH] = cached_metadata.etag
+        if cached_metadata.last_modified is not None:
+            headers[hdrs.IF_MODIFIED_SINCE] = cached_metadata.last_modified
+        return headers
+
+    @staticmethod
+    def __get_auth(repository: Repository, address: URL) -> Optional[BasicAuth]:
+        # Mirror on other host can be public or belong to someone else, so credentials aren't sent there.
+        if repository.requires_authorization() and address.origin() == repository.address.origin():
+            return BasicAuth(login=repository.user, password=repository.password)
+        return None
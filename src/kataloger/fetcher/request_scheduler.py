@@ -0,0 +1,68 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Optional
+
+from yarl import URL
+
+from kataloger.fetcher.adaptive_limiter import AdaptiveLimiter
+
+THROTTLING_STATUSES: frozenset[int] = frozenset({429, 503})
+
+
+@dataclass
+class RequestTicket:
+    status: Optional[int] = None
+
+
+class RequestScheduler:
+    """
+    Limits the number of simultaneous requests globally and for each repository address.
+
+    Global limit is a hard cap, while address limits adapt to repository feedback: they shrink when repository
+    throttles requests, fails or slows down, and slowly grow back to configured maximum when it responds well. Mirrors
+    of repository are separate servers, so each of them has its own limit, and request hedged to a mirror doesn't wait
+    behind slow requests to the main address. Request slot should be taken with `schedule`, response status has to
+    be reported through the yielded ticket.
+    """
+
+    def __init__(self, max_requests: int, max_repository_requests: int):
+        self.max_requests = max_requests
+        self.max_repository_requests = max_repository_requests
+        self.__global_limiter = AdaptiveLimiter(max_requests)
+        self.__address_limiters: dict[URL, AdaptiveLimiter] = {}
+
+    @asynccontextmanager
+    async def schedule(self, address: URL) -> AsyncIterator[RequestTicket]:
+        address_limiter = self.address_limiter(address)
+        # Address slot is taken first, so requests waiting for busy repository don't occupy global slots.
+        await address_limiter.acquire()
+        try:
+            await self.__global_limiter.acquire()
+            try:
+                ticket = RequestTicket()
+                started_at = asyncio.get_running_loop().time()
+                try:
+                    yield ticket
+                except Exception:
+                    address_limiter.on_overload(started_at)
+                    raise
+
+                if ticket.status in THROTTLING_STATUSES:
+                    address_limiter.on_overload(started_at)
+                # Request that wasn't sent gives no feedback about repository.
+                elif ticket.status is not None:
+                    latency = asyncio.get_running_loop().time() - started_at
+                    address_limiter.on_success(started_at, latency)
+            finally:
+                await self.__global_limiter.release()
+        finally:
+            await address_limiter.release()
+
+    def address_limiter(self, address: URL) -> AdaptiveLimiter:
+        limiter = self.__address_limiters.get(address)
+        if limiter is None:
+            limiter = AdaptiveLimiter(self.max_repository_requests)
+            self.__address_limiters[address] = limiter
+        return limiter
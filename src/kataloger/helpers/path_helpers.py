@@ -1,3 +1,5 @@
+import os
+import sys
 from importlib.resources import as_file, files
 from pathlib import Path
 from typing import Optional
@@ -45,3 +47,27 @@ def get_package_file(filename: str) -> Path:
     """
     with as_file(files(package_name).joinpath(filename)) as path:
         return path
+
+
+def get_cache_dir() -> Path:
+    """
+    Returns the directory for kataloger cache files. Directory is chosen according to platform conventions:
+    `%LOCALAPPDATA%` on Windows, `~/Library/Caches` on macOS and `$XDG_CACHE_HOME` (or `~/.cache`) on other systems.
+    Directory may not exist yet.
+
+    :returns: The absolute path to the cache directory.
+    """
+    if sys.platform == "win32":
+        local_app_data = os.environ.get("LOCALAPPDATA")
+        base_path = Path(local_app_data) if local_app_data else Path.home() / "AppData" / "Local"
+    elif sys.platform == "darwin":
+        base_path = Path.home() / "Library" / "Caches"
+    else:
+        xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+        # Relative paths in XDG variables are invalid and should be ignored according to specification.
+        if xdg_cache_home and Path(xdg_cache_home).is_absolute():
+            base_path = Path(xdg_cache_home)
+        else:
+            base_path = Path.home() / ".cache"
+
+    return base_path / package_name
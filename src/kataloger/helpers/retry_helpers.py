@@ -0,0 +1,47 @@
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+RETRY_BACKOFF_SECONDS: float = 0.5
+MAX_RETRY_DELAY_SECONDS: float = 30
+
+
+def get_retry_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """
+    Calculates delay before the next attempt of failed request. Delay grows exponentially with each attempt and is
+    randomized (full jitter), so requests that failed at the same time aren't retried all at once.
+
+    :param attempt: Number of the failed attempt, starting from zero.
+    :param retry_after: Delay requested by repository in `Retry-After` header, it's honored unless it's too long.
+    :return: Delay in seconds.
+    """
+    if retry_after is not None:
+        # Small jitter is still added, otherwise all throttled requests would come back at the same moment.
+        return min(retry_after, MAX_RETRY_DELAY_SECONDS) + random.uniform(0, RETRY_BACKOFF_SECONDS)
+
+    return random.uniform(0, min(RETRY_BACKOFF_SECONDS * 2 ** attempt, MAX_RETRY_DELAY_SECONDS))
+
+
+def parse_retry_after(value: Optional[str], now: Optional[datetime] = None) -> Optional[float]:
+    """
+    Parses `Retry-After` header value, which is either number of seconds or HTTP date.
+
+    :return: Delay in seconds, or None if value is absent or malformed.
+    """
+    if value is None:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    if now is None:
+        now = datetime.now(tz=timezone.utc)
+    return max((retry_at - now).total_seconds(), 0)
@@ -5,8 +5,11 @@ from yarl import URL
 
 from kataloger.data.artifact.library import Library
 from kataloger.data.artifact.plugin import Plugin
+from kataloger.data.cache_configuration import CacheConfiguration
 from kataloger.data.catalog import Catalog
 from kataloger.data.configuration_data import ConfigurationData
+from kataloger.data.content_filter import ContentFilter
+from kataloger.data.network_configuration import NetworkConfiguration
 from kataloger.data.repository import Repository
 from kataloger.exceptions.kataloger_parse_exception import KatalogerParseError
 from kataloger.helpers.backport_helpers import load_toml
@@ -14,11 +17,16 @@ from kataloger.helpers.log_helpers import log_warning
 from kataloger.helpers.path_helpers import str_to_path
 from kataloger.helpers.structural_matching_helpers import match
 
+CONTENT_FILTER_KEYS: frozenset[str] = frozenset({"include_groups", "exclude_groups"})
+MIRRORS_KEY: str = "mirrors"
+
 
 def load_configuration(configuration_path: Path) -> ConfigurationData:
     catalogs: Optional[list[Catalog]] = None
     library_repositories: Optional[list[Repository]] = None
     plugin_repositories: Optional[list[Repository]] = None
+    network_configuration: Optional[NetworkConfiguration] = None
+    cache_configuration: Optional[CacheConfiguration] = None
 
     configuration_data = load_toml(path=configuration_path)
     if "catalogs" in configuration_data:
@@ -27,6 +35,10 @@ def load_configuration(configuration_path: Path) -> ConfigurationData:
         library_repositories = parse_repositories(configuration_data["libraries"])
     if "plugins" in configuration_data:
         plugin_repositories = parse_repositories(configuration_data["plugins"])
+    if "network" in configuration_data:
+        network_configuration = parse_network_configuration(configuration_data["network"])
+    if "cache" in configuration_data:
+        cache_configuration = parse_cache_configuration(configuration_data["cache"])
 
     return ConfigurationData(
         catalogs=catalogs,
@@ -35,6 +47,8 @@ def load_configuration(configuration_path: Path) -> ConfigurationData:
         verbose=__extract_optional_boolean(configuration_data, key="verbose"),
         suggest_unstable_updates=__extract_optional_boolean(configuration_data, key="suggest_unstable_updates"),
         fail_on_updates=__extract_optional_boolean(configuration_data, key="fail_on_updates"),
+        network_configuration=network_configuration,
+        cache_configuration=cache_configuration,
     )
 
 
@@ -62,13 +76,8 @@ def parse_repositories(data: dict) -> Optional[list[Repository]]:
         repository: Repository
         if isinstance(repository_data, str):
             repository = Repository(name=name, address=URL(repository_data))
-        elif mr := match(repository_data, pattern={"address": str, "user": str, "password": str}):
-            repository = Repository(
-                name=name,
-                address=URL(mr.address),
-                user=mr.user,
-                password=mr.password,
-            )
+        elif isinstance(repository_data, dict):
+            repository = __parse_repository_table(name, repository_data)
         else:
             raise KatalogerParseError(message="Unexpected repository data.")
         repositories.append(repository)
@@ -76,6 +85,84 @@ def parse_repositories(data: dict) -> Optional[list[Repository]]:
     return repositories
 
 
+def parse_network_configuration(data: dict) -> NetworkConfiguration:
+    if not isinstance(data, dict):
+        raise KatalogerParseError(message="Unexpected network configuration data.")
+
+    default = NetworkConfiguration()
+    known_keys = {
+        "max_requests",
+        "max_repository_requests",
+        "deadline_seconds",
+        "max_repository_failures",
+        "connect_timeout_seconds",
+        "read_timeout_seconds",
+        "max_retries",
+        "hedge_percentile",
+        "first_hit",
+    }
+    if unknown_keys := data.keys() - known_keys:
+        message = f'Unknown network configuration fields: {", ".join(sorted(map(str, unknown_keys)))}.'
+        raise KatalogerParseError(message)
+
+    first_hit = __extract_optional_boolean(data, key="first_hit")
+    return NetworkConfiguration(
+        max_requests=__extract_positive_integer(data, key="max_requests", default=default.max_requests),
+        max_repository_requests=__extract_positive_integer(
+            data,
+            key="max_repository_requests",
+            default=default.max_repository_requests,
+        ),
+        deadline_seconds=__extract_positive_integer(data, key="deadline_seconds", default=default.deadline_seconds),
+        max_repository_failures=__extract_positive_integer(
+            data,
+            key="max_repository_failures",
+            default=default.max_repository_failures,
+        ),
+        connect_timeout_seconds=__extract_positive_integer(
+            data,
+            key="connect_timeout_seconds",
+            default=default.connect_timeout_seconds,
+        ),
+        read_timeout_seconds=__extract_positive_integer(
+            data,
+            key="read_timeout_seconds",
+            default=default.read_timeout_seconds,
+        ),
+        max_retries=__extract_non_negative_integer(data, key="max_retries", default=default.max_retries),
+        hedge_percentile=__extract_percentile(data, key="hedge_percentile", default=default.hedge_percentile),
+        first_hit=first_hit if first_hit is not None else default.first_hit,
+    )
+
+
+def parse_cache_configuration(data: dict) -> CacheConfiguration:
+    if not isinstance(data, dict):
+        raise KatalogerParseError(message="Unexpected cache configuration data.")
+
+    default = CacheConfiguration()
+    known_keys = {"enabled", "ttl_seconds", "max_size_mb", "negative_ttl_seconds", "affinity_reprobe_seconds"}
+    if unknown_keys := data.keys() - known_keys:
+        message = f'Unknown cache configuration fields: {", ".join(sorted(map(str, unknown_keys)))}.'
+        raise KatalogerParseError(message)
+
+    enabled = __extract_optional_boolean(data, key="enabled")
+    return CacheConfiguration(
+        enabled=enabled if enabled is not None else default.enabled,
+        ttl_seconds=__extract_positive_integer(data, key="ttl_seconds", default=default.ttl_seconds),
+        max_size_mb=__extract_positive_integer(data, key="max_size_mb", default=default.max_size_mb),
+        negative_ttl_seconds=__extract_positive_integer(
+            data,
+            key="negative_ttl_seconds",
+            default=default.negative_ttl_seconds,
+        ),
+        affinity_reprobe_seconds=__extract_positive_integer(
+            data,
+            key="affinity_reprobe_seconds",
+            default=default.affinity_reprobe_seconds,
+        ),
+    )
+
+
 def parse_catalogs(data: Union[list, dict], configuration_root_dir: Optional[Path]) -> Optional[list[Catalog]]:
     if not data:
         return None
@@ -229,6 +316,60 @@ def __get_version_by_reference(
     return version
 
 
+def __parse_repository_table(name: str, data: dict) -> Repository:
+    content_filter = __extract_content_filter(data)
+    mirrors = __extract_mirrors(data)
+    access_data = {
+        key: value for key, value in data.items() if key not in CONTENT_FILTER_KEYS and key != MIRRORS_KEY
+    }
+    if mr := match(access_data, pattern={"address": str}):
+        return Repository(name=name, address=URL(mr.address), content_filter=content_filter, mirrors=mirrors)
+    if mr := match(access_data, pattern={"address": str, "user": str, "password": str}):
+        return Repository(
+            name=name,
+            address=URL(mr.address),
+            user=mr.user,
+            password=mr.password,
+            content_filter=content_filter,
+            mirrors=mirrors,
+        )
+
+    raise KatalogerParseError(message="Unexpected repository data.")
+
+
+def __extract_content_filter(data: dict) -> Optional[ContentFilter]:
+    include_groups = __extract_groups(data, key="include_groups")
+    exclude_groups = __extract_groups(data, key="exclude_groups")
+    if not (include_groups or exclude_groups):
+        return None
+
+    return ContentFilter(include_groups=include_groups, exclude_groups=exclude_groups)
+
+
+def __extract_mirrors(data: dict) -> tuple[URL, ...]:
+    mirrors = data.get(MIRRORS_KEY, [])
+    if not isinstance(mirrors, list):
+        raise KatalogerParseError(message=f'Unexpected "{MIRRORS_KEY}" value: "{mirrors}".')
+
+    for mirror in mirrors:
+        if not isinstance(mirror, str) or not mirror.strip():
+            raise KatalogerParseError(message=f'Unexpected mirror address: "{mirror}".')
+
+    return tuple(URL(mirror.strip()) for mirror in mirrors)
+
+
+def __extract_groups(data: dict, key: str) -> tuple[str, ...]:
+    groups = data.get(key, [])
+    if not isinstance(groups, list):
+        raise KatalogerParseError(message=f'Unexpected "{key}" value: "{groups}".')
+
+    for group in groups:
+        if not isinstance(group, str) or not group.strip():
+            raise KatalogerParseError(message=f'Unexpected group in "{key}": "{group}".')
+
+    return tuple(group.strip() for group in groups)
+
+
 def __extract_optional_boolean(data: dict, key: str) -> Optional[bool]:
     value = data.get(key)
     if value is None or isinstance(value, bool):
@@ -236,3 +377,35 @@ def __extract_optional_boolean(data: dict, key: str) -> Optional[bool]:
 
     message = f'Configuration field "{key}" has incorrect value "{value}", while expected boolean type.'
     raise KatalogerParseError(message)
+
+
+def __extract_positive_integer(data: dict, key: str, default: Optional[int]) -> Optional[int]:
+    value = data.get(key)
+    if value is None:
+        return default
+    # Boolean is a subclass of integer, but "true" is clearly not a valid limit.
+    if isinstance(value, int) and not isinstance(value, bool) and value > 0:
+        return value
+
+    message = f'Configuration field "{key}" has incorrect value "{value}", while expected positive integer.'
+    raise KatalogerParseError(message)
+
+
+def __extract_non_negative_integer(data: dict, key: str, default: int) -> int:
+    value = data.get(key)
+    if value is None:
+        return default
+    if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+        return value
+
+    message = f'Configuration field "{key}" has incorrect value "{value}", while expected non-negative integer.'
+    raise KatalogerParseError(message)
+
+
+def __extract_percentile(data: dict, key: str, default: int) -> int:
+    value = __extract_positive_integer(data, key=key, default=default)
+    if value < 100:
+        return value
+
+    message = f'Configuration field "{key}" has incorrect value "{value}", while expected percentile from 1 to 99.'
+    raise KatalogerParseError(message)
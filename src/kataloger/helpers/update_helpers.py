@@ -1,67 +1,226 @@
 import asyncio
-from collections import defaultdict
-from typing import Optional
-
-from aiohttp import BasicAuth, ClientSession
+from collections.abc import AsyncIterator, Iterator
+from typing import Optional, Union
 
 from kataloger.data.artifact.artifact import Artifact
 from kataloger.data.metadata_repository_info import MetadataRepositoryInfo
 from kataloger.data.repository import Repository
-from kataloger.helpers.log_helpers import log_warning
-from kataloger.helpers.xml_parse_helpers import try_parse_maven_group_metadata
+from kataloger.fetcher.metadata_fetcher import MetadataFetcher
 
 
 async def get_all_artifact_metadata(
     artifacts: list[Artifact],
     repositories: list[Repository],
+    fetcher: MetadataFetcher,
     *,
     verbose: bool,
 ) -> dict[Artifact, list[MetadataRepositoryInfo]]:
     if not artifacts:
         return {}
 
-    search_results: dict[Artifact, list[MetadataRepositoryInfo]] = defaultdict(list)
-    for repository in repositories:
-        result = await get_all_artifact_metadata_in_repository(repository, artifacts, verbose=verbose)
-        for artifact, metadata in result.items():
-            search_results[artifact].append(metadata)
-    return search_results
+    # Artifacts that weren't searched completely before deadline are resolved with metadata that arrived in time.
+    search = iter_all_artifact_metadata([(artifacts, repositories)], fetcher, verbose=verbose)
+    search_results: dict[Artifact, list[MetadataRepositoryInfo]] = {
+        artifact: metadata async for artifact, metadata, _ in search if metadata
+    }
 
+    # Results are returned in order of artifacts declaration, regardless of which artifact was found first.
+    return {artifact: search_results[artifact] for artifact in artifacts if artifact in search_results}
 
-async def get_all_artifact_metadata_in_repository(
-    repository: Repository,
-    artifacts: list[Artifact],
+
+async def iter_all_artifact_metadata(
+    searches: list[tuple[list[Artifact], list[Repository]]],
+    fetcher: MetadataFetcher,
     *,
     verbose: bool,
-) -> dict[Artifact, MetadataRepositoryInfo]:
-    if repository.requires_authorization():
-        auth = BasicAuth(login=repository.user, password=repository.password)
-    else:
-        auth = None
-
-    async with ClientSession(auth=auth) as session:
-        requests = []
+) -> AsyncIterator[tuple[Artifact, list[MetadataRepositoryInfo], bool]]:
+    """
+    Searches metadata of artifacts in their repositories and yields each artifact as soon as all its repositories
+    answered, so the caller can process found metadata while other artifacts are still being fetched. When network
+    configuration sets deadline, requests that haven't finished by the deadline are cancelled and artifacts are
+    yielded with metadata that arrived in time.
+
+    :param searches: Pairs of artifacts and repositories where these artifacts should be searched.
+    :param fetcher: Fetcher used to load metadata.
+    :param verbose: Whether fetch problems should be reported.
+    :return: Async iterator of artifacts with metadata found in their repositories, in order of repositories
+    declaration, and flag whether all repositories answered. Artifacts that aren't found in any repository are
+    skipped, unless search was interrupted by deadline.
+    """
+    # The same module can be declared under several aliases and in several catalogs, but metadata doesn't depend on
+    # alias or version, so each module is fetched once and the result is shared by all its declarations.
+    declarations: dict[tuple[type, str], dict[Artifact, None]] = {}
+    module_repositories: dict[tuple[type, str], tuple[Artifact, list[Repository]]] = {}
+    for artifacts, repositories in searches:
         for artifact in artifacts:
-            request = get_artifact_metadata(session, repository, artifact, verbose=verbose)
-            requests.append(request)
-        results = await asyncio.gather(*requests)
+            fetch_key = get_fetch_key(artifact)
+            declarations.setdefault(fetch_key, {})[artifact] = None
+            module_repositories.setdefault(fetch_key, (artifact, repositories))
+            fetcher.statistics.artifacts += 1
+    fetcher.statistics.unique_artifacts += len(module_repositories)
+
+    # Number of modules searched at once is bounded, as well as number of found results waiting for the consumer. When
+    # consumer doesn't take results, searches stop as soon as the buffer is full, so slow consumer doesn't make the
+    # whole run be loaded into memory ahead of it.
+    search_limit = min(fetcher.network_configuration.max_requests, len(module_repositories))
+    results: asyncio.Queue[tuple[tuple[type, str], Union[tuple[list[MetadataRepositoryInfo], bool], Exception]]] = (
+        asyncio.Queue(maxsize=fetcher.network_configuration.max_requests)
+    )
+    deadline: Optional[float] = None
+    if fetcher.network_configuration.deadline_seconds is not None:
+        deadline = asyncio.get_running_loop().time() + fetcher.network_configuration.deadline_seconds
+    modules = iter(__prioritize(module_repositories, fetcher))
+    stopped = asyncio.Event()
+    workers = [
+        asyncio.ensure_future(
+            __search_modules(modules, results, fetcher, verbose=verbose, deadline=deadline, stopped=stopped),
+        )
+        for _ in range(search_limit)
+    ]
+    try:
+        for _ in range(len(module_repositories)):
+            fetch_key, search_result = await results.get()
+            if isinstance(search_result, Exception):
+                raise search_result
+            metadata, is_complete = search_result
+            if is_complete and not metadata:
+                continue
+            for artifact in declarations[fetch_key]:
+                yield artifact, metadata, is_complete
+    finally:
+        # Searches that nobody waits for anymore (consumer stopped iteration or failed) are cancelled.
+        stopped.set()
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+async def get_artifact_metadata_in_repositories(
+    artifact: Artifact,
+    repositories: list[Repository],
+    fetcher: MetadataFetcher,
+    *,
+    verbose: bool,
+    deadline: Optional[float] = None,
+) -> tuple[list[MetadataRepositoryInfo], bool]:
+    """
+    Searches artifact metadata in repositories until all of them answered or deadline (in event loop time) passed.
+    When network configuration enables first-hit mode, repositories are searched one by one in declaration order
+    until the first of them has the artifact, like Gradle does.
+
+    :return: Metadata found in repositories, in order of repositories declaration, and flag whether all repositories
+    that had to be searched answered before deadline.
+    """
+    # Repositories which content filter excludes the artifact are never requested.
+    repositories = [repository for repository in repositories if repository.may_contain(artifact)]
+    if fetcher.network_configuration.first_hit:
+        return await __get_first_artifact_metadata(artifact, repositories, fetcher, verbose=verbose, deadline=deadline)
+
+    requests = [
+        asyncio.ensure_future(
+            fetcher.get_artifact_metadata(
+                repository,
+                artifact,
+                verbose=verbose,
+                searched_repositories=repositories,
+            ),
+        )
+        for repository in repositories
+    ]
+    if not requests:
+        return [], True
 
-    return {artifact: metadata for artifact, metadata in zip(artifacts, results) if metadata}
+    try:
+        _, pending = await asyncio.wait(requests, timeout=__get_timeout(deadline))
+    finally:
+        # Requests that didn't finish in time, or which result isn't needed anymore, are cancelled.
+        for request in requests:
+            request.cancel()
 
+    # Results are kept in order of repositories declaration, regardless of which repository answered first.
+    results = [request.result() for request in requests if request not in pending]
+    return [metadata for metadata in results if metadata], not pending
 
-async def get_artifact_metadata(
-    session: ClientSession,
-    repository: Repository,
+
+async def __get_first_artifact_metadata(
     artifact: Artifact,
+    repositories: list[Repository],
+    fetcher: MetadataFetcher,
+    *,
+    verbose: bool,
+    deadline: Optional[float],
+) -> tuple[list[MetadataRepositoryInfo], bool]:
+    # Remaining repositories aren't requested once artifact is found, so most artifacts cost a single request.
+    for repository in repositories:
+        try:
+            metadata = await asyncio.wait_for(
+                fetcher.get_artifact_metadata(
+                    repository,
+                    artifact,
+                    verbose=verbose,
+                    searched_repositories=repositories,
+                ),
+                timeout=__get_timeout(deadline),
+            )
+        except asyncio.TimeoutError:
+            return [], False
+        if metadata:
+            return [metadata], True
+
+    return [], True
+
+
+def __get_timeout(deadline: Optional[float]) -> Optional[float]:
+    if deadline is None:
+        return None
+    return max(deadline - asyncio.get_running_loop().time(), 0)
+
+
+def get_fetch_key(artifact: Artifact) -> tuple[type, str]:
+    return type(artifact), artifact.coordinates
+
+
+def __prioritize(
+    module_repositories: dict[tuple[type, str], tuple[Artifact, list[Repository]]],
+    fetcher: MetadataFetcher,
+) -> list[tuple[tuple[type, str], tuple[Artifact, list[Repository]]]]:
+    # Artifacts that had updates last time are most likely still outdated, so they're searched first and the caller,
+    # that needs only to know whether any update exists, gets an answer as early as possible.
+    metadata_cache = fetcher.metadata_cache
+    if metadata_cache is None:
+        return list(module_repositories.items())
+    with fetcher.suppress_cache_errors():
+        return sorted(module_repositories.items(), key=lambda module: not metadata_cache.had_update(module[1][0]))
+    return list(module_repositories.items())
+
+
+async def __search_modules(
+    modules: Iterator[tuple[tuple[type, str], tuple[Artifact, list[Repository]]]],
+    results: asyncio.Queue,
+    fetcher: MetadataFetcher,
     *,
     verbose: bool,
-) -> Optional[MetadataRepositoryInfo]:
-    metadata_url = repository.address / artifact.to_path() / "maven-metadata.xml"
-    async with session.get(metadata_url) as response:
-        if response.status != 200:
-            return None
-
-        metadata = try_parse_maven_group_metadata(await response.text())
-        if not metadata and verbose:
-            log_warning(f"Can't parse metadata for {artifact.name} in {repository.name}.")
-        return MetadataRepositoryInfo(repository, metadata)
+    deadline: Optional[float],
+    stopped: asyncio.Event,
+) -> None:
+    # Workers share single iterator, so each module is taken by exactly one of them.
+    for fetch_key, (artifact, repositories) in modules:
+        try:
+            search_result = await get_artifact_metadata_in_repositories(
+                artifact,
+                repositories,
+                fetcher,
+                verbose=verbose,
+                deadline=deadline,
+            )
+        except asyncio.CancelledError:
+            if stopped.is_set():
+                raise
+            # Worker itself is cancelled only when search is stopped, so some request was cancelled from outside. The
+            # consumer still has to get the module, otherwise it would wait for it forever.
+            search_result = ([], False)
+        except Exception as error:
+            # Failure is handed to the consumer, otherwise it would wait for this module forever.
+            await results.put((fetch_key, error))
+            return
+        await results.put((fetch_key, search_result))
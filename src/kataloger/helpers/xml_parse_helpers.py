@@ -1,28 +1,106 @@
-from pyexpat import ExpatError
-from typing import Optional
-
-import xmltodict
+from typing import Optional, Union
+from xml.parsers.expat import ExpatError, ParserCreate
 
 from kataloger.data.artifact_metadata import ArtifactMetadata
 
+METADATA_VERSIONING_PATH: list[str] = ["metadata", "versioning"]
+METADATA_VERSIONS_PATH: list[str] = ["metadata", "versioning", "versions"]
+METADATA_VERSIONING_FIELDS: frozenset[str] = frozenset({"latest", "release", "lastUpdated"})
+
+
+class MavenMetadataParser:
+    """
+    Incremental parser of `maven-metadata.xml`.
+
+    Data can be fed in chunks as they arrive, so the whole response doesn't have to be kept in memory and decoded
+    before parsing. Only `latest`, `release`, `lastUpdated` and `versions/version` elements of `versioning` are
+    collected, all other content is skipped.
+    """
+
+    def __init__(self):
+        self.__parser = ParserCreate()
+        self.__parser.buffer_text = True
+        self.__parser.StartElementHandler = self.__on_start_element
+        self.__parser.EndElementHandler = self.__on_end_element
+        self.__path: list[str] = []
+        self.__text: list[str] = []
+        self.__collected_depth: Optional[int] = None
+        self.__fields: dict[str, str] = {}
+        self.__versions: list[str] = []
+        self.__started: bool = False
+        self.__failed: bool = False
+
+    def feed(self, data: Union[bytes, str]) -> None:
+        if self.__failed:
+            return
+
+        if not self.__started:
+            # Leading whitespace isn't allowed before XML declaration, but some repositories send it.
+            data = data.lstrip()
+            if not data:
+                return
+            self.__started = True
+
+        try:
+            self.__parser.Parse(data)
+        except ExpatError:
+            self.__failed = True
 
-def try_parse_maven_group_metadata(response: str) -> Optional[ArtifactMetadata]:
-    try:
-        metadata = xmltodict.parse(response.strip())
-    except ExpatError:
-        return None
+    def close(self) -> Optional[ArtifactMetadata]:
+        if self.__failed or not self.__started:
+            return None
 
-    try:
-        version_info = metadata["metadata"]["versioning"]
-        versions = version_info["versions"]["version"]
-        if not isinstance(versions, list):
-            versions = [versions]
+        try:
+            self.__parser.Parse(b"", True)  # noqa: FBT003
+        except ExpatError:
+            return None
+
+        if not self.__versions:
+            return None
+
+        try:
+            last_updated = int(self.__fields.get("lastUpdated", 0))
+        except ValueError:
+            return None
 
         return ArtifactMetadata(
-            latest_version=version_info.get("latest", versions[-1]),
-            release_version=version_info.get("release", versions[-1]),
-            versions=versions,
-            last_updated=int(version_info.get("lastUpdated", 0)),
+            latest_version=self.__fields.get("latest", self.__versions[-1]),
+            release_version=self.__fields.get("release", self.__versions[-1]),
+            versions=self.__versions,
+            last_updated=last_updated,
         )
-    except (KeyError, TypeError):
-        return None
+
+    def __on_start_element(self, name: str, attributes: dict[str, str]) -> None:  # noqa: ARG002
+        path = self.__path
+        if self.__collected_depth is None and (
+            (name == "version" and path == METADATA_VERSIONS_PATH)
+            or (name in METADATA_VERSIONING_FIELDS and path == METADATA_VERSIONING_PATH)
+        ):
+            self.__collected_depth = len(path) + 1
+            # Text is collected only inside interesting elements, all other text isn't even passed to python.
+            self.__parser.CharacterDataHandler = self.__text.append
+        path.append(name)
+
+    def __on_end_element(self, name: str) -> None:
+        path = self.__path
+        if len(path) != self.__collected_depth:
+            path.pop()
+            return
+
+        path.pop()
+        text = "".join(self.__text).strip()
+        self.__text.clear()
+        self.__collected_depth = None
+        self.__parser.CharacterDataHandler = None
+        if not text:
+            return
+        if name == "version":
+            self.__versions.append(text)
+        else:
+            self.__fields[name] = text
+
+
+def try_parse_maven_group_metadata(response: Union[bytes, str]) -> Optional[ArtifactMetadata]:
+    parser = MavenMetadataParser()
+    parser.feed(response)
+    return parser.close()
@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from typing import Optional
 
 from kataloger.data.artifact.artifact import Artifact
@@ -7,9 +8,17 @@ from kataloger.update_resolver.base.update_resolution import UpdateResolution
 from kataloger.update_resolver.base.update_resolver import UpdateResolver
 from kataloger.update_resolver.universal.version import Version
 from kataloger.update_resolver.universal.version_factory import VersionFactory
+from kataloger.update_resolver.universal.version_index import VersionIndex
+
+VERSION_INDEX_CACHE_SIZE: int = 1024
 
 
 class UniversalUpdateResolver(UpdateResolver):
+    """
+    Resolves updates against versions of all repositories where artifact was found. Versions of repositories are
+    merged into a single index, and the update is attributed to the first repository, in declaration order, that hosts
+    the update version.
+    """
 
     def __init__(
         self,
@@ -19,77 +28,76 @@ class UniversalUpdateResolver(UpdateResolver):
     ):
         self.version_factories = version_factories
         self.suggest_unstable_updates = suggest_unstable_updates
+        # Metadata is kept alongside its index, so metadata identity can't be reused by other object while cached.
+        self.__version_indexes: OrderedDict[tuple[int, ...], tuple[list[MetadataRepositoryInfo], VersionIndex]] = (
+            OrderedDict()
+        )
 
     def resolve(
         self,
         artifact: Artifact,
         repositories_metadata: list[MetadataRepositoryInfo],
     ) -> tuple[UpdateResolution, Optional[ArtifactUpdate]]:
-        recently_updated_repository = self.__most_recently_updated_repository(repositories_metadata)
-        current_version_repository = self.__repository_with_current_version(artifact.version, repositories_metadata)
-        repositories_to_check: list[MetadataRepositoryInfo] = []
-        if current_version_repository and recently_updated_repository != current_version_repository:
-            repositories_to_check.append(current_version_repository)
-        repositories_to_check.append(recently_updated_repository)
-
-        for repository in repositories_to_check:
-            for factory in self.version_factories:
-                (resolution, optional_update) = self.__resolve_update_in_repository(artifact, factory, repository)
-                if resolution == UpdateResolution.CANT_RESOLVE:
-                    continue
-                if resolution == UpdateResolution.NO_UPDATES or resolution == UpdateResolution.UPDATE_FOUND:
-                    return resolution, optional_update
+        for factory in self.version_factories:
+            (resolution, optional_update) = self.__resolve_update(artifact, factory, repositories_metadata)
+            if resolution == UpdateResolution.CANT_RESOLVE:
+                continue
+            if resolution == UpdateResolution.NO_UPDATES or resolution == UpdateResolution.UPDATE_FOUND:
+                return resolution, optional_update
 
-                message: str = f'Unexpected update resolution: "{resolution}".'
-                raise ValueError(message)
+            message: str = f'Unexpected update resolution: "{resolution}".'
+            raise ValueError(message)
 
         return UpdateResolution.CANT_RESOLVE, None
 
-    def __resolve_update_in_repository(
+    def __resolve_update(
         self,
         artifact: Artifact,
         version_factory: VersionFactory,
-        repository_metadata: MetadataRepositoryInfo,
+        repositories_metadata: list[MetadataRepositoryInfo],
     ) -> tuple[UpdateResolution, Optional[ArtifactUpdate]]:
         current_version = artifact.version
-        if not version_factory.can_create(current_version):
+        artifact_version = version_factory.try_create(current_version)
+        if artifact_version is None:
             return UpdateResolution.CANT_RESOLVE, None
 
-        artifact_version = version_factory.create(current_version)
+        version_index = self.__get_version_index(version_factory, repositories_metadata)
         suggest_unstable = self.suggest_unstable_updates or artifact_version.is_pre_release()
-        for version in reversed(repository_metadata.metadata.versions):
-            if not version_factory.can_create(version):
-                return UpdateResolution.CANT_RESOLVE, None
-
-            update_version = version_factory.create(version)
-            if update_version.is_pre_release() and not suggest_unstable:
-                continue
-
-            if artifact_version == update_version:
-                return UpdateResolution.NO_UPDATES, None
-            if artifact_version < update_version:
-                update = ArtifactUpdate(
-                    name=artifact.name,
-                    update_repository_name=repository_metadata.repository.name,
-                    current_version=current_version,
-                    available_version=version,
-                )
-                return UpdateResolution.UPDATE_FOUND, update
+        updates = version_index.updates_above(artifact_version, include_pre_releases=suggest_unstable)
+        if updates is not None:
+            update = ArtifactUpdate(
+                name=artifact.name,
+                update_repository_name=version_index.source_of(updates.latest.raw).repository.name,
+                current_version=current_version,
+                available_version=updates.latest.raw,
+                minor_version=updates.minor.raw if updates.minor is not None else None,
+                patch_version=updates.patch.raw if updates.patch is not None else None,
+            )
+            return UpdateResolution.UPDATE_FOUND, update
+        if current_version in version_index:
+            return UpdateResolution.NO_UPDATES, None
 
         return UpdateResolution.CANT_RESOLVE, None
 
-    @staticmethod
-    def __most_recently_updated_repository(
+    def __get_version_index(
+        self,
+        version_factory: VersionFactory,
         repositories_metadata: list[MetadataRepositoryInfo],
-    ) -> MetadataRepositoryInfo:
-        return max(repositories_metadata, key=lambda rm: rm.metadata.last_updated)
+    ) -> VersionIndex[Version, MetadataRepositoryInfo]:
+        # Index is built once for metadata shared by all declarations of the module, and reused for each of them.
+        key = (id(version_factory), *map(id, repositories_metadata))
+        cached_index = self.__version_indexes.get(key)
+        if cached_index is not None:
+            self.__version_indexes.move_to_end(key)
+            return cached_index[1]
 
-    @staticmethod
-    def __repository_with_current_version(
-        current_version: str,
-        repositories_metadata: list[MetadataRepositoryInfo],
-    ) -> Optional[MetadataRepositoryInfo]:
-        for repository_metadata in repositories_metadata:
-            if current_version in repository_metadata.metadata.versions:
-                return repository_metadata
-        return None
+        raw_versions = (
+            (version, repository_metadata)
+            for repository_metadata in repositories_metadata
+            for version in repository_metadata.metadata.versions
+        )
+        version_index = VersionIndex.create(raw_versions, version_factory)
+        self.__version_indexes[key] = (list(repositories_metadata), version_index)
+        if len(self.__version_indexes) > VERSION_INDEX_CACHE_SIZE:
+            self.__version_indexes.popitem(last=False)
+        return version_index
@@ -1,6 +1,6 @@
 import re
 from functools import total_ordering
-from itertools import zip_longest
+from typing import Optional
 
 from kataloger.update_resolver.universal.version import Version
 
@@ -11,9 +11,12 @@ class UniversalVersion(Version):
 
     __pre_release_names = ("dev", "alpha", "beta", "rc")
 
-    def __init__(self, version: str):
+    __slots__ = ("numeric_part", "pre_release_name", "pre_release_number", "__numeric_components", "__sort_key")
+
+    def __init__(self, version: str, match: Optional[re.Match] = None):
         super().__init__(version)
-        match = self.__regex.match(version)
+        if match is None:
+            match = self.__regex.match(version)
         self.numeric_part: str = match.group(1)
         self.pre_release_name: str = match.group(2)
 
@@ -22,9 +25,27 @@ class UniversalVersion(Version):
             pre_release_number = 0
         self.pre_release_number: int = int(pre_release_number)
 
+        # Versions are compared by numeric parts first (missing digits are assumed as 0, so trailing zeros don't
+        # matter), then pre-release version is less than release one, and then by pre-release names.
+        self.__numeric_components: tuple[int, ...] = tuple(
+            int(digit) if digit else 0 for digit in self.numeric_part.split(".")
+        )
+        digits = list(self.__numeric_components)
+        while digits and not digits[-1]:
+            digits.pop()
+        pre_release_index = self._pre_release_index() if self.is_pre_release() else 0
+        self.__sort_key: tuple[tuple[int, ...], bool, int] = (
+            tuple(digits),
+            not self.is_pre_release(),
+            pre_release_index,
+        )
+
     def is_pre_release(self) -> bool:
         return self.pre_release_name is not None
 
+    def numeric_components(self) -> tuple[int, ...]:
+        return self.__numeric_components
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, UniversalVersion):
             return False
@@ -35,38 +56,11 @@ class UniversalVersion(Version):
         if not isinstance(other, UniversalVersion):
             return False
 
-        if self == other:
-            return False
-
-        def to_digits_list(version_part: str) -> list[int]:
-            return list(map(int, version_part.split(".")))
-
-        # Compare numeric part of version. Missing digits assumed as 0.
-        self_digits = to_digits_list(self.numeric_part)
-        other_digits = to_digits_list(other.numeric_part)
-        for self_digit, other_digit in zip_longest(self_digits, other_digits, fillvalue=0):
-            if self_digit < other_digit:
-                return True
-            if self_digit > other_digit:
-                return False
-
-        # Numeric part is equal, lets compare pre-release part.
-        if self.is_pre_release() and other.is_pre_release():
-            if self.pre_release_name == other.pre_release_name:
-                # Pre-release prefixes are equals, compare pre-release numbers
-                if self.pre_release_number < other.pre_release_number:
-                    return True
-            else:
-                # Pre-release prefixes are different, compare pre-release prefixes
-                self_pr_index = self._pre_release_index()
-                other_pr_index = other._pre_release_index()
-                if self_pr_index < other_pr_index:
-                    return True
-                if self_pr_index > other_pr_index:
-                    return False
-            return False
+        if self.__sort_key != other.__sort_key:
+            return self.__sort_key < other.__sort_key
 
-        return self.is_pre_release() and not other.is_pre_release()
+        # Pre-release numbers are comparable only when pre-release names are the same.
+        return self.pre_release_name == other.pre_release_name and self.pre_release_number < other.pre_release_number
 
     def _pre_release_index(self) -> int:
         lowercase_pre_release_name = self.pre_release_name.lower()
@@ -77,3 +71,10 @@ class UniversalVersion(Version):
     @classmethod
     def can_handle(cls, version: str) -> bool:
         return cls.__regex.match(version) is not None
+
+    @classmethod
+    def parse(cls, version: str) -> Optional["UniversalVersion"]:
+        match = cls.__regex.match(version)
+        if match is None:
+            return None
+        return cls(version, match)
@@ -1,11 +1,30 @@
+from functools import lru_cache
+from typing import Optional
+
 from kataloger.update_resolver.universal.universal_version import UniversalVersion
 from kataloger.update_resolver.universal.version_factory import VersionFactory
 
+DEFAULT_CACHE_SIZE: int = 4096
+
 
 class UniversalVersionFactory(VersionFactory[UniversalVersion]):
+    """
+    Factory of universal versions. Versions are immutable, so each version string is parsed once and the same
+    version instance is returned for repeated strings, until it's evicted from the cache of recently used versions.
+    """
+
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE):
+        self.__parse = lru_cache(maxsize=cache_size)(UniversalVersion.parse)
 
     def create(self, version: str) -> UniversalVersion:
-        return UniversalVersion(version)
+        universal_version = self.try_create(version)
+        if universal_version is None:
+            message = f'Unsupported version notation: "{version}".'
+            raise ValueError(message)
+        return universal_version
 
     def can_create(self, version: str) -> bool:
-        return UniversalVersion.can_handle(version)
+        return self.try_create(version) is not None
+
+    def try_create(self, version: str) -> Optional[UniversalVersion]:
+        return self.__parse(version)
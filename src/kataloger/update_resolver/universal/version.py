@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 
 
 class Version(ABC):
+    __slots__ = ("raw",)
+
     def __init__(self, raw: str):
         self.raw = raw
 
@@ -12,6 +14,13 @@ class Version(ABC):
     def is_pre_release(self) -> bool:
         raise NotImplementedError
 
+    def numeric_components(self) -> tuple[int, ...]:
+        """
+        Numeric components of version (major, minor, patch and so on), used to group updates by the component they
+        change. Versions without such notation return empty tuple, then only the latest update is resolved.
+        """
+        return ()
+
     @abstractmethod
     def __eq__(self, other: object) -> bool:
         raise NotImplementedError
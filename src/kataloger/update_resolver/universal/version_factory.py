@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import Generic, Optional, TypeVar
 
 from kataloger.update_resolver.universal.version import Version
 
@@ -15,3 +15,14 @@ class VersionFactory(ABC, Generic[T]):
     @abstractmethod
     def can_create(self, version: str) -> bool:
         raise NotImplementedError
+
+    def try_create(self, version: str) -> Optional[T]:
+        """
+        Creates version if factory can handle its notation. Factories that can check and create version in a single
+        step should override it, so version string isn't parsed twice.
+
+        :return: Created version, or None if version notation isn't supported by factory.
+        """
+        if not self.can_create(version):
+            return None
+        return self.create(version)
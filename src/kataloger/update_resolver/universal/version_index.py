@@ -0,0 +1,89 @@
+from bisect import bisect_right
+from collections.abc import Iterable
+from typing import Generic, Optional, TypeVar
+
+from kataloger.update_resolver.universal.version_factory import T, VersionFactory
+from kataloger.update_resolver.universal.version_updates import VersionUpdates
+
+S = TypeVar("S")
+
+
+class VersionIndex(Generic[T, S]):
+    """
+    Versions of artifact available in one or several sources (repositories), sorted from the oldest to the newest one
+    regardless of the order sources listed them in. Duplicates are removed, each version remembers the first source it
+    was provided by. Stable versions are kept in a separate view, so the newest version suitable for update is found
+    without scanning all versions.
+    """
+
+    def __init__(self, versions: Iterable[tuple[T, S]]):
+        self.__sources: dict[str, S] = {}
+        unique_versions: list[T] = []
+        for version, source in versions:
+            if version.raw not in self.__sources:
+                self.__sources[version.raw] = source
+                unique_versions.append(version)
+
+        self.versions: list[T] = sorted(unique_versions)
+        self.stable_versions: list[T] = [version for version in self.versions if not version.is_pre_release()]
+
+    @classmethod
+    def create(
+        cls,
+        raw_versions: Iterable[tuple[str, S]],
+        version_factory: VersionFactory[T],
+    ) -> "VersionIndex[T, S]":
+        """
+        Creates index of versions which notation is supported by factory, other versions are skipped.
+
+        :param raw_versions: Version strings with their sources, in order of sources preference.
+        :param version_factory: Factory used to create versions.
+        """
+        versions = ((version_factory.try_create(raw_version), source) for raw_version, source in raw_versions)
+        return cls((version, source) for version, source in versions if version is not None)
+
+    def updates_above(self, version: T, *, include_pre_releases: bool) -> Optional[VersionUpdates[T]]:
+        """
+        Finds the newest versions newer than provided one: the latest, the latest with the same major version and the
+        latest with the same major and minor versions. Versions are sorted, so versions with the same major (or major
+        and minor) version as provided one follow it in a row, and each update is found by binary search.
+
+        :return: Found updates, or None if there is no newer version.
+        """
+        versions = self.versions if include_pre_releases else self.stable_versions
+        first_newer = bisect_right(versions, version)
+        if first_newer == len(versions):
+            return None
+
+        components = version.numeric_components()
+        if not components:
+            return VersionUpdates(latest=versions[-1])
+
+        return VersionUpdates(
+            latest=versions[-1],
+            minor=self.__last_with_same_prefix(versions, first_newer, components, size=1),
+            patch=self.__last_with_same_prefix(versions, first_newer, components, size=2),
+        )
+
+    def source_of(self, raw_version: str) -> S:
+        return self.__sources[raw_version]
+
+    def __contains__(self, raw_version: str) -> bool:
+        return raw_version in self.__sources
+
+    def __len__(self) -> int:
+        return len(self.versions)
+
+    @staticmethod
+    def __last_with_same_prefix(versions: list[T], start: int, components: tuple[int, ...], size: int) -> Optional[T]:
+        # Missing components are assumed as 0, as in version comparison.
+        padding = (0,) * size
+        prefix = (components + padding)[:size]
+        low, high = start, len(versions)
+        while low < high:
+            middle = (low + high) // 2
+            if (versions[middle].numeric_components() + padding)[:size] <= prefix:
+                low = middle + 1
+            else:
+                high = middle
+        return versions[low - 1] if low > start else None
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from typing import Generic, Optional
+
+from kataloger.update_resolver.universal.version_factory import T
+
+
+@dataclass(frozen=True)
+class VersionUpdates(Generic[T]):
+    # The newest available version, it may change major version.
+    latest: T
+    # The newest version with the same major version, and with the same major and minor versions.
+    minor: Optional[T] = None
+    patch: Optional[T] = None
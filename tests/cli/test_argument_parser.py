@@ -1,6 +1,8 @@
 from pathlib import Path
 from typing import Optional
 
+import pytest
+
 from kataloger.cli.argument_parser import parse_arguments
 from kataloger.data.catalog import Catalog
 from kataloger.data.configuration_data import ConfigurationData
@@ -94,6 +96,89 @@ class TestArgumentParser:
         assert actual_short_form_arguments == expected_arguments
         assert actual_long_form_arguments == expected_arguments
 
+    def test_should_return_arguments_with_true_no_cache_flag_when_no_cache_argument_passed(self):
+        expected_arguments: KatalogerArguments = self.__create_arguments(
+            configuration_path=None,
+            catalogs=None,
+            verbose=None,
+            suggest_unstable_updates=None,
+            fail_on_updates=None,
+            no_cache=True,
+        )
+        actual_arguments: KatalogerArguments = parse_arguments("--no-cache")
+
+        assert actual_arguments == expected_arguments
+
+    def test_should_return_arguments_with_true_clear_cache_flag_when_clear_cache_argument_passed(self):
+        expected_arguments: KatalogerArguments = self.__create_arguments(
+            configuration_path=None,
+            catalogs=None,
+            verbose=None,
+            suggest_unstable_updates=None,
+            fail_on_updates=None,
+            clear_cache=True,
+        )
+        actual_arguments: KatalogerArguments = parse_arguments("--clear-cache")
+
+        assert actual_arguments == expected_arguments
+
+    def test_should_return_arguments_with_true_stream_updates_flag_when_stream_argument_passed(self):
+        expected_arguments: KatalogerArguments = self.__create_arguments(
+            configuration_path=None,
+            catalogs=None,
+            verbose=None,
+            suggest_unstable_updates=None,
+            fail_on_updates=None,
+            stream_updates=True,
+        )
+        actual_arguments: KatalogerArguments = parse_arguments("--stream")
+
+        assert actual_arguments == expected_arguments
+
+    def test_should_return_arguments_with_true_fail_fast_flag_when_fail_fast_argument_passed(self):
+        expected_arguments: KatalogerArguments = self.__create_arguments(
+            configuration_path=None,
+            catalogs=None,
+            verbose=None,
+            suggest_unstable_updates=None,
+            fail_on_updates=None,
+            fail_fast=True,
+        )
+        actual_arguments: KatalogerArguments = parse_arguments("--fail-fast")
+
+        assert actual_arguments == expected_arguments
+
+    def test_should_return_arguments_with_deadline_when_deadline_argument_passed(self):
+        expected_arguments: KatalogerArguments = self.__create_arguments(
+            configuration_path=None,
+            catalogs=None,
+            verbose=None,
+            suggest_unstable_updates=None,
+            fail_on_updates=None,
+            deadline_seconds=60,
+        )
+        actual_arguments: KatalogerArguments = parse_arguments("--deadline", "60")
+
+        assert actual_arguments == expected_arguments
+
+    @pytest.mark.parametrize("deadline", ["0", "-1", "soon"])
+    def test_should_exit_when_deadline_argument_is_not_positive_integer(self, deadline: str):
+        with pytest.raises(SystemExit):
+            parse_arguments("--deadline", deadline)
+
+    def test_should_return_arguments_with_first_hit_when_first_hit_argument_passed(self):
+        expected_arguments: KatalogerArguments = self.__create_arguments(
+            configuration_path=None,
+            catalogs=None,
+            verbose=None,
+            suggest_unstable_updates=None,
+            fail_on_updates=None,
+            first_hit=True,
+        )
+        actual_arguments: KatalogerArguments = parse_arguments("--first-hit")
+
+        assert actual_arguments == expected_arguments
+
     @staticmethod
     def __create_arguments(
         configuration_path: Optional[Path],
@@ -101,6 +186,13 @@ class TestArgumentParser:
         verbose: Optional[bool],
         suggest_unstable_updates: Optional[bool],
         fail_on_updates: Optional[bool],
+        *,
+        no_cache: bool = False,
+        clear_cache: bool = False,
+        stream_updates: bool = False,
+        fail_fast: bool = False,
+        deadline_seconds: Optional[int] = None,
+        first_hit: bool = False,
     ) -> KatalogerArguments:
         return KatalogerArguments(
             configuration_path=configuration_path,
@@ -111,5 +203,13 @@ class TestArgumentParser:
                 verbose=verbose,
                 suggest_unstable_updates=suggest_unstable_updates,
                 fail_on_updates=fail_on_updates,
+                network_configuration=None,
+                cache_configuration=None,
             ),
+            no_cache=no_cache,
+            clear_cache=clear_cache,
+            stream_updates=stream_updates,
+            fail_fast=fail_fast,
+            deadline_seconds=deadline_seconds,
+            first_hit=first_hit,
         )
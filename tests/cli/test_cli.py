@@ -0,0 +1,192 @@
+from collections.abc import AsyncIterator, Callable
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, call, patch
+
+import pytest
+
+from kataloger.catalog_updater import CatalogUpdater
+from kataloger.cli import cli
+from kataloger.data.artifact.library import Library
+from kataloger.data.artifact_update import ArtifactUpdate
+from kataloger.data.cache_configuration import CacheConfiguration
+from kataloger.data.catalog import Catalog
+from kataloger.data.kataloger_configuration import KatalogerConfiguration
+from kataloger.data.network_configuration import NetworkConfiguration
+from kataloger.data.repository import Repository
+from kataloger.fetcher.circuit_breaker import CircuitBreaker
+from tests.entity_factory import EntityFactory
+
+
+class TestCli:
+    default_catalogs: list[Catalog] = [
+        Catalog(name="first", path=Path("first.versions.toml")),
+        Catalog(name="second", path=Path("second.versions.toml")),
+    ]
+
+    @pytest.mark.asyncio
+    async def test_should_search_all_catalogs_at_once_and_print_updates_in_catalogs_order(self):
+        first_updates: list[ArtifactUpdate] = [EntityFactory.create_artifact_update(name="first")]
+        second_updates: list[ArtifactUpdate] = [EntityFactory.create_artifact_update(name="second")]
+        get_updates_mock: AsyncMock = AsyncMock(return_value=[first_updates, second_updates])
+
+        with patch("kataloger.cli.cli.print_catalog_updates") as print_mock:
+            await self.__run(get_updates_mock, fail_on_updates=False)
+
+        get_updates_mock.assert_awaited_once_with([catalog.path for catalog in self.default_catalogs])
+        printed_updates: list[tuple[str, list[ArtifactUpdate]]] = [
+            (print_call.kwargs["catalog_name"], print_call.kwargs["updates"])
+            for print_call in print_mock.call_args_list
+        ]
+        assert printed_updates == [("first", first_updates), ("second", second_updates)]
+
+    @pytest.mark.asyncio
+    async def test_should_return_error_code_when_fail_on_updates_enabled_and_any_catalog_has_updates(self):
+        get_updates_mock: AsyncMock = AsyncMock(return_value=[[], [EntityFactory.create_artifact_update()]])
+
+        with patch("kataloger.cli.cli.print_catalog_updates"):
+            exit_code: int = await self.__run(get_updates_mock, fail_on_updates=True)
+
+        assert exit_code == 1
+
+    @pytest.mark.asyncio
+    async def test_should_return_success_code_when_fail_on_updates_enabled_and_catalogs_have_no_updates(self):
+        get_updates_mock: AsyncMock = AsyncMock(return_value=[[], []])
+
+        with patch("kataloger.cli.cli.print_catalog_updates"):
+            exit_code: int = await self.__run(get_updates_mock, fail_on_updates=True)
+
+        assert exit_code == 0
+
+    @pytest.mark.asyncio
+    async def test_should_return_success_code_when_fail_on_updates_disabled_and_catalogs_have_updates(self):
+        get_updates_mock: AsyncMock = AsyncMock(return_value=[[EntityFactory.create_artifact_update()], []])
+
+        with patch("kataloger.cli.cli.print_catalog_updates"):
+            exit_code: int = await self.__run(get_updates_mock, fail_on_updates=False)
+
+        assert exit_code == 0
+
+    @pytest.mark.asyncio
+    async def test_should_print_each_update_with_its_catalog_as_soon_as_found_when_stream_updates_enabled(self):
+        first_update: ArtifactUpdate = EntityFactory.create_artifact_update(name="first")
+        second_update: ArtifactUpdate = EntityFactory.create_artifact_update(name="second")
+        first_path, second_path = (catalog.path for catalog in self.default_catalogs)
+        printed_before_search_finished: list[bool] = []
+        search_finished: list[bool] = []
+
+        async def iter_updates(
+            _: CatalogUpdater,
+            catalog_paths: list[Path],
+        ) -> AsyncIterator[tuple[Path, ArtifactUpdate]]:
+            assert catalog_paths == [first_path, second_path]
+            yield second_path, second_update
+            printed_before_search_finished.append(print_mock.call_count == 1)
+            yield first_path, first_update
+            search_finished.append(True)
+
+        with (
+            patch("kataloger.cli.cli.print_artifact_update") as print_mock,
+            patch.object(CatalogUpdater, "iter_catalogs_updates", new=iter_updates),
+        ):
+            exit_code: int = await self.__run(Mock(), fail_on_updates=True, stream_updates=True)
+
+        assert print_mock.call_args_list == [
+            call(second_update, catalog_name="second", verbose=False),
+            call(first_update, catalog_name="first", verbose=False),
+        ]
+        assert printed_before_search_finished == [True]
+        assert search_finished == [True]
+        assert exit_code == 1
+
+    @pytest.mark.asyncio
+    async def test_should_print_artifacts_not_checked_before_deadline_under_their_catalogs(
+        self,
+        capsys: pytest.CaptureFixture[str],
+    ):
+        shared_library: Library = EntityFactory.create_library(name="shared")
+        second_library: Library = EntityFactory.create_library(name="second", coordinates="com.library:second")
+        first_path, second_path = (catalog.path for catalog in self.default_catalogs)
+
+        async def get_updates(updater: CatalogUpdater, catalog_paths: list[Path]) -> list[list[ArtifactUpdate]]:
+            updater.unchecked_artifacts.extend([shared_library, second_library])
+            updater.unchecked_catalog_artifacts = {
+                first_path: [shared_library],
+                second_path: [shared_library, second_library],
+            }
+            return [[] for _ in catalog_paths]
+
+        exit_code: int = await self.__run(get_updates, fail_on_updates=True)
+
+        assert capsys.readouterr().out == (
+            'Search deadline reached, not checked in "first" catalog: shared.\n\n'
+            'Search deadline reached, not checked in "second" catalog: shared, second.\n\n'
+        )
+        assert exit_code == 1
+
+    @pytest.mark.asyncio
+    async def test_should_report_repositories_skipped_after_repeated_failures(self):
+        repository: Repository = EntityFactory.create_repository(name="internal")
+
+        with (
+            patch("kataloger.cli.cli.print_catalog_updates"),
+            patch("kataloger.cli.cli.log_warning") as log_mock,
+            patch.object(CircuitBreaker, "open_repositories", return_value=[repository]),
+        ):
+            await self.__run(AsyncMock(return_value=[[], []]), fail_on_updates=False)
+
+        log_mock.assert_called_once_with(
+            'Repository "internal" was skipped after repeated failures, its updates may be missed.',
+        )
+
+    @pytest.mark.asyncio
+    async def test_should_print_first_update_and_stop_search_when_fail_fast_enabled(self):
+        first_update: ArtifactUpdate = EntityFactory.create_artifact_update(name="first")
+        first_path, second_path = (catalog.path for catalog in self.default_catalogs)
+        search_stopped: list[bool] = []
+
+        async def iter_updates(
+            _: CatalogUpdater,
+            catalog_paths: list[Path],  # noqa: ARG001
+        ) -> AsyncIterator[tuple[Path, ArtifactUpdate]]:
+            try:
+                yield second_path, first_update
+                yield first_path, EntityFactory.create_artifact_update(name="second")
+            finally:
+                search_stopped.append(True)
+
+        with (
+            patch("kataloger.cli.cli.print_artifact_update") as print_mock,
+            patch.object(CatalogUpdater, "iter_catalogs_updates", new=iter_updates),
+        ):
+            exit_code: int = await self.__run(Mock(), fail_on_updates=True, fail_fast=True)
+
+        print_mock.assert_called_once_with(first_update, catalog_name="second", verbose=False)
+        assert search_stopped == [True]
+        assert exit_code == 1
+
+    async def __run(
+        self,
+        get_updates_mock: Callable,
+        *,
+        fail_on_updates: bool,
+        stream_updates: bool = False,
+        fail_fast: bool = False,
+    ) -> int:
+        configuration: KatalogerConfiguration = KatalogerConfiguration(
+            catalogs=self.default_catalogs,
+            library_repositories=[EntityFactory.create_repository()],
+            plugin_repositories=[],
+            verbose=False,
+            suggest_unstable_updates=False,
+            fail_on_updates=fail_on_updates,
+            network_configuration=NetworkConfiguration(),
+            cache_configuration=CacheConfiguration(enabled=False),
+            clear_cache=False,
+            stream_updates=stream_updates,
+            fail_fast=fail_fast,
+        )
+        with (
+            patch("kataloger.cli.cli.get_configuration", return_value=configuration),
+            patch.object(CatalogUpdater, "get_catalogs_updates", new=get_updates_mock),
+        ):
+            return await cli.run()
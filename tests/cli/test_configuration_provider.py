@@ -7,10 +7,12 @@ from yarl import URL
 
 from kataloger.cli import configuration_provider
 from kataloger.cli.configuration_provider import get_catalogs, get_configuration, get_repositories
+from kataloger.data.cache_configuration import CacheConfiguration
 from kataloger.data.catalog import Catalog
 from kataloger.data.configuration_data import ConfigurationData
 from kataloger.data.kataloger_arguments import KatalogerArguments
 from kataloger.data.kataloger_configuration import KatalogerConfiguration
+from kataloger.data.network_configuration import NetworkConfiguration
 from kataloger.data.repository import Repository
 from kataloger.exceptions.kataloger_configuration_exception import KatalogerConfigurationError
 
@@ -207,12 +209,62 @@ class TestConfigurationProvider:
             expected_value=False,
         )
 
+    def test_should_return_conf_cache_configuration_when_it_specified(self):
+        cache_configuration: CacheConfiguration = CacheConfiguration(ttl_seconds=60, max_size_mb=1)
+        self.__test_get_configuration(
+            args_fields_value=None,
+            conf_fields_value=None,
+            expected_value=False,
+            conf_cache_configuration=cache_configuration,
+            expected_cache_configuration=cache_configuration,
+        )
+
+    def test_should_return_disabled_cache_configuration_when_no_cache_argument_passed(self):
+        self.__test_get_configuration(
+            args_fields_value=None,
+            conf_fields_value=None,
+            expected_value=False,
+            no_cache=True,
+            conf_cache_configuration=CacheConfiguration(ttl_seconds=60),
+            expected_cache_configuration=CacheConfiguration(enabled=False, ttl_seconds=60),
+        )
+
+    def test_should_enable_fail_on_updates_when_fail_fast_argument_passed(self):
+        self.__test_get_configuration(
+            args_fields_value=None,
+            conf_fields_value=False,
+            expected_value=False,
+            fail_fast=True,
+        )
+
+    def test_should_override_network_configuration_deadline_when_deadline_argument_passed(self):
+        self.__test_get_configuration(
+            args_fields_value=None,
+            conf_fields_value=None,
+            expected_value=False,
+            deadline_seconds=60,
+        )
+
+    def test_should_enable_first_hit_network_configuration_when_first_hit_argument_passed(self):
+        self.__test_get_configuration(
+            args_fields_value=None,
+            conf_fields_value=None,
+            expected_value=False,
+            first_hit=True,
+        )
+
     def __test_get_configuration(
         self,
         args_fields_value: Optional[bool],
         conf_fields_value: Optional[bool],
         *,
         expected_value: bool,
+        no_cache: bool = False,
+        fail_fast: bool = False,
+        deadline_seconds: Optional[int] = None,
+        first_hit: bool = False,
+        conf_cache_configuration: Optional[CacheConfiguration] = None,
+        expected_cache_configuration: Optional[CacheConfiguration] = None,
     ) -> None:
         args_configuration_data: ConfigurationData = ConfigurationData(
             catalogs=self.default_arg_catalogs,
@@ -221,10 +273,18 @@ class TestConfigurationProvider:
             verbose=args_fields_value,
             suggest_unstable_updates=args_fields_value,
             fail_on_updates=args_fields_value,
+            network_configuration=None,
+            cache_configuration=None,
         )
         arguments: KatalogerArguments = KatalogerArguments(
             configuration_path=None,
             configuration_data=args_configuration_data,
+            no_cache=no_cache,
+            clear_cache=False,
+            stream_updates=False,
+            fail_fast=fail_fast,
+            deadline_seconds=deadline_seconds,
+            first_hit=first_hit,
         )
         configuration_provider.parse_arguments = Mock(return_value=arguments)
         conf_configuration_data: ConfigurationData = ConfigurationData(
@@ -234,6 +294,8 @@ class TestConfigurationProvider:
             verbose=conf_fields_value,
             suggest_unstable_updates=conf_fields_value,
             fail_on_updates=conf_fields_value,
+            network_configuration=None,
+            cache_configuration=conf_cache_configuration,
         )
         configuration_provider.load_configuration_data = Mock(return_value=conf_configuration_data)
 
@@ -243,7 +305,12 @@ class TestConfigurationProvider:
             plugin_repositories=self.default_arg_plugin_repositories,
             verbose=expected_value,
             suggest_unstable_updates=expected_value,
-            fail_on_updates=expected_value,
+            fail_on_updates=expected_value or fail_fast,
+            network_configuration=NetworkConfiguration(deadline_seconds=deadline_seconds, first_hit=first_hit),
+            cache_configuration=expected_cache_configuration or CacheConfiguration(),
+            clear_cache=False,
+            stream_updates=False,
+            fail_fast=fail_fast,
         )
         actual_configuration: KatalogerConfiguration = get_configuration()
 
@@ -0,0 +1,46 @@
+import pytest
+
+from kataloger.cli.update_print_helper import print_artifact_update
+from kataloger.data.artifact_update import ArtifactUpdate
+from tests.entity_factory import EntityFactory
+
+
+class TestUpdatePrintHelper:
+    def test_should_print_minor_and_patch_updates_when_they_differ_from_latest_update(
+        self,
+        capsys: pytest.CaptureFixture[str],
+    ):
+        update: ArtifactUpdate = EntityFactory.create_artifact_update(
+            name="library",
+            current_version="1.2.3",
+            available_version="2.0.0",
+            minor_version="1.3.0",
+            patch_version="1.2.4",
+        )
+
+        print_artifact_update(update, verbose=False)
+
+        assert capsys.readouterr().out == "library 1.2.3 -> 2.0.0 (minor: 1.3.0, patch: 1.2.4)\n"
+
+    def test_should_not_print_smaller_updates_that_equal_bigger_ones(self, capsys: pytest.CaptureFixture[str]):
+        updates: list[ArtifactUpdate] = [
+            EntityFactory.create_artifact_update(
+                name="library",
+                current_version="1.2.3",
+                available_version="2.0.0",
+                minor_version="1.2.4",
+                patch_version="1.2.4",
+            ),
+            EntityFactory.create_artifact_update(
+                name="library",
+                current_version="1.2.3",
+                available_version="1.2.4",
+                minor_version="1.2.4",
+                patch_version="1.2.4",
+            ),
+        ]
+
+        for update in updates:
+            print_artifact_update(update, verbose=False)
+
+        assert capsys.readouterr().out == "library 1.2.3 -> 2.0.0 (patch: 1.2.4)\nlibrary 1.2.3 -> 1.2.4\n"
@@ -0,0 +1,17 @@
+from kataloger.data.artifact.artifact import Artifact
+
+
+class TestArtifact:
+    def test_artifact_group_should_return_group_part_from_coordinates_when_subclass_does_not_define_it(self):
+        artifact: Artifact = TestArtifact.CustomArtifact(
+            name="artifact",
+            coordinates="com.artifact.group:artifact-id",
+            version="1.0.0",
+        )
+        expected_group: str = "com.artifact.group"
+
+        assert artifact.group() == expected_group
+
+    class CustomArtifact(Artifact):
+        def to_path(self) -> str:
+            return self.coordinates.replace(".", "/").replace(":", "/")
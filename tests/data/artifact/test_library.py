@@ -11,3 +11,13 @@ class TestLibrary:
         expected_path_part: str = "com/library/group/library-artifact-id"
 
         assert library.to_path() == expected_path_part
+
+    def test_library_group_should_return_group_part_from_library_coordinates(self):
+        library: Library = Library(
+            name="library",
+            coordinates="com.library.group:library-artifact-id",
+            version="1.0.0",
+        )
+        expected_group: str = "com.library.group"
+
+        assert library.group() == expected_group
@@ -11,3 +11,13 @@ class TestPlugin:
         expected_path_part: str = "com/plugin/artifact-id/com.plugin.artifact-id.gradle.plugin"
 
         assert plugin.to_path() == expected_path_part
+
+    def test_plugin_group_should_return_group_part_from_plugin_coordinates(self):
+        plugin: Plugin = Plugin(
+            name="plugin",
+            coordinates="com.plugin.artifact-id",
+            version="1.0.0",
+        )
+        expected_group: str = "com.plugin.artifact-id"
+
+        assert plugin.group() == expected_group
@@ -0,0 +1,42 @@
+from kataloger.data.content_filter import ContentFilter
+
+
+class TestContentFilter:
+    def test_should_match_any_group_when_there_are_no_patterns(self):
+        content_filter: ContentFilter = ContentFilter()
+
+        assert content_filter.matches("com.library.group")
+
+    def test_should_match_included_group_and_its_subgroups(self):
+        content_filter: ContentFilter = ContentFilter(include_groups=("androidx", "com.google.android"))
+
+        assert content_filter.matches("androidx")
+        assert content_filter.matches("androidx.core")
+        assert content_filter.matches("com.google.android.material")
+        assert not content_filter.matches("com.google")
+        assert not content_filter.matches("androidxtra")
+
+    def test_should_not_match_excluded_group_and_its_subgroups(self):
+        content_filter: ContentFilter = ContentFilter(exclude_groups=("com.internal",))
+
+        assert content_filter.matches("com.library")
+        assert not content_filter.matches("com.internal")
+        assert not content_filter.matches("com.internal.tools")
+
+    def test_should_prefer_exclusion_when_group_is_both_included_and_excluded(self):
+        content_filter: ContentFilter = ContentFilter(
+            include_groups=("com.company",),
+            exclude_groups=("com.company.internal",),
+        )
+
+        assert content_filter.matches("com.company.library")
+        assert not content_filter.matches("com.company.internal")
+
+    def test_should_treat_patterns_literally(self):
+        content_filter: ContentFilter = ContentFilter(include_groups=("com.company",))
+
+        assert not content_filter.matches("comXcompany")
+
+    def test_should_be_equal_when_patterns_are_equal(self):
+        assert ContentFilter(include_groups=("androidx",)) == ContentFilter(include_groups=("androidx",))
+        assert hash(ContentFilter(include_groups=("androidx",))) == hash(ContentFilter(include_groups=("androidx",)))
@@ -2,7 +2,9 @@ from typing import Optional
 
 from yarl import URL
 
+from kataloger.data.content_filter import ContentFilter
 from kataloger.data.repository import Repository
+from tests.entity_factory import EntityFactory
 
 
 class TestRepository:
@@ -34,6 +36,28 @@ class TestRepository:
             expected_requires_authorization=False,
         )
 
+    def test_repository_should_contain_any_artifact_when_it_has_no_content_filter(self):
+        repository: Repository = EntityFactory.create_repository()
+
+        assert repository.may_contain(EntityFactory.create_library(coordinates="com.library:library"))
+
+    def test_repository_should_contain_only_artifacts_accepted_by_content_filter(self):
+        repository: Repository = EntityFactory.create_repository(
+            content_filter=ContentFilter(include_groups=("org.jetbrains.kotlin",)),
+        )
+
+        assert repository.may_contain(EntityFactory.create_library(coordinates="org.jetbrains.kotlin:kotlin-stdlib"))
+        assert repository.may_contain(EntityFactory.create_plugin(coordinates="org.jetbrains.kotlin.jvm"))
+        assert not repository.may_contain(EntityFactory.create_library(coordinates="androidx.core:core"))
+
+    def test_repository_should_list_address_before_its_mirrors(self):
+        repository: Repository = EntityFactory.create_repository(
+            address=URL("https://reposito.ry/"),
+            mirrors=(URL("https://mirr.or/"),),
+        )
+
+        assert repository.addresses() == (URL("https://reposito.ry/"), URL("https://mirr.or/"))
+
     @staticmethod
     def _test_require_authorization(
         user: Optional[str],
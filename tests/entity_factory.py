@@ -5,6 +5,7 @@ from yarl import URL
 from kataloger.data.artifact.library import Library
 from kataloger.data.artifact.plugin import Plugin
 from kataloger.data.artifact_update import ArtifactUpdate
+from kataloger.data.content_filter import ContentFilter
 from kataloger.data.repository import Repository
 
 
@@ -15,12 +16,16 @@ class EntityFactory:
         address: URL = "https://reposito.ry/",
         user: Optional[str] = None,
         password: Optional[str] = None,
+        content_filter: Optional[ContentFilter] = None,
+        mirrors: tuple[URL, ...] = (),
     ) -> Repository:
         return Repository(
             name=name,
             address=address,
             user=user,
             password=password,
+            content_filter=content_filter,
+            mirrors=mirrors,
         )
 
     @staticmethod
@@ -53,10 +58,14 @@ class EntityFactory:
         update_repository_name: str = "update_repository_name",
         current_version: str = "0.1.0",
         available_version: str = "1.0.0",
+        minor_version: Optional[str] = None,
+        patch_version: Optional[str] = None,
     ) -> ArtifactUpdate:
         return ArtifactUpdate(
             name=name,
             update_repository_name=update_repository_name,
             current_version=current_version,
             available_version=available_version,
+            minor_version=minor_version,
+            patch_version=patch_version,
         )
@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+
+from kataloger.fetcher.adaptive_limiter import AdaptiveLimiter
+
+
+class TestAdaptiveLimiter:
+
+    def test_should_raise_exception_when_limiter_bounds_are_incorrect(self):
+        with pytest.raises(ValueError, match="Incorrect limiter bounds"):
+            AdaptiveLimiter(max_limit=1, min_limit=2)
+
+    @pytest.mark.asyncio
+    async def test_should_start_with_max_limit(self):
+        limiter: AdaptiveLimiter = AdaptiveLimiter(max_limit=8)
+
+        assert limiter.limit == 8
+
+    @pytest.mark.asyncio
+    async def test_should_decrease_limit_multiplicatively_on_overload(self):
+        limiter: AdaptiveLimiter = AdaptiveLimiter(max_limit=8)
+
+        limiter.on_overload(started_at=self._now())
+
+        assert limiter.limit == 4
+
+    @pytest.mark.asyncio
+    async def test_should_decrease_limit_once_for_requests_started_before_last_decrease(self):
+        limiter: AdaptiveLimiter = AdaptiveLimiter(max_limit=8)
+        started_at: float = self._now()
+
+        limiter.on_overload(started_at)
+        limiter.on_overload(started_at)
+        limiter.on_overload(started_at)
+
+        assert limiter.limit == 4
+
+    @pytest.mark.asyncio
+    async def test_should_not_decrease_limit_below_min_limit(self):
+        limiter: AdaptiveLimiter = AdaptiveLimiter(max_limit=4, min_limit=2)
+
+        for _ in range(5):
+            await asyncio.sleep(0.001)
+            limiter.on_overload(started_at=self._now())
+
+        assert limiter.limit == 2
+
+    @pytest.mark.asyncio
+    async def test_should_increase_limit_additively_on_success_up_to_max_limit(self):
+        limiter: AdaptiveLimiter = AdaptiveLimiter(max_limit=8)
+        limiter.on_overload(started_at=self._now())
+        await asyncio.sleep(0.001)
+
+        limiter.on_success(started_at=self._now(), latency=0.1)
+        assert limiter.limit == pytest.approx(4.25)
+
+        for _ in range(100):
+            limiter.on_success(started_at=self._now(), latency=0.1)
+        assert limiter.limit == 8
+
+    @pytest.mark.asyncio
+    async def test_should_decrease_limit_when_latency_grows_significantly(self):
+        limiter: AdaptiveLimiter = AdaptiveLimiter(max_limit=8, latency_tolerance=2)
+        for _ in range(100):
+            limiter.on_success(started_at=self._now(), latency=0.1)
+        await asyncio.sleep(0.001)
+
+        for _ in range(50):
+            limiter.on_success(started_at=self._now(), latency=1)
+
+        assert limiter.limit < 8
+
+    @pytest.mark.asyncio
+    async def test_should_not_decrease_limit_when_fast_and_slow_responses_are_mixed(self):
+        limiter: AdaptiveLimiter = AdaptiveLimiter(max_limit=16)
+        # Cheap responses (404, 304) alternate with full metadata downloads, including long series of both.
+        latencies: list[float] = ([0.005] * 6 + [0.1] * 4) * 20 + ([0.008] * 3 + [0.06] * 2) * 40
+
+        for latency in latencies:
+            await asyncio.sleep(0)
+            limiter.on_success(started_at=self._now(), latency=latency)
+
+        assert limiter.limit == 16
+
+    @pytest.mark.asyncio
+    async def test_should_not_allow_more_requests_in_flight_than_limit(self):
+        limiter: AdaptiveLimiter = AdaptiveLimiter(max_limit=2)
+        await limiter.acquire()
+        await limiter.acquire()
+
+        third_request = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0.01)
+        assert not third_request.done()
+
+        await limiter.release()
+        await asyncio.wait_for(third_request, timeout=1)
+        assert limiter.in_flight == 2
+
+    @staticmethod
+    def _now() -> float:
+        return asyncio.get_running_loop().time()
@@ -0,0 +1,43 @@
+import pytest
+
+from kataloger.data.repository import Repository
+from kataloger.fetcher.circuit_breaker import CircuitBreaker
+from tests.entity_factory import EntityFactory
+
+
+class TestCircuitBreaker:
+    default_repository: Repository = EntityFactory.create_repository(name="repository")
+    other_repository: Repository = EntityFactory.create_repository(name="other_repository")
+
+    def test_should_raise_exception_when_number_of_failures_is_incorrect(self):
+        with pytest.raises(ValueError, match="Incorrect number of failures"):
+            CircuitBreaker(max_failures=0)
+
+    def test_should_open_circuit_only_for_repository_that_failed_max_failures_times_in_a_row(self):
+        circuit_breaker: CircuitBreaker = CircuitBreaker(max_failures=2)
+
+        circuit_breaker.on_failure(self.default_repository)
+        opened_after_first_failure: bool = circuit_breaker.is_open(self.default_repository)
+        circuit_breaker.on_failure(self.default_repository)
+
+        assert not opened_after_first_failure
+        assert circuit_breaker.is_open(self.default_repository)
+        assert not circuit_breaker.is_open(self.other_repository)
+        assert circuit_breaker.open_repositories() == [self.default_repository]
+
+    def test_should_reset_failures_when_repository_responded_successfully(self):
+        circuit_breaker: CircuitBreaker = CircuitBreaker(max_failures=2)
+
+        circuit_breaker.on_failure(self.default_repository)
+        circuit_breaker.on_success(self.default_repository)
+        circuit_breaker.on_failure(self.default_repository)
+
+        assert not circuit_breaker.is_open(self.default_repository)
+
+    def test_should_keep_circuit_open_when_in_flight_request_succeeded_after_circuit_opened(self):
+        circuit_breaker: CircuitBreaker = CircuitBreaker(max_failures=1)
+
+        circuit_breaker.on_failure(self.default_repository)
+        circuit_breaker.on_success(self.default_repository)
+
+        assert circuit_breaker.is_open(self.default_repository)
@@ -0,0 +1,39 @@
+import pytest
+from yarl import URL
+
+from kataloger.fetcher.latency_tracker import DEFAULT_HEDGE_DELAY_SECONDS, LatencyTracker
+
+
+class TestLatencyTracker:
+    repository_address: URL = URL("https://reposito.ry/")
+    mirror_address: URL = URL("https://mirr.or/")
+    other_mirror_address: URL = URL("https://other.mirr.or/")
+
+    def test_should_raise_exception_when_percentile_is_incorrect(self):
+        with pytest.raises(ValueError, match="Incorrect latency percentile"):
+            LatencyTracker(percentile=100)
+
+    def test_should_order_addresses_by_latency_and_keep_unknown_addresses_in_declaration_order(self):
+        latency_tracker: LatencyTracker = LatencyTracker(percentile=90)
+        latency_tracker.record(self.repository_address, 0.5)
+        latency_tracker.record(self.other_mirror_address, 0.1)
+
+        actual_order: list[URL] = latency_tracker.order(
+            (self.repository_address, self.mirror_address, self.other_mirror_address),
+        )
+
+        assert actual_order == [self.other_mirror_address, self.repository_address, self.mirror_address]
+
+    def test_should_return_default_hedge_delay_when_address_has_not_enough_latency_samples(self):
+        latency_tracker: LatencyTracker = LatencyTracker(percentile=90)
+        latency_tracker.record(self.repository_address, 0.1)
+
+        assert latency_tracker.hedge_delay(self.repository_address) == DEFAULT_HEDGE_DELAY_SECONDS
+        assert latency_tracker.hedge_delay(self.mirror_address) == DEFAULT_HEDGE_DELAY_SECONDS
+
+    def test_should_return_latency_percentile_as_hedge_delay_when_address_has_enough_latency_samples(self):
+        latency_tracker: LatencyTracker = LatencyTracker(percentile=90)
+        for latency in range(1, 11):
+            latency_tracker.record(self.repository_address, latency / 10)
+
+        assert latency_tracker.hedge_delay(self.repository_address) == 1.0
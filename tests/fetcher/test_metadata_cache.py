@@ -0,0 +1,314 @@
+import sqlite3
+from pathlib import Path
+from typing import Optional
+from unittest.mock import patch
+
+from yarl import URL
+
+from kataloger.data.artifact.library import Library
+from kataloger.data.artifact_metadata import ArtifactMetadata
+from kataloger.data.cache_configuration import CacheConfiguration
+from kataloger.data.cached_metadata import CachedMetadata
+from kataloger.data.repository import Repository
+from kataloger.fetcher.metadata_cache import MetadataCache
+from tests.entity_factory import EntityFactory
+
+
+class TestMetadataCache:
+    default_repository: Repository = EntityFactory.create_repository(address=URL("https://reposito.ry/"))
+    default_metadata: ArtifactMetadata = ArtifactMetadata(
+        latest_version="1.1.0",
+        release_version="1.1.0",
+        versions=["1.0.0", "1.1.0"],
+        last_updated=20240101000000,
+    )
+
+    def test_should_return_none_when_there_is_no_cached_metadata(self, tmp_path: Path):
+        library: Library = EntityFactory.create_library()
+        with self._create_cache(tmp_path) as cache:
+            cached_metadata: Optional[CachedMetadata] = cache.get(self.default_repository, library)
+
+        assert cached_metadata is None
+
+    def test_should_persist_metadata_between_cache_instances(self, tmp_path: Path):
+        library: Library = EntityFactory.create_library()
+        with self._create_cache(tmp_path) as cache:
+            cache.put(self.default_repository, library, self.default_metadata)
+
+        with self._create_cache(tmp_path) as cache:
+            cached_metadata: Optional[CachedMetadata] = cache.get(self.default_repository, library)
+
+        assert cached_metadata.metadata == self.default_metadata
+
+    def test_should_distinguish_metadata_by_repository_address_and_artifact_path(self, tmp_path: Path):
+        library: Library = EntityFactory.create_library(coordinates="com.library:first")
+        other_library: Library = EntityFactory.create_library(coordinates="com.library:second")
+        other_repository: Repository = EntityFactory.create_repository(address=URL("https://other.reposito.ry/"))
+        with self._create_cache(tmp_path) as cache:
+            cache.put(self.default_repository, library, self.default_metadata)
+
+            assert cache.get(self.default_repository, other_library) is None
+            assert cache.get(other_repository, library) is None
+
+    def test_should_consider_metadata_fresh_only_within_ttl(self, tmp_path: Path):
+        library: Library = EntityFactory.create_library()
+        with self._create_cache(tmp_path, ttl_seconds=60) as cache:
+            with patch("kataloger.fetcher.metadata_cache.time.time", return_value=1000):
+                cache.put(self.default_repository, library, self.default_metadata)
+                cached_metadata: CachedMetadata = cache.get(self.default_repository, library)
+
+            with patch("kataloger.fetcher.metadata_cache.time.time", return_value=1059):
+                assert cache.is_fresh(cached_metadata)
+            with patch("kataloger.fetcher.metadata_cache.time.time", return_value=1060):
+                assert not cache.is_fresh(cached_metadata)
+
+    def test_should_persist_response_validators_along_with_metadata(self, tmp_path: Path):
+        library: Library = EntityFactory.create_library()
+        with self._create_cache(tmp_path) as cache:
+            cache.put(
+                self.default_repository,
+                library,
+                self.default_metadata,
+                etag='"abc"',
+                last_modified="Mon, 01 Jan 2024 00:00:00 GMT",
+            )
+
+        with self._create_cache(tmp_path) as cache:
+            cached_metadata: Optional[CachedMetadata] = cache.get(self.default_repository, library)
+
+        assert cached_metadata.etag == '"abc"'
+        assert cached_metadata.last_modified == "Mon, 01 Jan 2024 00:00:00 GMT"
+
+    def test_should_update_fetch_time_when_metadata_refreshed(self, tmp_path: Path):
+        library: Library = EntityFactory.create_library()
+        with self._create_cache(tmp_path, ttl_seconds=60) as cache:
+            with patch("kataloger.fetcher.metadata_cache.time.time", return_value=1000):
+                cache.put(self.default_repository, library, self.default_metadata, etag='"abc"')
+            with patch("kataloger.fetcher.metadata_cache.time.time", return_value=2000):
+                cache.refresh(self.default_repository, library)
+                cached_metadata: CachedMetadata = cache.get(self.default_repository, library)
+
+                assert cache.is_fresh(cached_metadata)
+            assert cached_metadata.metadata == self.default_metadata
+            assert cached_metadata.etag == '"abc"'
+
+    def test_should_consider_artifact_missing_only_within_negative_ttl(self, tmp_path: Path):
+        library: Library = EntityFactory.create_library()
+        with self._create_cache(tmp_path, negative_ttl_seconds=60) as cache:
+            with patch("kataloger.fetcher.metadata_cache.time.time", return_value=1000):
+                cache.put_missing(self.default_repository, library)
+
+            with patch("kataloger.fetcher.metadata_cache.time.time", return_value=1059):
+                assert cache.is_missing(self.default_repository, library)
+            with patch("kataloger.fetcher.metadata_cache.time.time", return_value=1060):
+                assert not cache.is_missing(self.default_repository, library)
+
+    def test_should_persist_missing_artifacts_between_cache_instances(self, tmp_path: Path):
+        library: Library = EntityFactory.create_library()
+        other_repository: Repository = EntityFactory.create_repository(address=URL("https://other.reposito.ry/"))
+        with self._create_cache(tmp_path) as cache:
+            cache.put_missing(self.default_repository, library)
+
+        with self._create_cache(tmp_path) as cache:
+            assert cache.is_missing(self.default_repository, library)
+            assert not cache.is_missing(other_repository, library)
+
+    def test_should_forget_missing_artifact_when_its_metadata_stored(self, tmp_path: Path):
+        library: Library = EntityFactory.create_library()
+        with self._create_cache(tmp_path) as cache:
+            cache.put_missing(self.default_repository, library)
+            cache.put(self.default_repository, library, self.default_metadata)
+
+            assert not cache.is_missing(self.default_repository, library)
+
+    def test_should_forget_metadata_when_artifact_became_missing(self, tmp_path: Path):
+        library: Library = EntityFactory.create_library()
+        with self._create_cache(tmp_path) as cache:
+            cache.put(self.default_repository, library, self.default_metadata)
+            cache.put_missing(self.default_repository, library)
+
+            assert cache.get(self.default_repository, library) is None
+
+    def test_should_not_consider_group_hosted_elsewhere_when_it_was_not_probed(self, tmp_path: Path):
+        library: Library = EntityFactory.create_library()
+        with self._create_cache(tmp_path) as cache:
+            assert not cache.is_group_hosted_elsewhere(self.default_repository, library, [self.default_repository])
+
+    def test_should_consider_group_hosted_elsewhere_when_it_found_only_in_other_repository(self, tmp_path: Path):
+        library: Library = EntityFactory.create_library(coordinates="androidx.core:core")
+        other_library: Library = EntityFactory.create_library(coordinates="androidx.core:core-ktx")
+        other_repository: Repository = EntityFactory.create_repository(address=URL("https://other.reposito.ry/"))
+        repositories: list[Repository] = [self.default_repository, other_repository]
+        with self._create_cache(tmp_path) as cache:
+            cache.put_group_probe(self.default_repository, library, found=False)
+            cache.put_group_probe(other_repository, library, found=True)
+
+        with self._create_cache(tmp_path) as cache:
+            assert cache.is_group_hosted_elsewhere(self.default_repository, other_library, repositories)
+            assert not cache.is_group_hosted_elsewhere(other_repository, other_library, repositories)
+
+    def test_should_not_consider_group_hosted_elsewhere_when_hosting_repository_is_not_searched(self, tmp_path: Path):
+        library: Library = EntityFactory.create_library()
+        other_repository: Repository = EntityFactory.create_repository(address=URL("https://other.reposito.ry/"))
+        third_repository: Repository = EntityFactory.create_repository(address=URL("https://third.reposito.ry/"))
+        with self._create_cache(tmp_path) as cache:
+            cache.put_group_probe(self.default_repository, library, found=False)
+            cache.put_group_probe(other_repository, library, found=True)
+
+        with self._create_cache(tmp_path) as cache:
+            assert not cache.is_group_hosted_elsewhere(
+                self.default_repository,
+                library,
+                [self.default_repository, third_repository],
+            )
+
+    def test_should_not_apply_group_probes_made_in_the_same_run(self, tmp_path: Path):
+        library: Library = EntityFactory.create_library()
+        other_repository: Repository = EntityFactory.create_repository(address=URL("https://other.reposito.ry/"))
+        repositories: list[Repository] = [self.default_repository, other_repository]
+        with self._create_cache(tmp_path) as cache:
+            cache.put_group_probe(self.default_repository, library, found=False)
+            cache.put_group_probe(other_repository, library, found=True)
+
+            assert not cache.is_group_hosted_elsewhere(self.default_repository, library, repositories)
+
+    def test_should_not_consider_group_hosted_elsewhere_when_it_was_not_found_anywhere(self, tmp_path: Path):
+        library: Library = EntityFactory.create_library()
+        other_repository: Repository = EntityFactory.create_repository(address=URL("https://other.reposito.ry/"))
+        repositories: list[Repository] = [self.default_repository, other_repository]
+        with self._create_cache(tmp_path) as cache:
+            cache.put_group_probe(self.default_repository, library, found=False)
+            cache.put_group_probe(other_repository, library, found=False)
+
+        with self._create_cache(tmp_path) as cache:
+            assert not cache.is_group_hosted_elsewhere(self.default_repository, library, repositories)
+
+    def test_should_keep_group_hosted_when_other_artifact_of_group_was_not_found(self, tmp_path: Path):
+        library: Library = EntityFactory.create_library(coordinates="com.library:first")
+        other_library: Library = EntityFactory.create_library(coordinates="com.library:second")
+        other_repository: Repository = EntityFactory.create_repository(address=URL("https://other.reposito.ry/"))
+        repositories: list[Repository] = [self.default_repository, other_repository]
+        with self._create_cache(tmp_path) as cache:
+            cache.put_group_probe(self.default_repository, library, found=True)
+            cache.put_group_probe(self.default_repository, other_library, found=False)
+            cache.put_group_probe(other_repository, library, found=True)
+
+        with self._create_cache(tmp_path) as cache:
+            assert not cache.is_group_hosted_elsewhere(self.default_repository, library, repositories)
+
+    def test_should_reprobe_group_when_reprobe_interval_passed(self, tmp_path: Path):
+        library: Library = EntityFactory.create_library()
+        other_repository: Repository = EntityFactory.create_repository(address=URL("https://other.reposito.ry/"))
+        repositories: list[Repository] = [self.default_repository, other_repository]
+        time_patch = patch("kataloger.fetcher.metadata_cache.time.time", return_value=1000)
+        with self._create_cache(tmp_path, affinity_reprobe_seconds=60) as cache, time_patch:
+            cache.put_group_probe(self.default_repository, library, found=False)
+            cache.put_group_probe(other_repository, library, found=True)
+
+        with self._create_cache(tmp_path, affinity_reprobe_seconds=60) as cache:
+            with patch("kataloger.fetcher.metadata_cache.time.time", return_value=1059):
+                assert cache.is_group_hosted_elsewhere(self.default_repository, library, repositories)
+            with patch("kataloger.fetcher.metadata_cache.time.time", return_value=1060):
+                assert not cache.is_group_hosted_elsewhere(self.default_repository, library, repositories)
+
+    def test_should_remove_all_metadata_when_cache_cleared(self, tmp_path: Path):
+        library: Library = EntityFactory.create_library()
+        other_library: Library = EntityFactory.create_library(coordinates="com.library:other")
+        other_repository: Repository = EntityFactory.create_repository(address=URL("https://other.reposito.ry/"))
+        with self._create_cache(tmp_path) as cache:
+            cache.put(self.default_repository, library, self.default_metadata)
+            cache.put_missing(self.default_repository, other_library)
+            cache.put_group_probe(self.default_repository, library, found=False)
+            cache.put_group_probe(other_repository, library, found=True)
+            cache.put_resolution(library, has_update=True)
+
+        with self._create_cache(tmp_path) as cache:
+            cache.clear()
+
+            assert cache.get(self.default_repository, library) is None
+            assert not cache.is_missing(self.default_repository, other_library)
+            assert not cache.is_group_hosted_elsewhere(
+                self.default_repository,
+                library,
+                [self.default_repository, other_repository],
+            )
+            assert not cache.had_update(library)
+
+    def test_should_remember_artifact_had_update_until_it_resolved_without_update(self, tmp_path: Path):
+        library: Library = EntityFactory.create_library()
+        other_library: Library = EntityFactory.create_library(coordinates="com.library:other")
+        with self._create_cache(tmp_path) as cache:
+            cache.put_resolution(library, has_update=True)
+        with self._create_cache(tmp_path) as cache:
+            had_update_before_resolution: bool = cache.had_update(library)
+            cache.put_resolution(library, has_update=False)
+
+            assert had_update_before_resolution
+            assert not cache.had_update(library)
+            assert not cache.had_update(other_library)
+
+    def test_should_evict_least_recently_used_metadata_when_cache_exceeds_max_size(self, tmp_path: Path):
+        libraries: list[Library] = [
+            EntityFactory.create_library(coordinates=f"com.library:library{index}") for index in range(3)
+        ]
+        large_metadata: ArtifactMetadata = ArtifactMetadata(
+            latest_version="1.0.0",
+            release_version="1.0.0",
+            versions=["1.0.0"] * 45_000,  # Approximately 0.4 MB
+            last_updated=0,
+        )
+        with self._create_cache(tmp_path, max_size_mb=1) as cache:
+            for timestamp, library in enumerate(libraries):
+                with patch("kataloger.fetcher.metadata_cache.time.time", return_value=timestamp):
+                    cache.put(self.default_repository, library, large_metadata)
+            with patch("kataloger.fetcher.metadata_cache.time.time", return_value=10):
+                # Access refreshes the first library, so the second one becomes least recently used.
+                cache.get(self.default_repository, libraries[0])
+
+        with self._create_cache(tmp_path, max_size_mb=1) as cache:
+            assert cache.get(self.default_repository, libraries[0]) is not None
+            assert cache.get(self.default_repository, libraries[1]) is None
+            assert cache.get(self.default_repository, libraries[2]) is not None
+
+    def test_should_drop_cache_content_when_schema_version_changed(self, tmp_path: Path):
+        library: Library = EntityFactory.create_library()
+        with self._create_cache(tmp_path) as cache:
+            cache.put(self.default_repository, library, self.default_metadata)
+        connection = sqlite3.connect(tmp_path / "cache.sqlite3")
+        connection.execute("PRAGMA user_version = 0")
+        connection.close()
+
+        with self._create_cache(tmp_path) as cache:
+            assert cache.get(self.default_repository, library) is None
+
+    def test_should_not_hold_database_lock_between_cache_accesses(self, tmp_path: Path):
+        library: Library = EntityFactory.create_library()
+        with self._create_cache(tmp_path) as cache:
+            cache.put(self.default_repository, library, self.default_metadata)
+            cache.get(self.default_repository, library)
+            other_connection = sqlite3.connect(tmp_path / "cache.sqlite3", timeout=0)
+            try:
+                with other_connection:
+                    other_connection.execute("DELETE FROM metadata")
+            finally:
+                other_connection.close()
+
+            assert cache.get(self.default_repository, library) is None
+
+    @staticmethod
+    def _create_cache(
+        directory: Path,
+        ttl_seconds: int = 3600,
+        max_size_mb: int = 32,
+        negative_ttl_seconds: int = 900,
+        affinity_reprobe_seconds: int = 604800,
+    ) -> MetadataCache:
+        return MetadataCache(
+            path=directory / "cache.sqlite3",
+            configuration=CacheConfiguration(
+                ttl_seconds=ttl_seconds,
+                max_size_mb=max_size_mb,
+                negative_ttl_seconds=negative_ttl_seconds,
+                affinity_reprobe_seconds=affinity_reprobe_seconds,
+            ),
+        )
@@ -0,0 +1,683 @@
+import asyncio
+import sqlite3
+from collections.abc import AsyncIterator
+from typing import Optional
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+from aiohttp import BasicAuth, ClientConnectionError, ClientTimeout
+from multidict import CIMultiDict
+from yarl import URL
+
+from kataloger.data.artifact.library import Library
+from kataloger.data.cached_metadata import CachedMetadata
+from kataloger.data.metadata_repository_info import MetadataRepositoryInfo
+from kataloger.data.network_configuration import NetworkConfiguration
+from kataloger.data.repository import Repository
+from kataloger.fetcher.metadata_fetcher import MetadataFetcher
+from tests.entity_factory import EntityFactory
+
+
+class TestMetadataFetcher:
+    default_metadata: str = """\
+        <metadata>
+        <versioning>
+            <versions>
+                <version>1.0.0</version>
+            </versions>
+        </versioning>
+        </metadata>
+    """
+
+    @pytest.mark.asyncio
+    async def test_should_request_metadata_with_repository_credentials_when_repository_requires_authorization(self):
+        library: Library = EntityFactory.create_library()
+        repository: Repository = EntityFactory.create_repository(
+            address=URL("https://reposito.ry/"),
+            user="user",
+            password="password",
+        )
+        session: Mock = self._create_session_mock(status=200, text=self.default_metadata)
+        fetcher: MetadataFetcher = MetadataFetcher(session)
+
+        metadata: Optional[MetadataRepositoryInfo] = await fetcher.get_artifact_metadata(
+            repository,
+            library,
+            verbose=False,
+        )
+
+        assert metadata.repository == repository
+        assert metadata.metadata.versions == ["1.0.0"]
+        session.get.assert_called_once_with(
+            URL("https://reposito.ry/com/library/group/library/maven-metadata.xml"),
+            auth=BasicAuth(login="user", password="password"),
+            headers={},
+            timeout=ClientTimeout(total=None, sock_connect=10, sock_read=30),
+        )
+
+    @pytest.mark.asyncio
+    async def test_should_send_repository_credentials_only_to_mirrors_with_the_same_origin(self):
+        library: Library = EntityFactory.create_library()
+        repository: Repository = EntityFactory.create_repository(
+            address=URL("https://reposito.ry/releases/"),
+            user="user",
+            password="password",
+            mirrors=(URL("https://reposito.ry/mirror/"), URL("https://public.mirr.or/")),
+        )
+        session: Mock = self._create_session_mock(status=200, text=self.default_metadata)
+        request_context: Mock = session.get.return_value
+        request_context.__aenter__ = AsyncMock(
+            side_effect=[
+                ClientConnectionError("Connection refused"),
+                ClientConnectionError("Connection refused"),
+                request_context.__aenter__.return_value,
+            ],
+        )
+        fetcher: MetadataFetcher = MetadataFetcher(session, network_configuration=NetworkConfiguration(max_retries=0))
+
+        metadata: Optional[MetadataRepositoryInfo] = await fetcher.get_artifact_metadata(
+            repository,
+            library,
+            verbose=False,
+        )
+
+        assert metadata.metadata.versions == ["1.0.0"]
+        assert [(call.args[0].host, call.kwargs["auth"]) for call in session.get.call_args_list] == [
+            ("reposito.ry", BasicAuth(login="user", password="password")),
+            ("reposito.ry", BasicAuth(login="user", password="password")),
+            ("public.mirr.or", None),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_should_request_metadata_without_credentials_when_repository_does_not_require_authorization(self):
+        library: Library = EntityFactory.create_library()
+        repository: Repository = EntityFactory.create_repository(address=URL("https://reposito.ry/"))
+        session: Mock = self._create_session_mock(status=200, text=self.default_metadata)
+        fetcher: MetadataFetcher = MetadataFetcher(session)
+
+        await fetcher.get_artifact_metadata(repository, library, verbose=False)
+
+        session.get.assert_called_once_with(
+            URL("https://reposito.ry/com/library/group/library/maven-metadata.xml"),
+            auth=None,
+            headers={},
+            timeout=ClientTimeout(total=None, sock_connect=10, sock_read=30),
+        )
+
+    @pytest.mark.asyncio
+    async def test_should_return_none_when_repository_responds_with_not_ok_status(self):
+        library: Library = EntityFactory.create_library()
+        repository: Repository = EntityFactory.create_repository(address=URL("https://reposito.ry/"))
+        session: Mock = self._create_session_mock(status=404, text="")
+        fetcher: MetadataFetcher = MetadataFetcher(session)
+
+        metadata: Optional[MetadataRepositoryInfo] = await fetcher.get_artifact_metadata(
+            repository,
+            library,
+            verbose=False,
+        )
+
+        assert metadata is None
+
+    @pytest.mark.asyncio
+    async def test_should_return_none_when_repository_responds_with_unparsable_metadata(self):
+        library: Library = EntityFactory.create_library()
+        repository: Repository = EntityFactory.create_repository(address=URL("https://reposito.ry/"))
+        cache: Mock = self._create_cache_mock(cached_metadata=None, is_fresh=False)
+        session: Mock = self._create_session_mock(status=200, text="<html>Not found</html>")
+        fetcher: MetadataFetcher = MetadataFetcher(session, metadata_cache=cache)
+
+        metadata: Optional[MetadataRepositoryInfo] = await fetcher.get_artifact_metadata(
+            repository,
+            library,
+            verbose=False,
+        )
+
+        assert metadata is None
+        cache.put.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_should_not_close_provided_session(self):
+        session: Mock = self._create_session_mock(status=200, text=self.default_metadata)
+
+        async with MetadataFetcher(session):
+            pass
+
+        session.close.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_should_reuse_and_close_own_session(self):
+        library: Library = EntityFactory.create_library()
+        repository: Repository = EntityFactory.create_repository(address=URL("https://reposito.ry/"))
+        fetcher: MetadataFetcher = MetadataFetcher()
+        session: Mock = self._create_session_mock(status=404, text="")
+        # Pretend that fetcher created the session by itself.
+        fetcher._MetadataFetcher__session = session  # noqa: SLF001
+
+        async with fetcher:
+            await fetcher.get_artifact_metadata(repository, library, verbose=False)
+            await fetcher.get_artifact_metadata(repository, library, verbose=False)
+
+        assert session.get.call_count == 2
+        session.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_should_return_fresh_cached_metadata_without_request(self):
+        library: Library = EntityFactory.create_library()
+        repository: Repository = EntityFactory.create_repository(address=URL("https://reposito.ry/"))
+        cached_metadata: CachedMetadata = CachedMetadata(metadata=Mock(), fetched_at=0)
+        cache: Mock = self._create_cache_mock(cached_metadata, is_fresh=True)
+        session: Mock = self._create_session_mock(status=200, text=self.default_metadata)
+        fetcher: MetadataFetcher = MetadataFetcher(session, metadata_cache=cache)
+
+        metadata: Optional[MetadataRepositoryInfo] = await fetcher.get_artifact_metadata(
+            repository,
+            library,
+            verbose=False,
+        )
+
+        assert metadata == MetadataRepositoryInfo(repository, cached_metadata.metadata)
+        session.get.assert_not_called()
+        cache.put.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_should_request_and_store_metadata_when_cached_metadata_is_stale(self):
+        library: Library = EntityFactory.create_library()
+        repository: Repository = EntityFactory.create_repository(address=URL("https://reposito.ry/"))
+        cache: Mock = self._create_cache_mock(CachedMetadata(metadata=Mock(), fetched_at=0), is_fresh=False)
+        session: Mock = self._create_session_mock(status=200, text=self.default_metadata)
+        fetcher: MetadataFetcher = MetadataFetcher(session, metadata_cache=cache)
+
+        metadata: Optional[MetadataRepositoryInfo] = await fetcher.get_artifact_metadata(
+            repository,
+            library,
+            verbose=False,
+        )
+
+        assert metadata.metadata.versions == ["1.0.0"]
+        session.get.assert_called_once()
+        cache.put.assert_called_once_with(repository, library, metadata.metadata, etag=None, last_modified=None)
+
+    @pytest.mark.asyncio
+    async def test_should_request_metadata_without_cache_when_cache_is_unavailable(self):
+        library: Library = EntityFactory.create_library()
+        repository: Repository = EntityFactory.create_repository(address=URL("https://reposito.ry/"))
+        cache: Mock = self._create_cache_mock(cached_metadata=None, is_fresh=False)
+        cache.get.side_effect = sqlite3.OperationalError("database is locked")
+        session: Mock = self._create_session_mock(status=200, text=self.default_metadata)
+        fetcher: MetadataFetcher = MetadataFetcher(session, metadata_cache=cache)
+
+        metadata: Optional[MetadataRepositoryInfo] = await fetcher.get_artifact_metadata(
+            repository,
+            library,
+            verbose=False,
+        )
+
+        assert metadata.metadata.versions == ["1.0.0"]
+        assert fetcher.metadata_cache is None
+        session.get.assert_called_once()
+        cache.put.assert_not_called()
+        cache.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_should_send_validators_and_store_new_ones_when_cached_metadata_is_stale(self):
+        library: Library = EntityFactory.create_library()
+        repository: Repository = EntityFactory.create_repository(address=URL("https://reposito.ry/"))
+        cached_metadata: CachedMetadata = CachedMetadata(
+            metadata=Mock(),
+            fetched_at=0,
+            etag='"old"',
+            last_modified="Mon, 01 Jan 2024 00:00:00 GMT",
+        )
+        cache: Mock = self._create_cache_mock(cached_metadata, is_fresh=False)
+        session: Mock = self._create_session_mock(
+            status=200,
+            text=self.default_metadata,
+            headers={"ETag": '"new"', "Last-Modified": "Tue, 02 Jan 2024 00:00:00 GMT"},
+        )
+        fetcher: MetadataFetcher = MetadataFetcher(session, metadata_cache=cache)
+
+        metadata: Optional[MetadataRepositoryInfo] = await fetcher.get_artifact_metadata(
+            repository,
+            library,
+            verbose=False,
+        )
+
+        session.get.assert_called_once_with(
+            URL("https://reposito.ry/com/library/group/library/maven-metadata.xml"),
+            auth=None,
+            headers={"If-None-Match": '"old"', "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"},
+            timeout=ClientTimeout(total=None, sock_connect=10, sock_read=30),
+        )
+        cache.put.assert_called_once_with(
+            repository,
+            library,
+            metadata.metadata,
+            etag='"new"',
+            last_modified="Tue, 02 Jan 2024 00:00:00 GMT",
+        )
+
+    @pytest.mark.asyncio
+    async def test_should_return_cached_metadata_without_parsing_when_repository_responds_not_modified(self):
+        library: Library = EntityFactory.create_library()
+        repository: Repository = EntityFactory.create_repository(address=URL("https://reposito.ry/"))
+        cached_metadata: CachedMetadata = CachedMetadata(metadata=Mock(), fetched_at=0, etag='"abc"')
+        cache: Mock = self._create_cache_mock(cached_metadata, is_fresh=False)
+        session: Mock = self._create_session_mock(status=304, text="")
+        fetcher: MetadataFetcher = MetadataFetcher(session, metadata_cache=cache)
+
+        metadata: Optional[MetadataRepositoryInfo] = await fetcher.get_artifact_metadata(
+            repository,
+            library,
+            verbose=False,
+        )
+
+        assert metadata == MetadataRepositoryInfo(repository, cached_metadata.metadata)
+        cache.refresh.assert_called_once_with(repository, library)
+        cache.put.assert_not_called()
+        response: Mock = session.get.return_value.__aenter__.return_value
+        response.content.iter_any.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_should_remember_missing_artifact_when_repository_responds_with_not_found_status(self):
+        library: Library = EntityFactory.create_library()
+        repository: Repository = EntityFactory.create_repository(address=URL("https://reposito.ry/"))
+        cache: Mock = self._create_cache_mock(cached_metadata=None, is_fresh=False)
+        session: Mock = self._create_session_mock(status=404, text="")
+        fetcher: MetadataFetcher = MetadataFetcher(session, metadata_cache=cache)
+
+        metadata: Optional[MetadataRepositoryInfo] = await fetcher.get_artifact_metadata(
+            repository,
+            library,
+            verbose=False,
+        )
+
+        assert metadata is None
+        cache.put_missing.assert_called_once_with(repository, library)
+        cache.put_group_probe.assert_called_once_with(repository, library, found=False)
+        assert fetcher.statistics.requests == 1
+        assert fetcher.statistics.affinity_misses == 1
+
+    @pytest.mark.asyncio
+    async def test_should_not_request_metadata_when_artifact_is_known_to_be_missing_in_repository(self):
+        library: Library = EntityFactory.create_library()
+        repository: Repository = EntityFactory.create_repository(address=URL("https://reposito.ry/"))
+        cache: Mock = self._create_cache_mock(cached_metadata=None, is_fresh=False, is_missing=True)
+        session: Mock = self._create_session_mock(status=200, text=self.default_metadata)
+        fetcher: MetadataFetcher = MetadataFetcher(session, metadata_cache=cache)
+
+        metadata: Optional[MetadataRepositoryInfo] = await fetcher.get_artifact_metadata(
+            repository,
+            library,
+            verbose=False,
+        )
+
+        assert metadata is None
+        session.get.assert_not_called()
+        assert fetcher.statistics.requests == 0
+        assert fetcher.statistics.negative_cache_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_should_not_request_metadata_when_artifact_group_is_hosted_by_other_repositories(self):
+        library: Library = EntityFactory.create_library()
+        repository: Repository = EntityFactory.create_repository(address=URL("https://reposito.ry/"))
+        other_repository: Repository = EntityFactory.create_repository(address=URL("https://other.reposito.ry/"))
+        cache: Mock = self._create_cache_mock(cached_metadata=None, is_fresh=False, is_group_hosted_elsewhere=True)
+        session: Mock = self._create_session_mock(status=200, text=self.default_metadata)
+        fetcher: MetadataFetcher = MetadataFetcher(session, metadata_cache=cache)
+
+        metadata: Optional[MetadataRepositoryInfo] = await fetcher.get_artifact_metadata(
+            repository,
+            library,
+            verbose=False,
+            searched_repositories=[repository, other_repository],
+        )
+
+        assert metadata is None
+        session.get.assert_not_called()
+        cache.is_group_hosted_elsewhere.assert_called_once_with(repository, library, [repository, other_repository])
+        assert fetcher.statistics.affinity_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_should_record_that_repository_hosts_artifact_group_when_metadata_found(self):
+        library: Library = EntityFactory.create_library()
+        repository: Repository = EntityFactory.create_repository(address=URL("https://reposito.ry/"))
+        cache: Mock = self._create_cache_mock(cached_metadata=None, is_fresh=False)
+        session: Mock = self._create_session_mock(status=200, text=self.default_metadata)
+        fetcher: MetadataFetcher = MetadataFetcher(session, metadata_cache=cache)
+
+        await fetcher.get_artifact_metadata(repository, library, verbose=False)
+
+        cache.put_group_probe.assert_called_once_with(repository, library, found=True)
+
+    @pytest.mark.asyncio
+    async def test_should_share_single_request_between_concurrent_callers_of_the_same_metadata(self):
+        library: Library = EntityFactory.create_library()
+        library_alias: Library = EntityFactory.create_library(name="alias")
+        repository: Repository = EntityFactory.create_repository(address=URL("https://reposito.ry/"))
+        session: Mock = self._create_session_mock(status=200, text=self.default_metadata)
+        fetcher: MetadataFetcher = MetadataFetcher(session)
+
+        first_metadata, second_metadata = await asyncio.gather(
+            fetcher.get_artifact_metadata(repository, library, verbose=False),
+            fetcher.get_artifact_metadata(repository, library_alias, verbose=False),
+        )
+
+        session.get.assert_called_once()
+        assert first_metadata.metadata is second_metadata.metadata
+        assert fetcher.statistics.requests == 1
+        assert fetcher.statistics.coalesced_requests == 1
+
+    @pytest.mark.asyncio
+    async def test_should_request_metadata_again_when_previous_request_completed(self):
+        library: Library = EntityFactory.create_library()
+        repository: Repository = EntityFactory.create_repository(address=URL("https://reposito.ry/"))
+        session: Mock = self._create_session_mock(status=404, text="")
+        fetcher: MetadataFetcher = MetadataFetcher(session)
+
+        await fetcher.get_artifact_metadata(repository, library, verbose=False)
+        await fetcher.get_artifact_metadata(repository, library, verbose=False)
+
+        assert session.get.call_count == 2
+        assert fetcher.statistics.coalesced_requests == 0
+
+    @pytest.mark.asyncio
+    async def test_should_not_cancel_shared_request_when_one_of_callers_cancelled(self):
+        library: Library = EntityFactory.create_library()
+        repository: Repository = EntityFactory.create_repository(address=URL("https://reposito.ry/"))
+        response_allowed = asyncio.Event()
+        session: Mock = self._create_session_mock(status=200, text=self.default_metadata)
+        request_context: Mock = session.get.return_value
+        response: Mock = request_context.__aenter__.return_value
+
+        async def enter_request() -> Mock:
+            await response_allowed.wait()
+            return response
+
+        request_context.__aenter__ = AsyncMock(side_effect=enter_request)
+        fetcher: MetadataFetcher = MetadataFetcher(session)
+
+        cancelled_caller = asyncio.ensure_future(fetcher.get_artifact_metadata(repository, library, verbose=False))
+        waiting_caller = asyncio.ensure_future(fetcher.get_artifact_metadata(repository, library, verbose=False))
+        await asyncio.sleep(0)
+        cancelled_caller.cancel()
+        response_allowed.set()
+        metadata: Optional[MetadataRepositoryInfo] = await waiting_caller
+
+        assert cancelled_caller.cancelled()
+        assert metadata.metadata.versions == ["1.0.0"]
+        session.get.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_should_cancel_shared_request_when_all_its_callers_cancelled(self):
+        library: Library = EntityFactory.create_library()
+        repository: Repository = EntityFactory.create_repository(address=URL("https://reposito.ry/"))
+        request_cancelled = asyncio.Event()
+        session: Mock = self._create_session_mock(status=200, text=self.default_metadata)
+        request_context: Mock = session.get.return_value
+
+        async def enter_request() -> Mock:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                request_cancelled.set()
+                raise
+
+        request_context.__aenter__ = AsyncMock(side_effect=enter_request)
+        fetcher: MetadataFetcher = MetadataFetcher(session)
+
+        callers = [
+            asyncio.ensure_future(fetcher.get_artifact_metadata(repository, library, verbose=False)) for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        for caller in callers:
+            caller.cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+
+        await asyncio.wait_for(request_cancelled.wait(), timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_should_start_new_request_when_caller_comes_after_shared_request_was_cancelled(self):
+        library: Library = EntityFactory.create_library()
+        repository: Repository = EntityFactory.create_repository(address=URL("https://reposito.ry/"))
+        session: Mock = self._create_session_mock(status=200, text=self.default_metadata)
+        request_context: Mock = session.get.return_value
+        response: Mock = request_context.__aenter__.return_value
+        first_request_started = asyncio.Event()
+
+        async def enter_request() -> Mock:
+            if not first_request_started.is_set():
+                first_request_started.set()
+                await asyncio.sleep(1)
+            return response
+
+        request_context.__aenter__ = AsyncMock(side_effect=enter_request)
+        fetcher: MetadataFetcher = MetadataFetcher(session)
+
+        cancelled_caller = asyncio.ensure_future(fetcher.get_artifact_metadata(repository, library, verbose=False))
+        await first_request_started.wait()
+        cancelled_caller.cancel()
+        await asyncio.sleep(0)
+        metadata: Optional[MetadataRepositoryInfo] = await fetcher.get_artifact_metadata(
+            repository,
+            library,
+            verbose=False,
+        )
+
+        assert cancelled_caller.cancelled()
+        assert metadata.metadata.versions == ["1.0.0"]
+        assert session.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_should_return_none_instead_of_failing_when_repository_is_unreachable(self):
+        library: Library = EntityFactory.create_library()
+        repository: Repository = EntityFactory.create_repository(address=URL("https://reposito.ry/"))
+        session: Mock = self._create_session_mock(status=200, text=self.default_metadata)
+        session.get.return_value.__aenter__ = AsyncMock(side_effect=ClientConnectionError("Connection refused"))
+        fetcher: MetadataFetcher = MetadataFetcher(session, network_configuration=NetworkConfiguration(max_retries=2))
+
+        with patch("kataloger.fetcher.metadata_fetcher.get_retry_delay", return_value=0):
+            metadata: Optional[MetadataRepositoryInfo] = await fetcher.get_artifact_metadata(
+                repository,
+                library,
+                verbose=False,
+            )
+
+        assert metadata is None
+        assert session.get.call_count == 3
+        assert fetcher.statistics.retries == 2
+
+    @pytest.mark.asyncio
+    async def test_should_retry_request_honoring_retry_after_when_repository_responds_with_retryable_status(self):
+        library: Library = EntityFactory.create_library()
+        repository: Repository = EntityFactory.create_repository(address=URL("https://reposito.ry/"))
+        session: Mock = self._create_session_mock(status=200, text=self.default_metadata)
+        request_context: Mock = session.get.return_value
+        throttled_response: Mock = Mock(status=503, headers=CIMultiDict({"Retry-After": "2"}))
+        request_context.__aenter__ = AsyncMock(
+            side_effect=[throttled_response, request_context.__aenter__.return_value],
+        )
+        fetcher: MetadataFetcher = MetadataFetcher(session)
+
+        with patch("kataloger.fetcher.metadata_fetcher.get_retry_delay", return_value=0) as get_retry_delay_mock:
+            metadata: Optional[MetadataRepositoryInfo] = await fetcher.get_artifact_metadata(
+                repository,
+                library,
+                verbose=False,
+            )
+
+        assert metadata.metadata.versions == ["1.0.0"]
+        assert session.get.call_count == 2
+        get_retry_delay_mock.assert_called_once_with(0, 2.0)
+        assert fetcher.statistics.retries == 1
+        assert fetcher.circuit_breaker.open_repositories() == []
+
+    @pytest.mark.asyncio
+    async def test_should_skip_requests_to_repository_when_it_failed_too_many_times_in_a_row(self):
+        libraries: list[Library] = [
+            EntityFactory.create_library(coordinates=f"com.library:library{index}") for index in range(4)
+        ]
+        repository: Repository = EntityFactory.create_repository(address=URL("https://reposito.ry/"))
+        session: Mock = self._create_session_mock(status=502, text="")
+        fetcher: MetadataFetcher = MetadataFetcher(
+            session,
+            network_configuration=NetworkConfiguration(max_repository_failures=2, max_retries=0),
+        )
+
+        for library in libraries:
+            await fetcher.get_artifact_metadata(repository, library, verbose=False)
+
+        assert session.get.call_count == 2
+        assert fetcher.statistics.skipped_requests == 2
+        assert fetcher.circuit_breaker.open_repositories() == [repository]
+
+    @pytest.mark.asyncio
+    async def test_should_return_mirror_metadata_and_cancel_slow_request_when_repository_does_not_answer_in_time(self):
+        library: Library = EntityFactory.create_library()
+        repository: Repository = EntityFactory.create_repository(
+            address=URL("https://reposito.ry/"),
+            mirrors=(URL("https://mirr.or/"),),
+        )
+        session: Mock = self._create_session_mock(status=200, text=self.default_metadata)
+        request_context: Mock = session.get.return_value
+        response: Mock = request_context.__aenter__.return_value
+        cancelled_addresses: list[str] = []
+
+        def get(url: URL, **_: object) -> MagicMock:
+            async def enter_request() -> Mock:
+                if url.host == "reposito.ry":
+                    try:
+                        await asyncio.sleep(1)
+                    except asyncio.CancelledError:
+                        cancelled_addresses.append(url.host)
+                        raise
+                return response
+
+            mirror_request_context = MagicMock()
+            mirror_request_context.__aenter__ = AsyncMock(side_effect=enter_request)
+            mirror_request_context.__aexit__ = AsyncMock(return_value=None)
+            return mirror_request_context
+
+        session.get = Mock(side_effect=get)
+        fetcher: MetadataFetcher = MetadataFetcher(session)
+
+        with patch.object(fetcher.latency_tracker, "hedge_delay", return_value=0.01):
+            metadata: Optional[MetadataRepositoryInfo] = await fetcher.get_artifact_metadata(
+                repository,
+                library,
+                verbose=False,
+            )
+
+        assert metadata.metadata.versions == ["1.0.0"]
+        assert [call.args[0] for call in session.get.call_args_list] == [
+            URL("https://reposito.ry/com/library/group/library/maven-metadata.xml"),
+            URL("https://mirr.or/com/library/group/library/maven-metadata.xml"),
+        ]
+        assert cancelled_addresses == ["reposito.ry"]
+        assert fetcher.statistics.hedged_requests == 1
+
+    @pytest.mark.asyncio
+    async def test_should_not_wait_for_repository_request_slot_when_request_hedged_to_mirror(self):
+        library: Library = EntityFactory.create_library()
+        repository: Repository = EntityFactory.create_repository(
+            address=URL("https://reposito.ry/"),
+            mirrors=(URL("https://mirr.or/"),),
+        )
+        session: Mock = self._create_session_mock(status=200, text=self.default_metadata)
+        response: Mock = session.get.return_value.__aenter__.return_value
+
+        def get(url: URL, **_: object) -> MagicMock:
+            async def enter_request() -> Mock:
+                if url.host == "reposito.ry":
+                    # Request to the main address takes its only slot until it's cancelled.
+                    await asyncio.Event().wait()
+                return response
+
+            mirror_request_context = MagicMock()
+            mirror_request_context.__aenter__ = AsyncMock(side_effect=enter_request)
+            mirror_request_context.__aexit__ = AsyncMock(return_value=None)
+            return mirror_request_context
+
+        session.get = Mock(side_effect=get)
+        fetcher: MetadataFetcher = MetadataFetcher(
+            session,
+            network_configuration=NetworkConfiguration(max_repository_requests=1),
+        )
+
+        with patch.object(fetcher.latency_tracker, "hedge_delay", return_value=0.01):
+            metadata: Optional[MetadataRepositoryInfo] = await asyncio.wait_for(
+                fetcher.get_artifact_metadata(repository, library, verbose=False),
+                timeout=1,
+            )
+
+        assert metadata.metadata.versions == ["1.0.0"]
+        assert fetcher.statistics.hedged_requests == 1
+
+    @pytest.mark.asyncio
+    async def test_should_request_next_mirror_without_waiting_when_repository_fails(self):
+        library: Library = EntityFactory.create_library()
+        repository: Repository = EntityFactory.create_repository(
+            address=URL("https://reposito.ry/"),
+            mirrors=(URL("https://mirr.or/"),),
+        )
+        session: Mock = self._create_session_mock(status=200, text=self.default_metadata)
+        request_context: Mock = session.get.return_value
+        request_context.__aenter__ = AsyncMock(
+            side_effect=[ClientConnectionError("Connection refused"), request_context.__aenter__.return_value],
+        )
+        fetcher: MetadataFetcher = MetadataFetcher(session, network_configuration=NetworkConfiguration(max_retries=0))
+
+        metadata: Optional[MetadataRepositoryInfo] = await fetcher.get_artifact_metadata(
+            repository,
+            library,
+            verbose=False,
+        )
+
+        assert metadata.metadata.versions == ["1.0.0"]
+        assert session.get.call_count == 2
+        assert fetcher.statistics.hedged_requests == 0
+        assert fetcher.circuit_breaker.open_repositories() == []
+
+    @pytest.mark.asyncio
+    async def test_should_close_metadata_cache_when_fetcher_closed(self):
+        cache: Mock = self._create_cache_mock(cached_metadata=None, is_fresh=False)
+        session: Mock = self._create_session_mock(status=200, text=self.default_metadata)
+
+        async with MetadataFetcher(session, metadata_cache=cache):
+            pass
+
+        cache.close.assert_called_once()
+
+    @staticmethod
+    def _create_cache_mock(
+        cached_metadata: Optional[CachedMetadata],
+        *,
+        is_fresh: bool,
+        is_missing: bool = False,
+        is_group_hosted_elsewhere: bool = False,
+    ) -> Mock:
+        cache = Mock()
+        cache.get.return_value = cached_metadata
+        cache.is_fresh.return_value = is_fresh
+        cache.is_missing.return_value = is_missing
+        cache.is_group_hosted_elsewhere.return_value = is_group_hosted_elsewhere
+        return cache
+
+    @staticmethod
+    def _create_session_mock(status: int, text: str, headers: Optional[dict[str, str]] = None) -> Mock:
+        response = Mock()
+        response.status = status
+        response.headers = CIMultiDict(headers or {})
+        response.content.iter_any = Mock(return_value=TestMetadataFetcher._create_chunks(text.encode()))
+        request_context = MagicMock()
+        request_context.__aenter__ = AsyncMock(return_value=response)
+        request_context.__aexit__ = AsyncMock(return_value=None)
+        session = Mock()
+        session.get = Mock(return_value=request_context)
+        session.close = AsyncMock()
+        return session
+
+    @staticmethod
+    async def _create_chunks(data: bytes, chunk_size: int = 16) -> AsyncIterator[bytes]:
+        for start in range(0, len(data), chunk_size):
+            yield data[start:start + chunk_size]
@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+from yarl import URL
+
+from kataloger.fetcher.request_scheduler import RequestScheduler
+
+
+class TestRequestScheduler:
+
+    @pytest.mark.asyncio
+    async def test_should_limit_number_of_requests_to_single_repository(self):
+        scheduler: RequestScheduler = RequestScheduler(max_requests=10, max_repository_requests=2)
+        address: URL = URL("https://reposito.ry/")
+
+        max_in_flight: int = await self._run_requests(scheduler, addresses=[address] * 6)
+
+        assert max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_should_limit_number_of_requests_to_all_repositories(self):
+        scheduler: RequestScheduler = RequestScheduler(max_requests=3, max_repository_requests=2)
+        addresses: list[URL] = [URL("https://first.reposito.ry/"), URL("https://second.reposito.ry/")]
+
+        max_in_flight: int = await self._run_requests(scheduler, addresses=addresses * 4)
+
+        assert max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_should_decrease_repository_limit_when_repository_throttles_requests(self):
+        scheduler: RequestScheduler = RequestScheduler(max_requests=10, max_repository_requests=8)
+        throttling_address: URL = URL("https://throttling.reposito.ry/")
+        other_address: URL = URL("https://other.reposito.ry/")
+
+        async with scheduler.schedule(throttling_address) as ticket:
+            ticket.status = 429
+        async with scheduler.schedule(other_address) as ticket:
+            ticket.status = 200
+
+        assert scheduler.address_limiter(throttling_address).limit == 4
+        assert scheduler.address_limiter(other_address).limit == 8
+
+    @pytest.mark.asyncio
+    async def test_should_decrease_repository_limit_and_release_slots_when_request_failed(self):
+        scheduler: RequestScheduler = RequestScheduler(max_requests=1, max_repository_requests=8)
+        address: URL = URL("https://reposito.ry/")
+
+        with pytest.raises(ConnectionError):
+            async with scheduler.schedule(address):
+                raise ConnectionError
+
+        limiter = scheduler.address_limiter(address)
+        assert limiter.limit == 4
+        assert limiter.in_flight == 0
+
+        # Global slot has to be released too, otherwise next request would hang.
+        async def next_request() -> None:
+            async with scheduler.schedule(address) as ticket:
+                ticket.status = 200
+
+        await asyncio.wait_for(next_request(), timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_should_not_change_repository_limit_when_request_was_not_sent(self):
+        scheduler: RequestScheduler = RequestScheduler(max_requests=8, max_repository_requests=8)
+        address: URL = URL("https://reposito.ry/")
+        async with scheduler.schedule(address) as ticket:
+            ticket.status = 429
+
+        async with scheduler.schedule(address):
+            pass
+
+        assert scheduler.address_limiter(address).limit == 4
+
+    @staticmethod
+    async def _run_requests(scheduler: RequestScheduler, addresses: list[URL]) -> int:
+        in_flight: int = 0
+        max_in_flight: int = 0
+
+        async def request(address: URL) -> None:
+            nonlocal in_flight, max_in_flight
+            async with scheduler.schedule(address) as ticket:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                ticket.status = 200
+
+        await asyncio.gather(*(request(address) for address in addresses))
+        return max_in_flight
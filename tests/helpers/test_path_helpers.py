@@ -1,9 +1,10 @@
+import sys
 from pathlib import Path
 
 import pytest
 
 from kataloger.exceptions.kataloger_configuration_exception import KatalogerConfigurationError
-from kataloger.helpers.path_helpers import file_exists, str_to_path
+from kataloger.helpers.path_helpers import file_exists, get_cache_dir, str_to_path
 
 
 class TestPathHelpers:
@@ -59,3 +60,22 @@ class TestPathHelpers:
     def test_should_return_false_when_path_not_exists(self, tmp_path: Path):
         path: Path = tmp_path / "non_existing_directory"
         assert not file_exists(path)
+
+    @pytest.mark.skipif(sys.platform in {"win32", "darwin"}, reason="XDG directories are used on other platforms")
+    def test_should_return_cache_dir_inside_xdg_cache_home_when_it_specified(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+        assert get_cache_dir() == tmp_path / "kataloger"
+
+    @pytest.mark.skipif(sys.platform in {"win32", "darwin"}, reason="XDG directories are used on other platforms")
+    def test_should_return_cache_dir_inside_home_cache_dir_when_xdg_cache_home_is_relative(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setenv("XDG_CACHE_HOME", "relative/path")
+
+        assert get_cache_dir() == Path.home() / ".cache" / "kataloger"
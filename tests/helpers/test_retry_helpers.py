@@ -0,0 +1,46 @@
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from kataloger.helpers.retry_helpers import MAX_RETRY_DELAY_SECONDS, get_retry_delay, parse_retry_after
+
+
+class TestRetryHelpers:
+
+    @pytest.mark.parametrize(("attempt", "max_delay"), [(0, 0.5), (1, 1), (2, 2), (10, MAX_RETRY_DELAY_SECONDS)])
+    def test_should_return_randomized_delay_growing_exponentially_with_attempt(self, attempt: int, max_delay: float):
+        with patch("kataloger.helpers.retry_helpers.random.uniform", side_effect=lambda _, high: high) as uniform:
+            actual_delay: float = get_retry_delay(attempt)
+
+        uniform.assert_called_once_with(0, max_delay)
+        assert actual_delay == max_delay
+
+    def test_should_return_delay_requested_by_repository_with_small_jitter(self):
+        with patch("kataloger.helpers.retry_helpers.random.uniform", return_value=0.25):
+            actual_delay: float = get_retry_delay(attempt=0, retry_after=3)
+
+        assert actual_delay == 3.25
+
+    def test_should_limit_delay_requested_by_repository(self):
+        with patch("kataloger.helpers.retry_helpers.random.uniform", return_value=0):
+            actual_delay: float = get_retry_delay(attempt=0, retry_after=3600)
+
+        assert actual_delay == MAX_RETRY_DELAY_SECONDS
+
+    def test_should_parse_retry_after_in_seconds(self):
+        assert parse_retry_after(" 120 ") == 120
+
+    def test_should_parse_retry_after_http_date(self):
+        now: datetime = datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+
+        assert parse_retry_after("Mon, 01 Jan 2024 00:01:30 GMT", now=now) == 90
+
+    def test_should_return_zero_delay_when_retry_after_date_passed(self):
+        now: datetime = datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+
+        assert parse_retry_after("Sun, 31 Dec 2023 23:59:00 GMT", now=now) == 0
+
+    @pytest.mark.parametrize("value", [None, "", "soon", "-5"])
+    def test_should_return_none_when_retry_after_is_absent_or_malformed(self, value: str):
+        assert parse_retry_after(value) is None
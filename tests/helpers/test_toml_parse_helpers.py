@@ -7,16 +7,21 @@ from yarl import URL
 
 from kataloger.data.artifact.library import Library
 from kataloger.data.artifact.plugin import Plugin
+from kataloger.data.cache_configuration import CacheConfiguration
 from kataloger.data.catalog import Catalog
 from kataloger.data.configuration_data import ConfigurationData
+from kataloger.data.content_filter import ContentFilter
+from kataloger.data.network_configuration import NetworkConfiguration
 from kataloger.data.repository import Repository
 from kataloger.exceptions.kataloger_parse_exception import KatalogerParseError
 from kataloger.helpers import toml_parse_helpers
 from kataloger.helpers.toml_parse_helpers import (
     load_catalog,
     load_configuration,
+    parse_cache_configuration,
     parse_catalogs,
     parse_libraries,
+    parse_network_configuration,
     parse_plugins,
     parse_repositories,
 )
@@ -431,6 +436,86 @@ class TestTomlParseHelpers:
 
         assert actual_repositories == [expected_repository]
 
+    def test_should_parse_repository_with_content_filter(self):
+        data: dict[str, dict] = {
+            self.default_repository_name: {
+                "address": self.default_repository_address,
+                "include_groups": ["androidx", "com.google.android"],
+                "exclude_groups": ["androidx.internal"],
+            },
+        }
+        expected_repository: Repository = Repository(
+            name=self.default_repository_name,
+            address=URL(self.default_repository_address),
+            content_filter=ContentFilter(
+                include_groups=("androidx", "com.google.android"),
+                exclude_groups=("androidx.internal",),
+            ),
+        )
+        actual_repositories: list[Repository] = parse_repositories(data)
+
+        assert actual_repositories == [expected_repository]
+
+    def test_should_parse_repository_with_credentials_and_content_filter(self):
+        data: dict[str, dict] = {
+            self.default_repository_name: {
+                "address": self.default_repository_address,
+                "user": "username",
+                "password": "password",
+                "exclude_groups": ["androidx"],
+            },
+        }
+        expected_repository: Repository = Repository(
+            name=self.default_repository_name,
+            address=URL(self.default_repository_address),
+            user="username",
+            password="password",
+            content_filter=ContentFilter(exclude_groups=("androidx",)),
+        )
+        actual_repositories: list[Repository] = parse_repositories(data)
+
+        assert actual_repositories == [expected_repository]
+
+    def test_should_raise_exception_when_repository_content_filter_is_incorrect(self):
+        incorrect_filters: list[dict] = [
+            {"include_groups": "androidx"},
+            {"include_groups": [42]},
+            {"exclude_groups": [""]},
+        ]
+        for content_filter in incorrect_filters:
+            data: dict[str, dict] = {
+                self.default_repository_name: {"address": self.default_repository_address, **content_filter},
+            }
+
+            with pytest.raises(KatalogerParseError):
+                parse_repositories(data)
+
+    def test_should_parse_repository_with_mirrors(self):
+        data: dict[str, dict] = {
+            self.default_repository_name: {
+                "address": self.default_repository_address,
+                "mirrors": ["https://mirr.or/", "https://other.mirr.or/"],
+            },
+        }
+        expected_repository: Repository = Repository(
+            name=self.default_repository_name,
+            address=URL(self.default_repository_address),
+            mirrors=(URL("https://mirr.or/"), URL("https://other.mirr.or/")),
+        )
+        actual_repositories: list[Repository] = parse_repositories(data)
+
+        assert actual_repositories == [expected_repository]
+
+    def test_should_raise_exception_when_repository_mirrors_are_incorrect(self):
+        incorrect_mirrors: list[object] = ["https://mirr.or/", [42], [""]]
+        for mirrors in incorrect_mirrors:
+            data: dict[str, dict] = {
+                self.default_repository_name: {"address": self.default_repository_address, "mirrors": mirrors},
+            }
+
+            with pytest.raises(KatalogerParseError):
+                parse_repositories(data)
+
     def test_should_raise_exception_when_repository_name_is_not_string(self):
         data: dict = {
             42: self.default_repository_address,
@@ -699,6 +784,146 @@ class TestTomlParseHelpers:
             expected_fail_on_updates=fail_on_updates_flag,
         )
 
+    def test_should_return_configuration_with_network_configuration_when_it_specified(self):
+        configuration_data: dict = {
+            "network": {
+                "max_requests": 10,
+                "max_repository_requests": 2,
+            },
+        }
+
+        self.__test_load_configuration(
+            configuration_data=configuration_data,
+            expected_catalogs=None,
+            expected_library_repositories=None,
+            expected_plugin_repositories=None,
+            expected_verbose=None,
+            expected_suggest_unstable_updates=None,
+            expected_fail_on_updates=None,
+            expected_network_configuration=NetworkConfiguration(max_requests=10, max_repository_requests=2),
+        )
+
+    def test_should_use_default_values_for_network_configuration_fields_that_not_specified(self):
+        expected_configuration: NetworkConfiguration = NetworkConfiguration(max_requests=8)
+        actual_configuration: NetworkConfiguration = parse_network_configuration(data={"max_requests": 8})
+
+        assert actual_configuration == expected_configuration
+
+    def test_should_raise_exception_when_network_configuration_limit_is_not_positive_integer(self):
+        incorrect_values: list[object] = [0, -1, 1.5, "10", True]
+        for value in incorrect_values:
+            with pytest.raises(KatalogerParseError):
+                parse_network_configuration(data={"max_requests": value})
+
+    def test_should_return_network_configuration_with_deadline_when_it_specified(self):
+        expected_configuration: NetworkConfiguration = NetworkConfiguration(deadline_seconds=60)
+        actual_configuration: NetworkConfiguration = parse_network_configuration(data={"deadline_seconds": 60})
+
+        assert actual_configuration == expected_configuration
+
+    def test_should_raise_exception_when_network_configuration_deadline_is_not_positive_integer(self):
+        incorrect_values: list[object] = [0, -1, 1.5, "60", True]
+        for value in incorrect_values:
+            with pytest.raises(KatalogerParseError):
+                parse_network_configuration(data={"deadline_seconds": value})
+
+    def test_should_return_network_configuration_with_max_repository_failures_when_it_specified(self):
+        expected_configuration: NetworkConfiguration = NetworkConfiguration(max_repository_failures=3)
+        actual_configuration: NetworkConfiguration = parse_network_configuration(data={"max_repository_failures": 3})
+
+        assert actual_configuration == expected_configuration
+
+    def test_should_return_network_configuration_with_timeouts_and_retries_when_they_specified(self):
+        expected_configuration: NetworkConfiguration = NetworkConfiguration(
+            connect_timeout_seconds=5,
+            read_timeout_seconds=20,
+            max_retries=0,
+        )
+        actual_configuration: NetworkConfiguration = parse_network_configuration(
+            data={"connect_timeout_seconds": 5, "read_timeout_seconds": 20, "max_retries": 0},
+        )
+
+        assert actual_configuration == expected_configuration
+
+    def test_should_raise_exception_when_network_configuration_max_retries_is_not_non_negative_integer(self):
+        incorrect_values: list[object] = [-1, 1.5, "2", True]
+        for value in incorrect_values:
+            with pytest.raises(KatalogerParseError):
+                parse_network_configuration(data={"max_retries": value})
+
+    def test_should_return_network_configuration_with_hedge_percentile_when_it_specified(self):
+        expected_configuration: NetworkConfiguration = NetworkConfiguration(hedge_percentile=95)
+        actual_configuration: NetworkConfiguration = parse_network_configuration(data={"hedge_percentile": 95})
+
+        assert actual_configuration == expected_configuration
+
+    def test_should_raise_exception_when_network_configuration_hedge_percentile_is_incorrect(self):
+        incorrect_values: list[object] = [0, 100, 50.5]
+        for value in incorrect_values:
+            with pytest.raises(KatalogerParseError):
+                parse_network_configuration(data={"hedge_percentile": value})
+
+    def test_should_return_network_configuration_with_first_hit_when_it_specified(self):
+        expected_configuration: NetworkConfiguration = NetworkConfiguration(first_hit=True)
+        actual_configuration: NetworkConfiguration = parse_network_configuration(data={"first_hit": True})
+
+        assert actual_configuration == expected_configuration
+
+    def test_should_raise_exception_when_network_configuration_first_hit_is_not_boolean(self):
+        with pytest.raises(KatalogerParseError):
+            parse_network_configuration(data={"first_hit": "yes"})
+
+    def test_should_raise_exception_when_network_configuration_has_unknown_field(self):
+        with pytest.raises(KatalogerParseError):
+            parse_network_configuration(data={"max_connections": 10})
+
+    def test_should_return_configuration_with_cache_configuration_when_it_specified(self):
+        configuration_data: dict = {
+            "cache": {
+                "enabled": False,
+                "ttl_seconds": 60,
+                "max_size_mb": 4,
+                "negative_ttl_seconds": 30,
+                "affinity_reprobe_seconds": 120,
+            },
+        }
+
+        self.__test_load_configuration(
+            configuration_data=configuration_data,
+            expected_catalogs=None,
+            expected_library_repositories=None,
+            expected_plugin_repositories=None,
+            expected_verbose=None,
+            expected_suggest_unstable_updates=None,
+            expected_fail_on_updates=None,
+            expected_cache_configuration=CacheConfiguration(
+                enabled=False,
+                ttl_seconds=60,
+                max_size_mb=4,
+                negative_ttl_seconds=30,
+                affinity_reprobe_seconds=120,
+            ),
+        )
+
+    def test_should_use_default_values_for_cache_configuration_fields_that_not_specified(self):
+        expected_configuration: CacheConfiguration = CacheConfiguration(ttl_seconds=10)
+        actual_configuration: CacheConfiguration = parse_cache_configuration(data={"ttl_seconds": 10})
+
+        assert actual_configuration == expected_configuration
+
+    def test_should_raise_exception_when_cache_configuration_has_incorrect_values(self):
+        incorrect_data: list[dict] = [
+            {"enabled": "yes"},
+            {"ttl_seconds": -1},
+            {"max_size_mb": 0},
+            {"negative_ttl_seconds": 0},
+            {"affinity_reprobe_seconds": "week"},
+            {"directory": "/tmp"},
+        ]
+        for data in incorrect_data:
+            with pytest.raises(KatalogerParseError):
+                parse_cache_configuration(data)
+
     def test_should_raise_exception_when_boolean_flag_has_incorrect_type(self):
         configuration_data: dict = {
             "verbose": 1,
@@ -717,6 +942,9 @@ class TestTomlParseHelpers:
         expected_verbose: Optional[bool],
         expected_suggest_unstable_updates: Optional[bool],
         expected_fail_on_updates: Optional[bool],
+        *,
+        expected_network_configuration: Optional[NetworkConfiguration] = None,
+        expected_cache_configuration: Optional[CacheConfiguration] = None,
     ):
         expected_configuration: ConfigurationData = ConfigurationData(
             catalogs=expected_catalogs,
@@ -725,6 +953,8 @@ class TestTomlParseHelpers:
             verbose=expected_verbose,
             suggest_unstable_updates=expected_suggest_unstable_updates,
             fail_on_updates=expected_fail_on_updates,
+            network_configuration=expected_network_configuration,
+            cache_configuration=expected_cache_configuration,
         )
         toml_parse_helpers.load_toml = Mock(return_value=configuration_data)
         actual_configuration: ConfigurationData = load_configuration(configuration_path=Mock())
@@ -0,0 +1,381 @@
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import nullcontext
+from typing import Optional
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from kataloger.data.artifact.artifact import Artifact
+from kataloger.data.artifact.library import Library
+from kataloger.data.artifact.plugin import Plugin
+from kataloger.data.content_filter import ContentFilter
+from kataloger.data.network_configuration import NetworkConfiguration
+from kataloger.data.repository import Repository
+from kataloger.fetcher.fetch_statistics import FetchStatistics
+from kataloger.helpers.update_helpers import get_all_artifact_metadata, iter_all_artifact_metadata
+from tests.entity_factory import EntityFactory
+
+
+class TestUpdateHelpers:
+
+    @pytest.mark.asyncio
+    async def test_should_return_empty_result_when_there_are_no_artifacts(self):
+        repository: Repository = EntityFactory.create_repository()
+        fetcher: Mock = self._create_fetcher_mock()
+
+        actual_result = await get_all_artifact_metadata(
+            artifacts=[],
+            repositories=[repository],
+            fetcher=fetcher,
+            verbose=False,
+        )
+
+        assert actual_result == {}
+        fetcher.get_artifact_metadata.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_should_query_repositories_concurrently(self):
+        library: Library = EntityFactory.create_library()
+        repositories: list[Repository] = [
+            EntityFactory.create_repository(name="first_repository"),
+            EntityFactory.create_repository(name="second_repository"),
+        ]
+        all_requests_started = asyncio.Event()
+        started_requests: list[Repository] = []
+
+        async def request(repository: Repository, artifact: Artifact, *, verbose: bool) -> Mock:  # noqa: ARG001
+            started_requests.append(repository)
+            if len(started_requests) == len(repositories):
+                all_requests_started.set()
+            # Sequential requests would never see the event set and fail by timeout.
+            await asyncio.wait_for(all_requests_started.wait(), timeout=1)
+            return Mock()
+
+        await get_all_artifact_metadata(
+            artifacts=[library],
+            repositories=repositories,
+            fetcher=self._create_fetcher_mock(request),
+            verbose=False,
+        )
+
+        assert started_requests == repositories
+
+    @pytest.mark.asyncio
+    async def test_should_merge_repository_results_in_repositories_declaration_order(self):
+        library: Library = EntityFactory.create_library()
+        repositories: list[Repository] = [
+            EntityFactory.create_repository(name="slow_repository"),
+            EntityFactory.create_repository(name="fast_repository"),
+        ]
+        delays: dict[str, float] = {"slow_repository": 0.05, "fast_repository": 0}
+        metadata: dict[str, Mock] = {repository.name: Mock() for repository in repositories}
+
+        async def request(repository: Repository, artifact: Artifact, *, verbose: bool) -> Mock:  # noqa: ARG001
+            await asyncio.sleep(delays[repository.name])
+            return metadata[repository.name]
+
+        actual_result = await get_all_artifact_metadata(
+            artifacts=[library],
+            repositories=repositories,
+            fetcher=self._create_fetcher_mock(request),
+            verbose=False,
+        )
+
+        assert actual_result == {library: [metadata["slow_repository"], metadata["fast_repository"]]}
+
+    @pytest.mark.asyncio
+    async def test_should_return_results_in_artifacts_declaration_order(self):
+        slow_library: Library = EntityFactory.create_library(coordinates="com.library:slow")
+        fast_library: Library = EntityFactory.create_library(coordinates="com.library:fast")
+        delays: dict[str, float] = {slow_library.coordinates: 0.05, fast_library.coordinates: 0}
+
+        async def request(repository: Repository, artifact: Artifact, *, verbose: bool) -> Mock:  # noqa: ARG001
+            await asyncio.sleep(delays[artifact.coordinates])
+            return Mock()
+
+        actual_result = await get_all_artifact_metadata(
+            artifacts=[slow_library, fast_library],
+            repositories=[EntityFactory.create_repository()],
+            fetcher=self._create_fetcher_mock(request),
+            verbose=False,
+        )
+
+        assert list(actual_result.keys()) == [slow_library, fast_library]
+
+    @pytest.mark.asyncio
+    async def test_should_not_request_artifacts_excluded_by_repository_content_filter(self):
+        androidx_library: Library = EntityFactory.create_library(coordinates="androidx.core:core")
+        other_library: Library = EntityFactory.create_library(coordinates="com.squareup.okhttp3:okhttp")
+        repository: Repository = EntityFactory.create_repository(
+            content_filter=ContentFilter(include_groups=("androidx",)),
+        )
+        fetcher: Mock = self._create_fetcher_mock()
+
+        actual_result = await get_all_artifact_metadata(
+            artifacts=[androidx_library, other_library],
+            repositories=[repository],
+            fetcher=fetcher,
+            verbose=False,
+        )
+
+        assert list(actual_result.keys()) == [androidx_library]
+        fetcher.get_artifact_metadata.assert_awaited_once_with(
+            repository,
+            androidx_library,
+            verbose=False,
+            searched_repositories=[repository],
+        )
+
+    @pytest.mark.asyncio
+    async def test_should_fetch_module_once_and_share_result_with_all_its_declarations(self):
+        library: Library = EntityFactory.create_library(name="library", coordinates="com.library:library")
+        library_alias: Library = EntityFactory.create_library(
+            name="library_alias",
+            coordinates="com.library:library",
+            version="2.0.0",
+        )
+        plugin: Plugin = EntityFactory.create_plugin(coordinates="com.library:library")
+        repository: Repository = EntityFactory.create_repository()
+
+        async def request(repository: Repository, artifact: Artifact, *, verbose: bool) -> Artifact:  # noqa: ARG001
+            return artifact
+
+        fetcher: Mock = self._create_fetcher_mock(request)
+
+        actual_result = await get_all_artifact_metadata(
+            artifacts=[library, library_alias, plugin, library],
+            repositories=[repository],
+            fetcher=fetcher,
+            verbose=False,
+        )
+
+        assert actual_result == {library: [library], library_alias: [library], plugin: [plugin]}
+        assert fetcher.get_artifact_metadata.await_count == 2
+        assert fetcher.statistics.artifacts == 4
+        assert fetcher.statistics.unique_artifacts == 2
+
+    @pytest.mark.asyncio
+    async def test_should_yield_artifact_as_soon_as_all_its_repositories_answered(self):
+        slow_library: Library = EntityFactory.create_library(coordinates="com.library:slow")
+        fast_plugin: Plugin = EntityFactory.create_plugin(coordinates="com.plugin.fast")
+        library_repository: Repository = EntityFactory.create_repository(name="library_repository")
+        plugin_repository: Repository = EntityFactory.create_repository(name="plugin_repository")
+        slow_request_allowed = asyncio.Event()
+
+        async def request(repository: Repository, artifact: Artifact, *, verbose: bool) -> Mock:  # noqa: ARG001
+            if artifact == slow_library:
+                await asyncio.wait_for(slow_request_allowed.wait(), timeout=1)
+            return Mock(repository=repository)
+
+        yielded_artifacts: list[Artifact] = []
+        async for artifact, metadata, _ in iter_all_artifact_metadata(
+            [([slow_library], [library_repository]), ([fast_plugin], [plugin_repository])],
+            fetcher=self._create_fetcher_mock(request),
+            verbose=False,
+        ):
+            yielded_artifacts.append(artifact)
+            assert [item.repository for item in metadata] == [
+                library_repository if artifact == slow_library else plugin_repository,
+            ]
+            # Slow library can finish only after fast plugin was already handed out.
+            slow_request_allowed.set()
+
+        assert yielded_artifacts == [fast_plugin, slow_library]
+
+    @pytest.mark.asyncio
+    async def test_should_cancel_remaining_searches_when_iteration_stopped(self):
+        fast_library: Library = EntityFactory.create_library(coordinates="com.library:fast")
+        slow_library: Library = EntityFactory.create_library(coordinates="com.library:slow")
+        cancelled_requests: list[Artifact] = []
+
+        async def request(repository: Repository, artifact: Artifact, *, verbose: bool) -> Mock:  # noqa: ARG001
+            if artifact == slow_library:
+                try:
+                    await asyncio.sleep(1)
+                except asyncio.CancelledError:
+                    cancelled_requests.append(artifact)
+                    raise
+            return Mock()
+
+        iterator = iter_all_artifact_metadata(
+            [([fast_library, slow_library], [EntityFactory.create_repository()])],
+            fetcher=self._create_fetcher_mock(request),
+            verbose=False,
+        )
+        async for _ in iterator:
+            break
+        await iterator.aclose()
+
+        assert cancelled_requests == [slow_library]
+
+    @pytest.mark.asyncio
+    async def test_should_stop_starting_searches_when_consumer_does_not_take_results(self):
+        libraries: list[Library] = [
+            EntityFactory.create_library(coordinates=f"com.library:library{index}") for index in range(10)
+        ]
+        started_requests: list[Artifact] = []
+
+        async def request(repository: Repository, artifact: Artifact, *, verbose: bool) -> Mock:  # noqa: ARG001
+            started_requests.append(artifact)
+            return Mock()
+
+        iterator = iter_all_artifact_metadata(
+            [(libraries, [EntityFactory.create_repository()])],
+            fetcher=self._create_fetcher_mock(request, max_requests=2),
+            verbose=False,
+        )
+        async for _ in iterator:
+            # Consumer is busy with the first result, searches run until results buffer and all workers are full.
+            await asyncio.sleep(0.05)
+            break
+        await iterator.aclose()
+
+        # Taken result, two buffered results and two searches of workers waiting for free place in buffer.
+        assert len(started_requests) == 5
+
+    @pytest.mark.asyncio
+    async def test_should_raise_search_error_to_consumer(self):
+        library: Library = EntityFactory.create_library()
+
+        async def request(repository: Repository, artifact: Artifact, *, verbose: bool) -> Mock:  # noqa: ARG001
+            message = "Unexpected failure."
+            raise RuntimeError(message)
+
+        with pytest.raises(RuntimeError, match="Unexpected failure."):
+            await get_all_artifact_metadata(
+                artifacts=[library],
+                repositories=[EntityFactory.create_repository()],
+                fetcher=self._create_fetcher_mock(request),
+                verbose=False,
+            )
+
+    @pytest.mark.asyncio
+    async def test_should_yield_artifact_as_not_checked_when_its_request_was_cancelled_from_outside(self):
+        library: Library = EntityFactory.create_library()
+
+        async def request(repository: Repository, artifact: Artifact, *, verbose: bool) -> Mock:  # noqa: ARG001
+            raise asyncio.CancelledError
+
+        iterator = iter_all_artifact_metadata(
+            [([library], [EntityFactory.create_repository()])],
+            fetcher=self._create_fetcher_mock(request),
+            verbose=False,
+        )
+        results = await asyncio.wait_for(self._collect(iterator), timeout=1)
+
+        assert results == [(library, [], False)]
+
+    @pytest.mark.asyncio
+    async def test_should_search_artifacts_that_had_updates_last_time_first(self):
+        libraries: list[Library] = [
+            EntityFactory.create_library(coordinates=f"com.library:library{index}") for index in range(4)
+        ]
+        outdated_libraries: list[Library] = [libraries[3], libraries[1]]
+        started_requests: list[Artifact] = []
+
+        async def request(repository: Repository, artifact: Artifact, *, verbose: bool) -> Mock:  # noqa: ARG001
+            started_requests.append(artifact)
+            return Mock()
+
+        fetcher: Mock = self._create_fetcher_mock(request, max_requests=1)
+        fetcher.metadata_cache = Mock()
+        fetcher.metadata_cache.had_update.side_effect = lambda artifact: artifact in outdated_libraries
+
+        await get_all_artifact_metadata(
+            artifacts=libraries,
+            repositories=[EntityFactory.create_repository()],
+            fetcher=fetcher,
+            verbose=False,
+        )
+
+        assert started_requests == [libraries[1], libraries[3], libraries[0], libraries[2]]
+
+    @pytest.mark.asyncio
+    async def test_should_yield_metadata_that_arrived_before_deadline_and_mark_search_incomplete(self):
+        library: Library = EntityFactory.create_library(coordinates="com.library:library")
+        repositories: list[Repository] = [
+            EntityFactory.create_repository(name="slow_repository"),
+            EntityFactory.create_repository(name="fast_repository"),
+        ]
+        cancelled_requests: list[str] = []
+
+        async def request(repository: Repository, artifact: Artifact, *, verbose: bool) -> Mock:  # noqa: ARG001
+            if repository.name == "slow_repository":
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled_requests.append(repository.name)
+                    raise
+            return Mock(repository=repository)
+
+        fetcher: Mock = self._create_fetcher_mock(request)
+        fetcher.network_configuration = NetworkConfiguration(deadline_seconds=1)
+
+        loop = asyncio.get_running_loop()
+        started_at: float = loop.time()
+        results = [
+            result async for result in iter_all_artifact_metadata([([library], repositories)], fetcher, verbose=False)
+        ]
+
+        assert loop.time() - started_at < 2
+        assert [
+            (artifact, [item.repository for item in metadata], is_complete)
+            for artifact, metadata, is_complete in results
+        ] == [(library, [repositories[1]], False)]
+        assert cancelled_requests == ["slow_repository"]
+
+    @pytest.mark.asyncio
+    async def test_should_stop_searching_repositories_in_declaration_order_at_first_hit_when_first_hit_enabled(self):
+        library: Library = EntityFactory.create_library()
+        repositories: list[Repository] = [
+            EntityFactory.create_repository(name="first_repository"),
+            EntityFactory.create_repository(name="second_repository"),
+            EntityFactory.create_repository(name="third_repository"),
+        ]
+        requested_repositories: list[str] = []
+
+        async def request(repository: Repository, artifact: Artifact, *, verbose: bool) -> Optional[Mock]:  # noqa: ARG001
+            requested_repositories.append(repository.name)
+            return None if repository.name == "first_repository" else Mock(repository=repository)
+
+        fetcher: Mock = self._create_fetcher_mock(request)
+        fetcher.network_configuration = NetworkConfiguration(first_hit=True)
+
+        actual_result = await get_all_artifact_metadata(
+            artifacts=[library],
+            repositories=repositories,
+            fetcher=fetcher,
+            verbose=False,
+        )
+
+        assert [item.repository for item in actual_result[library]] == [repositories[1]]
+        assert requested_repositories == ["first_repository", "second_repository"]
+
+    @staticmethod
+    async def _collect(iterator: AsyncIterator) -> list:
+        return [item async for item in iterator]
+
+    @staticmethod
+    def _create_fetcher_mock(request: Optional[Callable[..., Awaitable]] = None, max_requests: int = 64) -> Mock:
+        fetcher = Mock(
+            statistics=FetchStatistics(),
+            network_configuration=NetworkConfiguration(max_requests=max_requests),
+            metadata_cache=None,
+            suppress_cache_errors=nullcontext,
+        )
+        fetcher.get_artifact_metadata = AsyncMock(return_value=Mock())
+        if request is not None:
+            # Fake requests don't depend on other searched repositories.
+            async def request_in_repositories(
+                repository: Repository,
+                artifact: Artifact,
+                *,
+                verbose: bool,
+                searched_repositories: list[Repository],  # noqa: ARG001
+            ) -> object:
+                return await request(repository, artifact, verbose=verbose)
+
+            fetcher.get_artifact_metadata.side_effect = request_in_repositories
+        return fetcher
+
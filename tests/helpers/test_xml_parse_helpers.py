@@ -1,7 +1,7 @@
 from typing import Optional
 
 from kataloger.data.artifact_metadata import ArtifactMetadata
-from kataloger.helpers.xml_parse_helpers import try_parse_maven_group_metadata
+from kataloger.helpers.xml_parse_helpers import MavenMetadataParser, try_parse_maven_group_metadata
 
 
 class TestXmlParseHelpers:
@@ -183,6 +183,98 @@ class TestXmlParseHelpers:
 
         assert actual_metadata is None
 
+    def test_should_parse_metadata_fed_in_chunks(self):
+        versions: list[str] = [f"1.{minor}.0" for minor in range(100)]
+        response: bytes = self._create_xml_response(
+            latest_version=versions[-1],
+            release_version=versions[-1],
+            versions=versions,
+            last_updated=self.default_last_updated,
+        ).encode()
+        expected_metadata: ArtifactMetadata = ArtifactMetadata(
+            latest_version=versions[-1],
+            release_version=versions[-1],
+            versions=versions,
+            last_updated=self.default_last_updated,
+        )
+        parser: MavenMetadataParser = MavenMetadataParser()
+        for start in range(0, len(response), 7):
+            parser.feed(response[start:start + 7])
+        actual_metadata: Optional[ArtifactMetadata] = parser.close()
+
+        assert actual_metadata == expected_metadata
+
+    def test_should_parse_metadata_in_declared_encoding(self):
+        response: bytes = """\
+            <?xml version="1.0" encoding="ISO-8859-1"?>
+            <metadata>
+            <versioning>
+                <versions>
+                    <version>1.0.0-bêta</version>
+                </versions>
+            </versioning>
+            </metadata>
+        """.encode("iso-8859-1")
+        actual_metadata: Optional[ArtifactMetadata] = try_parse_maven_group_metadata(response)
+
+        assert actual_metadata.versions == ["1.0.0-bêta"]
+
+    def test_should_ignore_versioning_elements_outside_of_metadata_root(self):
+        response: str = """\
+            <project>
+            <versioning>
+                <versions>
+                    <version>1.0.0</version>
+                </versions>
+            </versioning>
+            </project>
+        """
+        actual_metadata: Optional[ArtifactMetadata] = try_parse_maven_group_metadata(response)
+
+        assert actual_metadata is None
+
+    def test_should_not_stop_collecting_when_nested_element_ends(self):
+        response: str = """\
+            <metadata>
+            <versioning>
+                <latest>1.1.0<comment>nightly</comment></latest>
+                <versions>
+                    <version>1.0.0</version>
+                    <version>1.1.0</version>
+                </versions>
+            </versioning>
+            </metadata>
+        """
+        actual_metadata: Optional[ArtifactMetadata] = try_parse_maven_group_metadata(response)
+
+        assert actual_metadata.versions == ["1.0.0", "1.1.0"]
+
+    def test_should_return_none_when_last_updated_is_not_number(self):
+        response: str = """\
+            <metadata>
+            <versioning>
+                <versions>
+                    <version>1.0.0</version>
+                </versions>
+                <lastUpdated>yesterday</lastUpdated>
+            </versioning>
+            </metadata>
+        """
+        actual_metadata: Optional[ArtifactMetadata] = try_parse_maven_group_metadata(response)
+
+        assert actual_metadata is None
+
+    def test_should_return_none_when_metadata_is_truncated(self):
+        response: str = self._create_xml_response(
+            latest_version=self.default_latest_version,
+            release_version=self.default_release_version,
+            versions=[self.default_release_version, self.default_latest_version],
+            last_updated=self.default_last_updated,
+        )
+        actual_metadata: Optional[ArtifactMetadata] = try_parse_maven_group_metadata(response[:len(response) // 2])
+
+        assert actual_metadata is None
+
     @staticmethod
     def _create_xml_response(
         latest_version: Optional[str],
@@ -1,9 +1,14 @@
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import nullcontext
+from pathlib import Path
 from typing import Optional
 from unittest.mock import AsyncMock, Mock, call, patch
 
 import pytest
 
 from kataloger.catalog_updater import CatalogUpdater
+from kataloger.data.artifact.artifact import Artifact
 from kataloger.data.artifact.library import Library
 from kataloger.data.artifact.plugin import Plugin
 from kataloger.data.artifact_update import ArtifactUpdate
@@ -49,6 +54,74 @@ class TestCatalogUpdater:
                 update_resolvers=[],
             )
 
+    @pytest.mark.asyncio
+    async def test_should_close_own_metadata_fetcher_when_updater_closed(self):
+        repository: Repository = EntityFactory.create_repository()
+        catalog_updater: CatalogUpdater = self._create_catalog_updater(
+            library_repositories=[repository],
+            update_resolvers=[Mock()],
+        )
+        with patch.object(catalog_updater.metadata_fetcher, "close", new=AsyncMock()) as close_mock:
+            async with catalog_updater:
+                pass
+
+        close_mock.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_should_close_own_metadata_fetcher_after_search_when_updater_is_not_used_as_context_manager(self):
+        library: Library = EntityFactory.create_library()
+        plugin: Plugin = EntityFactory.create_plugin()
+        repository: Repository = EntityFactory.create_repository()
+        catalog_updater: CatalogUpdater = self._create_catalog_updater(
+            library_repositories=[repository],
+            plugin_repositories=[repository],
+            update_resolvers=[self._create_resolver_mock(UpdateResolution.NO_UPDATES)],
+        )
+
+        async def iter_metadata(
+            artifact_searches: list[tuple[list[Artifact], list[Repository]]],
+            **_: object,
+        ) -> AsyncIterator[tuple[Artifact, list[Mock], bool]]:
+            await asyncio.sleep(0.01)
+            for artifacts, _ in artifact_searches:
+                for artifact in artifacts:
+                    yield artifact, [Mock()], True
+
+        with (
+            patch.object(catalog_updater.metadata_fetcher, "close", new=AsyncMock()) as close_mock,
+            patch(target="kataloger.catalog_updater.iter_all_artifact_metadata", new=iter_metadata),
+        ):
+            # Fetcher is closed once, when the last of concurrent searches finished.
+            await asyncio.gather(
+                catalog_updater.get_library_updates([library]),
+                catalog_updater.get_plugin_updates([plugin]),
+            )
+            closes_after_searches: int = close_mock.await_count
+            async with catalog_updater:
+                await catalog_updater.get_library_updates([library])
+                closes_in_context: int = close_mock.await_count
+
+        assert closes_after_searches == 1
+        assert closes_in_context == 1
+        assert close_mock.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_should_not_close_provided_metadata_fetcher_when_updater_closed(self):
+        repository: Repository = EntityFactory.create_repository()
+        metadata_fetcher: Mock = Mock()
+        metadata_fetcher.close = AsyncMock()
+        catalog_updater: CatalogUpdater = CatalogUpdater(
+            library_repositories=[repository],
+            plugin_repositories=[],
+            update_resolvers=[Mock()],
+            metadata_fetcher=metadata_fetcher,
+        )
+        async with catalog_updater:
+            pass
+
+        assert catalog_updater.metadata_fetcher is metadata_fetcher
+        metadata_fetcher.close.assert_not_awaited()
+
     def test_try_find_update_should_return_none_when_resolver_update_resolution_is_no_updates(self):
         library: Library = EntityFactory.create_library()
         repository: Repository = EntityFactory.create_repository()
@@ -121,13 +194,14 @@ class TestCatalogUpdater:
 
     @pytest.mark.asyncio
     async def test_get_library_updates_should_get_metadata_for_libraries_and_return_not_none_updates(self):
-        library: Library = EntityFactory.create_library()
+        up_to_date_library: Library = EntityFactory.create_library(name="up_to_date", coordinates="com.library:first")
+        outdated_library: Library = EntityFactory.create_library(name="outdated", coordinates="com.library:second")
         repository: Repository = EntityFactory.create_repository()
         expected_update: ArtifactUpdate = EntityFactory.create_artifact_update(
-            name=library.name,
+            name=outdated_library.name,
             update_repository_name=repository.name,
         )
-        libraries = [library, library]
+        libraries = [up_to_date_library, outdated_library]
         resolver_mock: Mock = Mock()
         resolver_mock.resolve.side_effect = [
             (UpdateResolution.NO_UPDATES, None),
@@ -137,20 +211,16 @@ class TestCatalogUpdater:
             library_repositories=[repository],
             update_resolvers=[resolver_mock],
         )
-        repositories_metadata = {Mock(): Mock(), Mock(): Mock()}
+        searches: list[list[tuple[list[Artifact], list[Repository]]]] = []
         with patch(
-            target="kataloger.catalog_updater.get_all_artifact_metadata",
-            new=AsyncMock(return_value=repositories_metadata),
-        ) as load_metadata_mock:
+            target="kataloger.catalog_updater.iter_all_artifact_metadata",
+            new=self._create_metadata_search(searches),
+        ):
             actual_updates: list[ArtifactUpdate] = await catalog_updater.get_library_updates(libraries)
 
         assert actual_updates == [expected_update]
         assert resolver_mock.resolve.call_count == 2
-        load_metadata_mock.assert_called_once_with(
-            artifacts=libraries,
-            repositories=[repository],
-            verbose=False,
-        )
+        assert searches == [[(libraries, [repository])]]
 
     @pytest.mark.asyncio
     async def test_get_plugin_updates_should_return_no_updates_when_there_is_no_plugin_repositories(self):
@@ -168,13 +238,14 @@ class TestCatalogUpdater:
 
     @pytest.mark.asyncio
     async def test_get_plugin_updates_should_get_metadata_for_plugins_and_return_not_none_updates(self):
-        plugin: Plugin = EntityFactory.create_plugin()
+        up_to_date_plugin: Plugin = EntityFactory.create_plugin(name="up_to_date", coordinates="com.plugin.first")
+        outdated_plugin: Plugin = EntityFactory.create_plugin(name="outdated", coordinates="com.plugin.second")
         repository: Repository = EntityFactory.create_repository()
         expected_update: ArtifactUpdate = EntityFactory.create_artifact_update(
-            name=plugin.name,
+            name=outdated_plugin.name,
             update_repository_name=repository.name,
         )
-        plugins = [plugin, plugin]
+        plugins = [up_to_date_plugin, outdated_plugin]
         resolver_mock: Mock = Mock()
         resolver_mock.resolve.side_effect = [
             (UpdateResolution.NO_UPDATES, None),
@@ -184,20 +255,16 @@ class TestCatalogUpdater:
             plugin_repositories=[repository],
             update_resolvers=[resolver_mock],
         )
-        repositories_metadata = {Mock(): Mock(), Mock(): Mock()}
+        searches: list[list[tuple[list[Artifact], list[Repository]]]] = []
         with patch(
-            target="kataloger.catalog_updater.get_all_artifact_metadata",
-            new=AsyncMock(return_value=repositories_metadata),
-        ) as load_metadata_mock:
+            target="kataloger.catalog_updater.iter_all_artifact_metadata",
+            new=self._create_metadata_search(searches),
+        ):
             actual_updates: list[ArtifactUpdate] = await catalog_updater.get_plugin_updates(plugins)
 
         assert actual_updates == [expected_update]
         assert resolver_mock.resolve.call_count == 2
-        load_metadata_mock.assert_called_once_with(
-            artifacts=plugins,
-            repositories=[repository],
-            verbose=False,
-        )
+        assert searches == [[(plugins, [repository])]]
 
     @pytest.mark.asyncio
     async def test_get_updates_should_return_updates_for_libraries_and_plugins(self):
@@ -223,29 +290,18 @@ class TestCatalogUpdater:
             plugin_repositories=[plugin_repository],
             update_resolvers=[resolver_mock],
         )
+        searches: list[list[tuple[list[Artifact], list[Repository]]]] = []
 
         with patch(
-            target="kataloger.catalog_updater.get_all_artifact_metadata",
-            new=AsyncMock(return_value={Mock(): Mock()}),
-        ) as load_metadata_mock:
+            target="kataloger.catalog_updater.iter_all_artifact_metadata",
+            new=self._create_metadata_search(searches),
+        ):
             library_updates, plugin_updates = await catalog_updater.get_updates(libraries=[library], plugins=[plugin])
 
         assert library_updates == [library_update]
         assert plugin_updates == [plugin_update]
         assert resolver_mock.resolve.call_count == 2
-        expected_load_metadata_calls = [
-            call(
-                artifacts=[library],
-                repositories=[library_repository],
-                verbose=False,
-            ),
-            call(
-                artifacts=[plugin],
-                repositories=[plugin_repository],
-                verbose=False,
-            ),
-        ]
-        assert load_metadata_mock.call_args_list == expected_load_metadata_calls
+        assert searches == [[([library], [library_repository]), ([plugin], [plugin_repository])]]
 
     @pytest.mark.asyncio
     async def test_get_artifact_updates_should_return_artifact_updates_from_correct_repositories(self):
@@ -271,30 +327,19 @@ class TestCatalogUpdater:
             plugin_repositories=[plugin_repository],
             update_resolvers=[resolver_mock],
         )
+        searches: list[list[tuple[list[Artifact], list[Repository]]]] = []
 
         with patch(
-            target="kataloger.catalog_updater.get_all_artifact_metadata",
-            new=AsyncMock(return_value={Mock(): Mock()}),
-        ) as load_metadata_mock:
+            target="kataloger.catalog_updater.iter_all_artifact_metadata",
+            new=self._create_metadata_search(searches),
+        ):
             artifact_updates: list[ArtifactUpdate] = await catalog_updater.get_artifact_updates(
                 artifacts=[library, plugin],
             )
 
         assert artifact_updates == [library_update, plugin_update]
         assert resolver_mock.resolve.call_count == 2
-        expected_load_metadata_calls = [
-            call(
-                artifacts=[library],
-                repositories=[library_repository],
-                verbose=False,
-            ),
-            call(
-                artifacts=[plugin],
-                repositories=[plugin_repository],
-                verbose=False,
-            ),
-        ]
-        assert load_metadata_mock.call_args_list == expected_load_metadata_calls
+        assert searches == [[([library], [library_repository]), ([plugin], [plugin_repository])]]
 
     @pytest.mark.asyncio
     async def test_should_return_empty_list_when_there_are_no_libraries_and_plugins_in_loaded_catalog(self):
@@ -334,29 +379,357 @@ class TestCatalogUpdater:
             plugin_repositories=[plugin_repository],
             update_resolvers=[resolver_mock],
         )
+        searches: list[list[tuple[list[Artifact], list[Repository]]]] = []
+        metadata_search = self._create_metadata_search(searches)
 
-        load_metadata_mock = AsyncMock(return_value={Mock(): Mock()})
         with (
             patch(target="kataloger.catalog_updater.load_catalog", new=Mock(return_value=([library], [plugin]))),
-            patch(target="kataloger.catalog_updater.get_all_artifact_metadata", new=load_metadata_mock),
+            patch(target="kataloger.catalog_updater.iter_all_artifact_metadata", new=metadata_search),
         ):
             artifact_updates: list[ArtifactUpdate] = await catalog_updater.get_catalog_updates(catalog_path=Mock())
 
         assert artifact_updates == [library_update, plugin_update]
         assert resolver_mock.resolve.call_count == 2
-        expected_load_metadata_calls = [
-            call(
-                artifacts=[library],
-                repositories=[library_repository],
-                verbose=False,
+        assert searches == [[([library], [library_repository]), ([plugin], [plugin_repository])]]
+
+    @pytest.mark.asyncio
+    async def test_get_library_updates_should_report_artifacts_which_search_was_interrupted_as_unchecked(self):
+        outdated_library: Library = EntityFactory.create_library(name="outdated", coordinates="com.library:outdated")
+        unknown_library: Library = EntityFactory.create_library(name="unknown", coordinates="com.library:unknown")
+        missing_library: Library = EntityFactory.create_library(name="missing", coordinates="com.library:missing")
+        update: ArtifactUpdate = EntityFactory.create_artifact_update(name="outdated")
+        resolver_mock: Mock = Mock()
+        resolver_mock.resolve.side_effect = lambda artifact, _: (
+            (UpdateResolution.UPDATE_FOUND, update)
+            if artifact == outdated_library
+            else (UpdateResolution.NO_UPDATES, None)
+        )
+        catalog_updater: CatalogUpdater = self._create_catalog_updater(
+            library_repositories=[EntityFactory.create_repository()],
+            update_resolvers=[resolver_mock],
+        )
+
+        async def iter_metadata(
+            artifact_searches: list[tuple[list[Artifact], list[Repository]]],  # noqa: ARG001
+            **_: object,
+        ) -> AsyncIterator[tuple[Artifact, list[Mock], bool]]:
+            yield outdated_library, [Mock()], False
+            yield unknown_library, [Mock()], False
+            yield missing_library, [], False
+
+        with patch(target="kataloger.catalog_updater.iter_all_artifact_metadata", new=iter_metadata):
+            library_updates: list[ArtifactUpdate] = await catalog_updater.get_library_updates(
+                libraries=[outdated_library, unknown_library, missing_library],
+            )
+
+        assert library_updates == [update]
+        assert catalog_updater.unchecked_artifacts == [unknown_library, missing_library]
+
+    @pytest.mark.asyncio
+    async def test_should_report_unchecked_artifacts_only_of_the_last_search(self):
+        library: Library = EntityFactory.create_library()
+        catalog_updater: CatalogUpdater = self._create_catalog_updater(
+            library_repositories=[EntityFactory.create_repository()],
+            update_resolvers=[self._create_resolver_mock(UpdateResolution.NO_UPDATES)],
+        )
+        search_results: list[bool] = [False, True]
+
+        async def iter_metadata(
+            artifact_searches: list[tuple[list[Artifact], list[Repository]]],  # noqa: ARG001
+            **_: object,
+        ) -> AsyncIterator[tuple[Artifact, list[Mock], bool]]:
+            yield library, [Mock()], search_results.pop(0)
+
+        with patch(target="kataloger.catalog_updater.iter_all_artifact_metadata", new=iter_metadata):
+            await catalog_updater.get_library_updates(libraries=[library])
+            unchecked_after_interrupted_search: list[Artifact] = list(catalog_updater.unchecked_artifacts)
+            await catalog_updater.get_library_updates(libraries=[library])
+
+        assert unchecked_after_interrupted_search == [library]
+        assert catalog_updater.unchecked_artifacts == []
+
+    @pytest.mark.asyncio
+    async def test_should_search_artifacts_of_all_catalogs_at_once_and_return_updates_for_each_catalog(self):
+        shared_library: Library = EntityFactory.create_library(name="shared", coordinates="com.shared:shared")
+        first_library: Library = EntityFactory.create_library(name="first", coordinates="com.first:first")
+        plugin: Plugin = EntityFactory.create_plugin()
+        library_repository: Repository = EntityFactory.create_repository(name="library_repository")
+        plugin_repository: Repository = EntityFactory.create_repository(name="plugin_repository")
+        catalogs: dict[str, tuple[list[Library], list[Plugin]]] = {
+            "first.versions.toml": ([shared_library, first_library], []),
+            "empty.versions.toml": ([], []),
+            "second.versions.toml": ([shared_library], [plugin]),
+        }
+        updates: dict[Artifact, ArtifactUpdate] = {
+            artifact: EntityFactory.create_artifact_update(name=artifact.name)
+            for artifact in (shared_library, first_library, plugin)
+        }
+        resolver_mock: Mock = Mock()
+        resolver_mock.resolve.side_effect = lambda artifact, _: (UpdateResolution.UPDATE_FOUND, updates[artifact])
+        catalog_updater: CatalogUpdater = self._create_catalog_updater(
+            library_repositories=[library_repository],
+            plugin_repositories=[plugin_repository],
+            update_resolvers=[resolver_mock],
+        )
+        searches: list[list[tuple[list[Artifact], list[Repository]]]] = []
+
+        async def iter_metadata(
+            artifact_searches: list[tuple[list[Artifact], list[Repository]]],
+            **_: object,
+        ) -> AsyncIterator[tuple[Artifact, list[Mock], bool]]:
+            searches.append(artifact_searches)
+            # Artifacts are handed out in order different from declaration order, as they would be found.
+            for artifacts, _ in reversed(artifact_searches):
+                for artifact in dict.fromkeys(artifacts):
+                    yield artifact, [Mock()], True
+
+        with (
+            patch(target="kataloger.catalog_updater.load_catalog", new=lambda path, **_: catalogs[path.name]),
+            patch(target="kataloger.catalog_updater.iter_all_artifact_metadata", new=iter_metadata),
+        ):
+            catalogs_updates: list[list[ArtifactUpdate]] = await catalog_updater.get_catalogs_updates(
+                catalog_paths=[Path(name) for name in catalogs],
+            )
+
+        assert catalogs_updates == [
+            [updates[shared_library], updates[first_library]],
+            [],
+            [updates[shared_library], updates[plugin]],
+        ]
+        assert searches == [
+            [
+                ([shared_library, first_library, shared_library], [library_repository]),
+                ([plugin], [plugin_repository]),
+            ],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_should_yield_updates_of_all_catalogs_in_order_they_are_found(self):
+        shared_library: Library = EntityFactory.create_library(name="shared", coordinates="com.shared:shared")
+        first_library: Library = EntityFactory.create_library(name="first", coordinates="com.first:first")
+        plugin: Plugin = EntityFactory.create_plugin()
+        catalogs: dict[str, tuple[list[Library], list[Plugin]]] = {
+            "first.versions.toml": ([shared_library, first_library], []),
+            "second.versions.toml": ([shared_library], [plugin]),
+        }
+        updates: dict[Artifact, ArtifactUpdate] = {
+            artifact: EntityFactory.create_artifact_update(name=artifact.name)
+            for artifact in (shared_library, first_library, plugin)
+        }
+        resolver_mock: Mock = Mock()
+        resolver_mock.resolve.side_effect = lambda artifact, _: (UpdateResolution.UPDATE_FOUND, updates[artifact])
+        catalog_updater: CatalogUpdater = self._create_catalog_updater(
+            library_repositories=[EntityFactory.create_repository()],
+            plugin_repositories=[EntityFactory.create_repository()],
+            update_resolvers=[resolver_mock],
+        )
+
+        async def iter_metadata(
+            artifact_searches: list[tuple[list[Artifact], list[Repository]]],  # noqa: ARG001
+            **_: object,
+        ) -> AsyncIterator[tuple[Artifact, list[Mock], bool]]:
+            for artifact in (plugin, shared_library, first_library):
+                yield artifact, [Mock()], True
+
+        with (
+            patch(target="kataloger.catalog_updater.load_catalog", new=lambda path, **_: catalogs[path.name]),
+            patch(target="kataloger.catalog_updater.iter_all_artifact_metadata", new=iter_metadata),
+        ):
+            actual_updates: list[tuple[Path, ArtifactUpdate]] = [
+                catalog_update
+                async for catalog_update in catalog_updater.iter_catalogs_updates(
+                    catalog_paths=[Path(name) for name in catalogs],
+                )
+            ]
+
+        assert actual_updates == [
+            (Path("second.versions.toml"), updates[plugin]),
+            (Path("first.versions.toml"), updates[shared_library]),
+            (Path("second.versions.toml"), updates[shared_library]),
+            (Path("first.versions.toml"), updates[first_library]),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_should_stop_search_when_catalog_updates_iteration_stopped(self):
+        first_library: Library = EntityFactory.create_library(name="first", coordinates="com.first:first")
+        second_library: Library = EntityFactory.create_library(name="second", coordinates="com.second:second")
+        update: ArtifactUpdate = EntityFactory.create_artifact_update(name="first")
+        catalog_updater: CatalogUpdater = self._create_catalog_updater(
+            library_repositories=[EntityFactory.create_repository()],
+            update_resolvers=[self._create_resolver_mock(UpdateResolution.UPDATE_FOUND, update)],
+        )
+        handed_out_artifacts: list[Artifact] = []
+        search_closed = asyncio.Event()
+
+        async def iter_metadata(
+            artifact_searches: list[tuple[list[Artifact], list[Repository]]],  # noqa: ARG001
+            **_: object,
+        ) -> AsyncIterator[tuple[Artifact, list[Mock], bool]]:
+            try:
+                for artifact in (first_library, second_library):
+                    handed_out_artifacts.append(artifact)
+                    yield artifact, [Mock()], True
+            finally:
+                search_closed.set()
+
+        with (
+            patch(
+                target="kataloger.catalog_updater.load_catalog",
+                new=Mock(return_value=([first_library, second_library], [])),
             ),
-            call(
-                artifacts=[plugin],
-                repositories=[plugin_repository],
-                verbose=False,
+            patch(target="kataloger.catalog_updater.iter_all_artifact_metadata", new=iter_metadata),
+        ):
+            updates = catalog_updater.iter_catalog_updates(catalog_path=Path("libs.versions.toml"))
+            actual_update: ArtifactUpdate = await updates.__anext__()
+            await updates.aclose()
+
+        assert actual_update == update
+        assert handed_out_artifacts == [first_library]
+        assert search_closed.is_set()
+
+    @pytest.mark.asyncio
+    async def test_should_remember_whether_artifacts_had_updates_in_metadata_cache(self):
+        outdated_library: Library = EntityFactory.create_library(name="outdated", coordinates="com.library:outdated")
+        actual_library: Library = EntityFactory.create_library(name="actual", coordinates="com.library:actual")
+        update: ArtifactUpdate = EntityFactory.create_artifact_update(name="outdated")
+        resolver_mock: Mock = Mock()
+        resolver_mock.resolve.side_effect = lambda artifact, _: (
+            (UpdateResolution.UPDATE_FOUND, update)
+            if artifact == outdated_library
+            else (UpdateResolution.NO_UPDATES, None)
+        )
+        metadata_fetcher: Mock = Mock(suppress_cache_errors=nullcontext)
+        catalog_updater: CatalogUpdater = CatalogUpdater(
+            library_repositories=[EntityFactory.create_repository()],
+            plugin_repositories=[],
+            update_resolvers=[resolver_mock],
+            metadata_fetcher=metadata_fetcher,
+        )
+
+        async def iter_metadata(
+            artifact_searches: list[tuple[list[Artifact], list[Repository]]],  # noqa: ARG001
+            **_: object,
+        ) -> AsyncIterator[tuple[Artifact, list[Mock], bool]]:
+            for artifact in (outdated_library, actual_library):
+                yield artifact, [Mock()], True
+
+        with (
+            patch(
+                target="kataloger.catalog_updater.load_catalog",
+                new=Mock(return_value=([outdated_library, actual_library], [])),
             ),
+            patch(target="kataloger.catalog_updater.iter_all_artifact_metadata", new=iter_metadata),
+        ):
+            await catalog_updater.get_catalogs_updates(catalog_paths=[Path("libs.versions.toml")])
+
+        assert metadata_fetcher.metadata_cache.put_resolution.call_args_list == [
+            call(outdated_library, has_update=True),
+            call(actual_library, has_update=False),
         ]
-        assert load_metadata_mock.call_args_list == expected_load_metadata_calls
+
+    @pytest.mark.asyncio
+    async def test_should_resolve_incomplete_search_with_arrived_metadata_and_mark_unresolved_artifacts_unchecked(self):
+        outdated_library: Library = EntityFactory.create_library(name="outdated", coordinates="com.library:outdated")
+        unknown_library: Library = EntityFactory.create_library(name="unknown", coordinates="com.library:unknown")
+        update: ArtifactUpdate = EntityFactory.create_artifact_update(name="outdated")
+        resolver_mock: Mock = Mock()
+        resolver_mock.resolve.side_effect = lambda artifact, _: (
+            (UpdateResolution.UPDATE_FOUND, update)
+            if artifact == outdated_library
+            else (UpdateResolution.NO_UPDATES, None)
+        )
+        catalog_updater: CatalogUpdater = self._create_catalog_updater(
+            library_repositories=[EntityFactory.create_repository()],
+            update_resolvers=[resolver_mock],
+        )
+
+        async def iter_metadata(
+            artifact_searches: list[tuple[list[Artifact], list[Repository]]],  # noqa: ARG001
+            **_: object,
+        ) -> AsyncIterator[tuple[Artifact, list[Mock], bool]]:
+            yield outdated_library, [Mock()], False
+            yield unknown_library, [Mock()], False
+
+        with (
+            patch(
+                target="kataloger.catalog_updater.load_catalog",
+                new=Mock(return_value=([outdated_library, unknown_library], [])),
+            ),
+            patch(target="kataloger.catalog_updater.iter_all_artifact_metadata", new=iter_metadata),
+        ):
+            catalogs_updates: list[list[ArtifactUpdate]] = await catalog_updater.get_catalogs_updates(
+                catalog_paths=[Path("libs.versions.toml")],
+            )
+
+        assert catalogs_updates == [[update]]
+        assert catalog_updater.unchecked_artifacts == [unknown_library]
+
+    @pytest.mark.asyncio
+    async def test_should_split_unchecked_artifacts_by_catalogs_they_are_declared_in(self):
+        shared_library: Library = EntityFactory.create_library(name="shared", coordinates="com.library:shared")
+        checked_library: Library = EntityFactory.create_library(name="checked", coordinates="com.library:checked")
+        catalog_updater: CatalogUpdater = self._create_catalog_updater(
+            library_repositories=[EntityFactory.create_repository()],
+            update_resolvers=[self._create_resolver_mock(UpdateResolution.NO_UPDATES)],
+        )
+        catalogs: dict[str, tuple[list[Library], list[Plugin]]] = {
+            "first.versions.toml": ([shared_library], []),
+            "second.versions.toml": ([checked_library], []),
+            "third.versions.toml": ([checked_library, shared_library], []),
+        }
+
+        async def iter_metadata(
+            artifact_searches: list[tuple[list[Artifact], list[Repository]]],  # noqa: ARG001
+            **_: object,
+        ) -> AsyncIterator[tuple[Artifact, list[Mock], bool]]:
+            yield checked_library, [Mock()], True
+            yield shared_library, [], False
+
+        with (
+            patch(target="kataloger.catalog_updater.load_catalog", new=lambda path, **_: catalogs[path.name]),
+            patch(target="kataloger.catalog_updater.iter_all_artifact_metadata", new=iter_metadata),
+        ):
+            await catalog_updater.get_catalogs_updates(catalog_paths=[Path(name) for name in catalogs])
+
+        assert catalog_updater.unchecked_catalog_artifacts == {
+            Path("first.versions.toml"): [shared_library],
+            Path("third.versions.toml"): [shared_library],
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_updates_should_search_plugins_along_with_libraries(self):
+        library: Library = EntityFactory.create_library()
+        plugin: Plugin = EntityFactory.create_plugin()
+        repository: Repository = EntityFactory.create_repository()
+        catalog_updater: CatalogUpdater = self._create_catalog_updater(
+            library_repositories=[repository],
+            plugin_repositories=[repository],
+            update_resolvers=[self._create_resolver_mock(UpdateResolution.NO_UPDATES)],
+        )
+        searches: list[list[tuple[list[Artifact], list[Repository]]]] = []
+
+        with patch(
+            target="kataloger.catalog_updater.iter_all_artifact_metadata",
+            new=self._create_metadata_search(searches),
+        ):
+            await catalog_updater.get_updates(libraries=[library], plugins=[plugin])
+
+        assert searches == [[([library], [repository]), ([plugin], [repository])]]
+
+    @staticmethod
+    def _create_metadata_search(
+        searches: list[list[tuple[list[Artifact], list[Repository]]]],
+    ) -> Callable[..., AsyncIterator[tuple[Artifact, list[Mock], bool]]]:
+        async def iter_metadata(
+            artifact_searches: list[tuple[list[Artifact], list[Repository]]],
+            **_: object,
+        ) -> AsyncIterator[tuple[Artifact, list[Mock], bool]]:
+            searches.append(artifact_searches)
+            for artifacts, _ in artifact_searches:
+                for artifact in dict.fromkeys(artifacts):
+                    yield artifact, [Mock()], True
+
+        return iter_metadata
 
     @staticmethod
     def _create_resolver_mock(resolution: UpdateResolution, update: Optional[ArtifactUpdate] = None) -> Mock:
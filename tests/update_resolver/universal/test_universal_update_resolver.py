@@ -0,0 +1,108 @@
+from typing import Optional
+
+from kataloger.data.artifact.library import Library
+from kataloger.data.artifact_metadata import ArtifactMetadata
+from kataloger.data.artifact_update import ArtifactUpdate
+from kataloger.data.metadata_repository_info import MetadataRepositoryInfo
+from kataloger.update_resolver.base.update_resolution import UpdateResolution
+from kataloger.update_resolver.universal.universal_update_resolver import UniversalUpdateResolver
+from kataloger.update_resolver.universal.universal_version_factory import UniversalVersionFactory
+from tests.entity_factory import EntityFactory
+
+
+class TestUniversalUpdateResolver:
+    def test_should_find_newest_version_when_repository_lists_versions_out_of_order(self):
+        library: Library = EntityFactory.create_library(version="1.0.0")
+
+        resolution, update = self._resolve(library, versions=["1.0.0", "1.2.0", "1.1.0"])
+
+        assert resolution == UpdateResolution.UPDATE_FOUND
+        assert update.available_version == "1.2.0"
+
+    def test_should_skip_unsupported_versions_when_searching_update(self):
+        library: Library = EntityFactory.create_library(version="1.0.0")
+
+        resolution, update = self._resolve(library, versions=["1.0.0", "1.1.0", "RELEASE131"])
+
+        assert resolution == UpdateResolution.UPDATE_FOUND
+        assert update.available_version == "1.1.0"
+
+    def test_should_not_suggest_pre_release_update_for_stable_version(self):
+        library: Library = EntityFactory.create_library(version="1.0.0")
+
+        resolution, update = self._resolve(library, versions=["1.0.0", "1.1.0-alpha01"])
+
+        assert resolution == UpdateResolution.NO_UPDATES
+        assert update is None
+
+    def test_should_suggest_pre_release_update_for_pre_release_version(self):
+        library: Library = EntityFactory.create_library(version="1.1.0-alpha01")
+
+        resolution, update = self._resolve(library, versions=["1.0.0", "1.1.0-alpha01", "1.1.0-alpha02"])
+
+        assert resolution == UpdateResolution.UPDATE_FOUND
+        assert update.available_version == "1.1.0-alpha02"
+
+    def test_should_not_resolve_update_when_current_version_is_unknown_and_newer_than_available_versions(self):
+        library: Library = EntityFactory.create_library(version="2.0.0")
+
+        resolution, update = self._resolve(library, versions=["1.0.0", "1.1.0"])
+
+        assert resolution == UpdateResolution.CANT_RESOLVE
+        assert update is None
+
+    def test_should_find_update_published_only_in_one_of_several_repositories(self):
+        library: Library = EntityFactory.create_library(version="1.0.0")
+        repositories_metadata: list[MetadataRepositoryInfo] = [
+            self._create_repository_metadata("current_repository", versions=["1.0.0"], last_updated=2),
+            self._create_repository_metadata("recent_repository", versions=["0.9.0"], last_updated=3),
+            self._create_repository_metadata("third_repository", versions=["1.0.0", "1.1.0"], last_updated=1),
+        ]
+
+        resolution, update = self._create_resolver().resolve(library, repositories_metadata)
+
+        assert resolution == UpdateResolution.UPDATE_FOUND
+        assert update.available_version == "1.1.0"
+        assert update.update_repository_name == "third_repository"
+
+    def test_should_attribute_update_to_first_declared_repository_hosting_it(self):
+        library: Library = EntityFactory.create_library(version="1.0.0")
+        repositories_metadata: list[MetadataRepositoryInfo] = [
+            self._create_repository_metadata("first_repository", versions=["1.0.0"]),
+            self._create_repository_metadata("second_repository", versions=["1.0.0", "1.1.0"]),
+            self._create_repository_metadata("third_repository", versions=["1.1.0"]),
+        ]
+
+        _, update = self._create_resolver().resolve(library, repositories_metadata)
+
+        assert update.update_repository_name == "second_repository"
+
+    def test_should_report_newest_minor_and_patch_updates_along_with_latest_update(self):
+        library: Library = EntityFactory.create_library(version="1.2.3")
+
+        _, update = self._resolve(library, versions=["1.2.3", "1.2.4", "1.3.0", "2.0.0"])
+
+        assert (update.available_version, update.minor_version, update.patch_version) == ("2.0.0", "1.3.0", "1.2.4")
+
+    @staticmethod
+    def _create_resolver() -> UniversalUpdateResolver:
+        return UniversalUpdateResolver(version_factories=[UniversalVersionFactory()], suggest_unstable_updates=False)
+
+    @staticmethod
+    def _create_repository_metadata(
+        name: str,
+        versions: list[str],
+        last_updated: int = 0,
+    ) -> MetadataRepositoryInfo:
+        metadata: ArtifactMetadata = ArtifactMetadata(
+            latest_version=versions[-1],
+            release_version=versions[-1],
+            versions=versions,
+            last_updated=last_updated,
+        )
+        return MetadataRepositoryInfo(EntityFactory.create_repository(name=name), metadata)
+
+    @staticmethod
+    def _resolve(library: Library, versions: list[str]) -> tuple[UpdateResolution, Optional[ArtifactUpdate]]:
+        repository_metadata = TestUniversalUpdateResolver._create_repository_metadata("repository", versions=versions)
+        return TestUniversalUpdateResolver._create_resolver().resolve(library, [repository_metadata])
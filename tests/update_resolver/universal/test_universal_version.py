@@ -147,6 +147,21 @@ class TestUniversalVersion:
         ]
         self._version_comparison_test(versions)
 
+    def test_should_not_compare_by_pre_release_numbers_when_pre_release_names_are_different_but_have_same_index(self):
+        versions: list[tuple[str, str, bool]] = [
+            ("1.0.0-alpha01", "1.0.0-Alpha02", False),
+            ("1.0.0-Alpha02", "1.0.0-alpha01", False),
+            ("1.0.0-M1", "1.0.0-SNAPSHOT2", False),
+        ]
+        self._version_comparison_test(versions)
+
+    def test_versions_should_be_sorted_in_ascending_order(self):
+        versions: list[str] = ["1.1", "1.0.0-rc01", "1.0", "0.9.10", "1.0.0-alpha02", "0.9.9", "1.0.0-alpha01"]
+
+        actual_order: list[str] = [version.raw for version in sorted(map(UniversalVersion, versions))]
+
+        assert actual_order == ["0.9.9", "0.9.10", "1.0.0-alpha01", "1.0.0-alpha02", "1.0.0-rc01", "1.0", "1.1"]
+
     @staticmethod
     def _version_comparison_test(data: list[tuple[str, str, bool]]):
         for first_version, second_version, expected_result in data:
@@ -1,3 +1,7 @@
+from typing import Optional
+
+import pytest
+
 from kataloger.update_resolver.universal.universal_version import UniversalVersion
 from kataloger.update_resolver.universal.universal_version_factory import UniversalVersionFactory
 
@@ -21,6 +25,34 @@ class TestUniversalVersionFactory:
 
         assert can_create_version
 
+    def test_create_should_raise_exception_when_version_string_does_not_match_universal_version_regexp(self):
+        with pytest.raises(ValueError, match="Unsupported version notation"):
+            self._create_factory().create("RELEASE131")
+
+    def test_try_create_should_return_none_when_version_string_does_not_match_universal_version_regexp(self):
+        version: Optional[UniversalVersion] = self._create_factory().try_create("RELEASE131")
+
+        assert version is None
+
+    def test_try_create_should_return_the_same_version_instance_for_repeated_version_string(self):
+        factory: UniversalVersionFactory = self._create_factory()
+
+        first_version: Optional[UniversalVersion] = factory.try_create("1.0.0")
+        second_version: Optional[UniversalVersion] = factory.try_create("1.0.0")
+
+        assert first_version.raw == "1.0.0"
+        assert first_version is second_version
+
+    def test_try_create_should_parse_version_again_when_it_was_evicted_from_cache(self):
+        factory: UniversalVersionFactory = UniversalVersionFactory(cache_size=1)
+
+        first_version: Optional[UniversalVersion] = factory.try_create("1.0.0")
+        factory.try_create("2.0.0")
+        second_version: Optional[UniversalVersion] = factory.try_create("1.0.0")
+
+        assert first_version == second_version
+        assert first_version is not second_version
+
     @staticmethod
     def _create_factory() -> UniversalVersionFactory:
         return UniversalVersionFactory()
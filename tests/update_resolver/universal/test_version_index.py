@@ -0,0 +1,93 @@
+from typing import Optional
+
+from kataloger.update_resolver.universal.universal_version import UniversalVersion
+from kataloger.update_resolver.universal.universal_version_factory import UniversalVersionFactory
+from kataloger.update_resolver.universal.version_index import VersionIndex
+from kataloger.update_resolver.universal.version_updates import VersionUpdates
+
+
+class TestVersionIndex:
+    def test_should_sort_versions_remove_duplicates_and_skip_unsupported_versions(self):
+        version_index: VersionIndex = self._create_index(["1.1", "RELEASE131", "1.0", "1.1", "1.0-beta01"])
+
+        assert [version.raw for version in version_index.versions] == ["1.0-beta01", "1.0", "1.1"]
+        assert [version.raw for version in version_index.stable_versions] == ["1.0", "1.1"]
+
+    def test_should_contain_only_indexed_version_strings(self):
+        version_index: VersionIndex = self._create_index(["1.0", "RELEASE131"])
+
+        assert "1.0" in version_index
+        assert "1.0.0" not in version_index
+        assert "RELEASE131" not in version_index
+
+    def test_updates_above_should_return_newest_stable_version_when_it_is_newer_than_provided_version(self):
+        version_index: VersionIndex = self._create_index(["1.2", "1.0", "1.3-alpha01", "1.1"])
+
+        updates: Optional[VersionUpdates] = version_index.updates_above(
+            UniversalVersion("1.0"),
+            include_pre_releases=False,
+        )
+
+        assert updates.latest.raw == "1.2"
+
+    def test_updates_above_should_return_newest_pre_release_version_when_pre_releases_included(self):
+        version_index: VersionIndex = self._create_index(["1.2", "1.0", "1.3-alpha01", "1.1"])
+
+        updates: Optional[VersionUpdates] = version_index.updates_above(
+            UniversalVersion("1.0"),
+            include_pre_releases=True,
+        )
+
+        assert updates.latest.raw == "1.3-alpha01"
+
+    def test_updates_above_should_return_none_when_there_is_no_newer_version(self):
+        version_index: VersionIndex = self._create_index(["1.0", "1.1", "1.2-alpha01"])
+
+        assert version_index.updates_above(UniversalVersion("1.1"), include_pre_releases=False) is None
+        assert version_index.updates_above(UniversalVersion("2.0"), include_pre_releases=True) is None
+        assert self._create_index([]).updates_above(UniversalVersion("1.0"), include_pre_releases=True) is None
+
+    def test_updates_above_should_return_newest_major_minor_and_patch_updates(self):
+        version_index: VersionIndex = self._create_index(
+            ["1.2.3", "1.2.4", "1.2.5", "1.3.0", "1.4.1", "2.0.0", "2.1.0", "1.2.6-alpha01"],
+        )
+
+        updates: Optional[VersionUpdates] = version_index.updates_above(
+            UniversalVersion("1.2.3"),
+            include_pre_releases=False,
+        )
+
+        assert (updates.latest.raw, updates.minor.raw, updates.patch.raw) == ("2.1.0", "1.4.1", "1.2.5")
+
+    def test_updates_above_should_not_return_minor_and_patch_updates_when_there_are_no_such_updates(self):
+        version_index: VersionIndex = self._create_index(["1.2", "1.3", "2.0"])
+
+        updates: Optional[VersionUpdates] = version_index.updates_above(
+            UniversalVersion("1.3"),
+            include_pre_releases=False,
+        )
+
+        assert (updates.latest.raw, updates.minor, updates.patch) == ("2.0", None, None)
+
+    def test_updates_above_should_consider_missing_numeric_components_as_zero(self):
+        version_index: VersionIndex = self._create_index(["2", "2.0.1", "2.1"])
+
+        updates: Optional[VersionUpdates] = version_index.updates_above(
+            UniversalVersion("2"),
+            include_pre_releases=False,
+        )
+
+        assert (updates.latest.raw, updates.minor.raw, updates.patch.raw) == ("2.1", "2.1", "2.0.1")
+
+    def test_should_remember_first_source_of_each_version(self):
+        version_index: VersionIndex = VersionIndex.create(
+            [("1.0", "first"), ("1.1", "second"), ("1.0", "second")],
+            UniversalVersionFactory(),
+        )
+
+        assert version_index.source_of("1.0") == "first"
+        assert version_index.source_of("1.1") == "second"
+
+    @staticmethod
+    def _create_index(versions: list[str]) -> VersionIndex:
+        return VersionIndex.create([(version, "repository") for version in versions], UniversalVersionFactory())